@@ -1,152 +1,107 @@
-# # Confiabilidade estrutural
-# def smooth_max(a, b, k=50.0):
-#     m = np.maximum(a, b)
-#     return m + np.log(np.exp(k*(a-m)) + np.exp(k*(b-m))) / k
-
-
-# def obj_confia(samples, params):
-
-#     g = np.zeros((samples.shape[0]))
-#     for i in range(samples.shape[0]):
-#         # Extrair amostras 
-#         p_gk = samples[i, 0]
-#         p_rodak = samples[i, 1]
-#         p_qk  = samples[i, 2]
-#         f_mk = samples[i, 3]
-#         f_vk = samples[i, 4]
-#         e_modflex = samples[i, 5]
-#         f_mktab = samples[i, 6]
-#         densidade_long = samples[i, 7]
-#         densidade_tab = samples[i, 8]
-#         # print(p_gk, p_rodak, p_qk, f_mk, f_vk, e_modflex, f_mktab, densidade_long, densidade_tab)
-        
-#         # Parâmetros fixos
-#         a = params[0]
-#         l = params[1]
-#         classe_carregamento = params[2]
-#         classe_madeira = params[3]
-#         classe_umidade = params[4]
-#         d_cm = params[5]
-#         esp = params[6]
-#         bw_cm = params[7]
-#         h_cm = params[8]
-#         tipo_g = params[9]  # 'flexao', 'cisalhamento' ou 'flecha'
-
-#         # Função Estado Limite
-#         projeto = ProjetoEstrutural(
-#                                         l=l,
-#                                         p_gk=p_gk,
-#                                         p_rodak=p_rodak,
-#                                         p_qk=p_qk,
-#                                         a=a,
-#                                         classe_carregamento=classe_carregamento,
-#                                         classe_madeira=classe_madeira,
-#                                         classe_umidade=classe_umidade,
-#                                         gamma_g=1.0,
-#                                         gamma_q=1.0,
-#                                         gamma_w=1.0,
-#                                         psi2=1.0,
-#                                         phi=1.0,
-#                                         densidade_long=densidade_long,
-#                                         densidade_tab=densidade_tab,
-#                                         f_mk_long=f_mk,
-#                                         f_vk_long=f_vk,
-#                                         e_modflex_long=e_modflex,
-#                                         f_mk_tab=f_mktab,
-#                                     )
-#         res = projeto.calcular(d_cm=d_cm, esp_cm=esp, bw_cm=bw_cm, h_cm=h_cm)
-#         if tipo_g == 'flexao':
-#             g[i] = -res["flexao_longarina"]["g [kPa]"]
-#         elif tipo_g == 'cisalhamento':
-#             g[i] = -res["cisalhamento_longarina"]["g [kPa]"]
-#         elif tipo_g == 'flecha':
-#             delta_sd_1 = res["flecha_total_longarina"]["delta_fluencia [m]"]
-#             delta_rd_1 = res["flecha_total_longarina"]["delta_lim_total [m]"]
-#             delta_sd_2 = res["flecha_total_longarina"]["delta_qk [m]"]
-#             delta_rd_2 = res["flecha_total_longarina"]["delta_lim_variavel [m]"]
-#             g_fluencia = delta_rd_1 - delta_sd_1
-#             g_variavel = delta_rd_2 - delta_sd_2
-#             g[i] = smooth_max(g_fluencia, g_variavel)
-
-#     return g
+import numpy as np
+from scipy import stats as st
+from scipy import special
 
-def gev_loc_scale_from_mean_std(mean: float, std: float) -> tuple[float, float]:
-    EULER_GAMMA = 0.5772156649015329
-    scale = std * np.sqrt(6) / np.pi
-    loc = mean - EULER_GAMMA * scale
-    return loc, scale
+from UQpy.sampling import MonteCarloSampling, LatinHypercubeSampling
+from UQpy.sampling.ImportanceSampling import ImportanceSampling
+from UQpy.distributions import TruncatedNormal, GeneralizedExtreme, JointIndependent
+from UQpy.reliability import FORM
+from UQpy.run_model.RunModel import RunModel
+from UQpy.run_model.model_execution.PythonModel import PythonModel
 
+from madeiras import obj_confia, estados_limite_confia, gradientes_estados_limite_confia, beta_from_pf, ESTADOS_LIMITE_CONFIA
 
-def chamando_form(p_gk, p_rodak, p_qk, a, l, classe_carregamento, classe_madeira, classe_umidade, f_mk, f_vk, e_modflex, f_mktab, densidade_long, densidade_tab, d_cm, esp_cm, bw_cm, h_cm, tipo_g):
-    p_gk = float(p_gk)
-    p_rodak = float(p_rodak)
-    p_qk = float(p_qk)
-    a = float(a)
-    l = float(l)
-    f_mk = float(f_mk)
-    f_vk = float(f_vk)
-    e_modflex = float(e_modflex)
-    f_mktab = float(f_mktab)
-    densidade_long = float(densidade_long)
-    densidade_tab = float(densidade_tab)
-    d_cm = float(d_cm)
-    esp_cm = float(esp_cm)
-    bw_cm = float(bw_cm)
-    h_cm = float(h_cm)
-    # Parámetros GEV
-    loc_rodak, scale_rodak = gev_loc_scale_from_mean_std(p_rodak, p_rodak*0.2)
-    loc_qk, scale_qk = gev_loc_scale_from_mean_std(p_qk, p_qk*0.2)
-    
-    # Distribuições
-    p_gk_aux = TruncatedNormal(a=(-p_gk/(p_gk*0.1)), b=np.inf, loc=p_gk, scale=p_gk*0.1)
-    p_rodak_aux = GeneralizedExtreme(c=0.0, loc=loc_rodak, scale=scale_rodak)
-    p_qk_aux = GeneralizedExtreme(c=0.0, loc=loc_qk, scale=scale_qk)
-    f_mk_aux = TruncatedNormal(a=(-f_mk/(f_mk*0.1)), b=np.inf, loc=f_mk, scale=f_mk*0.1)
-    f_vk_aux = TruncatedNormal(a=(-f_vk/(f_vk*0.1)), b=np.inf, loc=f_vk, scale=f_vk*0.1)     
-    e_modflex_aux = TruncatedNormal(a=(-e_modflex/(e_modflex*0.1)), b=np.inf, loc=e_modflex, scale=e_modflex*0.1)
-    f_mktab_aux = TruncatedNormal(a=(-f_mktab/(f_mktab*0.1)), b=np.inf, loc=f_mktab, scale=f_mktab*0.1)
-    densidade_long_aux = TruncatedNormal(a=(-densidade_long/(densidade_long*0.1)), b=np.inf, loc=densidade_long, scale=densidade_long*0.1)
-    densidade_tab_aux = TruncatedNormal(a=(-densidade_tab/(densidade_tab*0.1)), b=np.inf, loc=densidade_tab, scale=densidade_tab*0.1)
 
-    # Variáveis fixas da viga
-    paramss = [a, l, classe_carregamento, classe_madeira, classe_umidade, d_cm, esp_cm, bw_cm, h_cm, tipo_g]
+class ModeloDireto(RunModel):
+    """Substitui RunModel(PythonModel(model_script='madeiras.py', ...)) por uma função chamada no próprio processo: o lote inteiro de amostras vai em uma chamada (ou em blocos de tamanho_lote) e os resultados são gravados em um array pré-alocado, sem reimportar o script nem despachar amostra por amostra.
 
-    # Confiabilidade
-    varss = [p_gk_aux, p_rodak_aux, p_qk_aux, f_mk_aux, f_vk_aux, e_modflex_aux, f_mktab_aux, densidade_long_aux, densidade_tab_aux]
-    model = PythonModel(model_script='madeiras.py', model_object_name='obj_confia', params=paramss)
-    runmodel_nlc = RunModel(model=model)
-    form = FORM(distributions=varss, runmodel_object=runmodel_nlc, tolerance_u=1e-3, tolerance_beta=1e-3)
-    form.run()
-    beta = form.beta[0]
-    pf = form.failure_probability[0]
+    :param modelo: Função modelo(samples (N, n_vars), params) -> g (N,), por exemplo obj_confia
+    :param params: Parâmetros fixos repassados ao modelo
+    :param tamanho_lote: Número máximo de amostras por chamada. Se None, todas as amostras vão em uma única chamada
+    """
 
-    return beta, pf
+    def __init__(self, modelo, params: list, tamanho_lote: int = None):
+        self.modelo = modelo
+        self.params = params
+        self.tamanho_lote = None if tamanho_lote is None else int(tamanho_lote)
+        self.samples = np.empty((0, 0))
+        self.qoi = np.empty(0)
+        self.qoi_list = []
+        self.n_chamadas = 0
+        self.n_avaliacoes = 0
 
+    def avaliar(self, samples: np.ndarray) -> np.ndarray:
+        """Avalia o modelo em um lote de amostras.
 
-import numpy as np
+        :param samples: Amostras (N, n_vars)
 
-from UQpy.sampling import MonteCarloSampling, LatinHypercubeSampling
-from UQpy.sampling.ImportanceSampling import ImportanceSampling
-from UQpy.distributions import TruncatedNormal, GeneralizedExtreme, JointIndependent
-from UQpy.run_model.RunModel import RunModel
-from UQpy.run_model.model_execution.PythonModel import PythonModel
+        :return: Resultados do modelo (N,)
+        """
 
+        samples = np.atleast_2d(np.asarray(samples, dtype=float))
+        n = samples.shape[0]
+        passo = max(n if self.tamanho_lote is None else self.tamanho_lote, 1)
+        g = np.empty(n)
+        for ini in range(0, n, passo):
+            g[ini:ini + passo] = self.modelo(samples[ini:ini + passo], self.params)
+            self.n_chamadas += 1
+        self.n_avaliacoes += n
+
+        return g
+
+    def run(self, samples=None, append_samples=True):
+        # Mesma interface de RunModel.run (usada pelo FORM do UQpy); qoi_list é mantida como lista por compatibilidade
+        samples = np.atleast_2d(np.asarray(samples, dtype=float))
+        g = self.avaliar(samples)
+        if append_samples and self.qoi.size > 0:
+            self.samples = np.vstack((self.samples, samples))
+            self.qoi = np.concatenate((self.qoi, g))
+            self.qoi_list.extend(g.tolist())
+        else:
+            self.samples = samples
+            self.qoi = g
+            self.qoi_list = g.tolist()
+
+
+def criar_modelo_confia(paramss: list, modelo=obj_confia, tamanho_lote: int = None) -> RunModel:
+    """Monta o objeto de execução do modelo de confiabilidade.
+
+    :param paramss: Parâmetros fixos do modelo (ver obj_confia)
+    :param modelo: Função chamada no próprio processo (ModeloDireto) ou nome de uma função de madeiras.py, executada pelo caminho antigo RunModel(PythonModel(...))
+    :param tamanho_lote: Número máximo de amostras por chamada do modelo direto
+
+    :return: ModeloDireto ou RunModel
+    """
+
+    if isinstance(modelo, str):
+        return RunModel(model=PythonModel(model_script='madeiras.py', model_object_name=modelo, params=paramss))
+    return ModeloDireto(modelo, paramss, tamanho_lote=tamanho_lote)
+
+
+# Distribuições das variáveis aleatórias (distribuicoes_confia e transformacao_confia): Gumbel (GEV c = 0) para
+# p_rodak e p_qk, na ordem das amostras, e normais truncadas em zero para as demais
+INDICES_GUMBEL = [1, 2]
+CV_GUMBEL = 0.20
+CV_NORMAL_TRUNCADA = 0.10
+
+
+def gev_loc_scale_from_mean_std(mean: float, std: float) -> tuple[float, float]:
+    EULER_GAMMA = 0.5772156649015329
+    scale = std * np.sqrt(6) / np.pi
+    loc = mean - EULER_GAMMA * scale
+    return loc, scale
 
-def chamando_sampling(
-                        p_gk, p_rodak, p_qk, a, l, classe_carregamento, classe_madeira, classe_umidade,
-                        f_mk, f_vk, e_modflex, f_mktab, densidade_long, densidade_tab,
-                        d_cm, esp_cm, bw_cm, h_cm, tipo_g,
-                        method: str = "LHS",          # "MC", "LHS" ou "IS"
-                        nsamples: int = 100000,
-                        random_state: int = 123
-                    ):
-    # casts
-    p_gk = float(p_gk); p_rodak = float(p_rodak); p_qk = float(p_qk)
-    a = float(a); l = float(l)
-    f_mk = float(f_mk); f_vk = float(f_vk); e_modflex = float(e_modflex)
-    f_mktab = float(f_mktab)
-    densidade_long = float(densidade_long); densidade_tab = float(densidade_tab)
-    d_cm = float(d_cm); esp_cm = float(esp_cm); bw_cm = float(bw_cm); h_cm = float(h_cm)
+
+def distribuicoes_confia(medias: list, fatores: list = None) -> list:
+    """Distribuições marginais das 9 variáveis aleatórias: normais truncadas em zero (CV = CV_NORMAL_TRUNCADA) para p_gk, resistências, rigidez e densidades e Gumbel (GEV com c = 0, CV = CV_GUMBEL) para as variáveis de INDICES_GUMBEL (p_rodak e p_qk).
+
+    :param medias: Médias [p_gk, p_rodak, p_qk, f_mk, f_vk, e_modflex, f_mktab, densidade_long, densidade_tab] (unidades da planilha, ver obj_confia)
+    :param fatores: Fatores multiplicativos das médias (por exemplo para a densidade de amostragem por importância). Se None, as médias são usadas como estão
+
+    :return: Lista com as 9 distribuições do UQpy
+    """
+
+    medias = np.asarray(medias, dtype=float) * (1.0 if fatores is None else np.asarray(fatores, dtype=float))
 
     # helper truncnorm X>=0 (a,b no domínio padrão)
     def tn_pos(mean, cov):
@@ -155,33 +110,29 @@ def chamando_sampling(
         a_std = (0.0 - mu) / sig
         return TruncatedNormal(a=a_std, b=np.inf, loc=mu, scale=sig)
 
-    # -------------------------
-    # TARGET (como você já faz)
-    # -------------------------
-    loc_rodak, scale_rodak = gev_loc_scale_from_mean_std(p_rodak, p_rodak * 0.2)
-    loc_qk, scale_qk       = gev_loc_scale_from_mean_std(p_qk,   p_qk   * 0.2)
-
-    p_gk_aux           = tn_pos(p_gk, 0.10)
-    p_rodak_aux        = GeneralizedExtreme(c=0.0, loc=loc_rodak, scale=scale_rodak)
-    p_qk_aux           = GeneralizedExtreme(c=0.0, loc=loc_qk, scale=scale_qk)
-    f_mk_aux           = tn_pos(f_mk, 0.10)
-    f_vk_aux           = tn_pos(f_vk, 0.10)
-    e_modflex_aux      = tn_pos(e_modflex, 0.10)
-    f_mktab_aux        = tn_pos(f_mktab, 0.10)
-    densidade_long_aux = tn_pos(densidade_long, 0.10)
-    densidade_tab_aux  = tn_pos(densidade_tab, 0.10)
-
-    varss = [
-                p_gk_aux, p_rodak_aux, p_qk_aux, f_mk_aux, f_vk_aux,
-                e_modflex_aux, f_mktab_aux, densidade_long_aux, densidade_tab_aux
+    def gumbel(mean, cov):
+        loc, scale = gev_loc_scale_from_mean_std(mean, mean * cov)
+        return GeneralizedExtreme(c=0.0, loc=loc, scale=scale)
+
+    # p_gk, p_rodak, p_qk, f_mk, f_vk, E, f_mktab, rho_long, rho_tab
+    return [
+                gumbel(m, CV_GUMBEL) if i in INDICES_GUMBEL else tn_pos(m, CV_NORMAL_TRUNCADA)
+                for i, m in enumerate(medias)
             ]
 
-    # params fixos
-    paramss = [a, l, classe_carregamento, classe_madeira, classe_umidade, d_cm, esp_cm, bw_cm, h_cm, tipo_g]
 
-    # -------------------------
-    # SAMPLER UQpy
-    # -------------------------
+def amostras_confia(medias: list, method: str = "LHS", nsamples: int = 100000, random_state: int = 123) -> tuple:
+    """Amostras das variáveis aleatórias por Monte Carlo, hipercubo latino ou amostragem por importância.
+
+    :param medias: Médias das 9 variáveis aleatórias (ver distribuicoes_confia)
+    :param method: "MC", "LHS" ou "IS"
+    :param nsamples: Número de amostras
+    :param random_state: Semente
+
+    :return: [0] Amostrador do UQpy, [1] Amostras (nsamples, 9), [2] Pesos normalizados do IS (None para MC e LHS)
+    """
+
+    varss = distribuicoes_confia(medias)
     method = method.upper()
 
     if method == "MC":
@@ -201,29 +152,12 @@ def chamando_sampling(
         # 2) proposal: "puxar" para falha (heurística simples e editável)
         #    - ações ↑ (médias maiores)
         #    - resistências/rigidez ↓ (médias menores)
+        #    GEV proposal mantém COV ~ 0.2, só desloca a média
         m_load = 1.20
         m_res  = 0.85
         m_E    = 0.90
         m_rho  = 1.10
-
-        # GEV proposal (mantém COV ~ 0.2 via std = mean*0.2, só desloca a média)
-        p_rodak_p = p_rodak * m_load
-        p_qk_p    = p_qk    * m_load
-        loc_rodak_p, scale_rodak_p = gev_loc_scale_from_mean_std(p_rodak_p, p_rodak_p * 0.2)
-        loc_qk_p, scale_qk_p       = gev_loc_scale_from_mean_std(p_qk_p,    p_qk_p    * 0.2)
-
-        proposal_marginals = [
-            tn_pos(p_gk * m_load, 0.10),                                        # p_gk
-            GeneralizedExtreme(c=0.0, loc=loc_rodak_p, scale=scale_rodak_p),     # p_rodak
-            GeneralizedExtreme(c=0.0, loc=loc_qk_p,    scale=scale_qk_p),        # p_qk
-            tn_pos(f_mk * m_res, 0.10),                                          # f_mk
-            tn_pos(f_vk * m_res, 0.10),                                          # f_vk
-            tn_pos(e_modflex * m_E, 0.10),                                       # E
-            tn_pos(f_mktab * m_res, 0.10),                                       # f_mktab
-            tn_pos(densidade_long * m_rho, 0.10),                                # rho_long
-            tn_pos(densidade_tab  * m_rho, 0.10),                                # rho_tab
-        ]
-
+        proposal_marginals = distribuicoes_confia(medias, [m_load, m_load, m_load, m_res, m_res, m_E, m_res, m_rho, m_rho])
         proposal_joint = JointIndependent(marginals=proposal_marginals)
 
         # 3) ImportanceSampling: gera amostras pela proposta e calcula pesos (normalizados)
@@ -239,14 +173,246 @@ def chamando_sampling(
     else:
         raise ValueError("method deve ser 'MC', 'LHS' ou 'IS'")
 
-    # -------------------------
-    # rodar modelo UQpy
-    # -------------------------
-    model = PythonModel(model_script='madeiras.py', model_object_name='obj_confia', params=paramss)
-    rmodel = RunModel(model=model)
-    rmodel.run(samples=samples)
+    return sampler, samples, weights
+
+
+def transformacao_confia(u: np.ndarray, medias: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Transformação iso-probabilística em forma fechada do espaço normal padrão u para as variáveis x de distribuicoes_confia, com a derivada dx/du (a transformação é diagonal, pois as variáveis são independentes).
+
+    Normal truncada em zero: Phi(z) = Phi(a) + Phi(u) Phi(-a) (calculada pela cauda do lado de u), x = mu + sigma z. Gumbel: x = loc - scale log(-log Phi(u)).
+
+    :param u: Pontos no espaço normal padrão (..., 9)
+    :param medias: Médias das 9 variáveis (9,) ou (..., 9)
+
+    :return: [0] Pontos x (..., 9), [1] Derivadas dx/du (..., 9)
+    """
+
+    u = np.asarray(u, dtype=float)
+    medias = np.broadcast_to(np.asarray(medias, dtype=float), u.shape)
+    x = np.empty(u.shape)
+    dxdu = np.empty(u.shape)
+    tn = np.ones(u.shape[-1], dtype=bool)
+    tn[INDICES_GUMBEL] = False
+
+    # Normais truncadas em zero (a = -mu / sigma)
+    mu = medias[..., tn]
+    sigma = CV_NORMAL_TRUNCADA * np.abs(mu)
+    u_tn = u[..., tn]
+    log_c = special.log_ndtr(mu / sigma)
+    cauda_inferior = special.ndtri(special.ndtr(-mu / sigma) + special.ndtr(u_tn) * np.exp(log_c))
+    z = np.where(u_tn <= 0.0, cauda_inferior, -special.ndtri(np.exp(special.log_ndtr(-u_tn) + log_c)))
+    x[..., tn] = mu + sigma * z
+    dxdu[..., tn] = sigma * np.exp(log_c + 0.5 * (z**2 - u_tn**2))
+
+    # Gumbel (máximos)
+    m = medias[..., INDICES_GUMBEL]
+    loc, scale = gev_loc_scale_from_mean_std(m, CV_GUMBEL * m)
+    u_gb = u[..., INDICES_GUMBEL]
+    log_phi = special.log_ndtr(u_gb)
+    t = -log_phi
+    x[..., INDICES_GUMBEL] = loc - scale * np.log(t)
+    dxdu[..., INDICES_GUMBEL] = scale * np.exp(st.norm.logpdf(u_gb) - log_phi) / t
+
+    return x, dxdu
+
+
+def parametros_linhas(paramss: list, idx: np.ndarray) -> list:
+    """Seleciona as linhas idx dos parâmetros geométricos vetoriais (d, esp, bw, h) de um lote de projetos; os demais parâmetros são comuns a todos."""
+
+    return list(paramss[:5]) + [p if np.ndim(p) == 0 else np.asarray(p)[idx] for p in paramss[5:9]]
+
+
+def form_hlrf_lote(
+                    medias: np.ndarray,
+                    paramss: list,
+                    modo: str,
+                    metodo: str = "iHL-RF",
+                    tolerance_u: float = 1e-3,
+                    tolerance_beta: float = 1e-3,
+                    max_iter: int = 100,
+                ) -> dict:
+    """FORM nativo (HL-RF ou iHL-RF) de K projetos ao mesmo tempo: as iterações andam em passo único sobre arrays (K, 9), cada chamada do modelo avalia G e o gradiente de todas as linhas ainda ativas, e as linhas que convergem saem das iterações seguintes (na busca linear do iHL-RF só são reavaliadas as linhas que ainda não reduziram a função de mérito).
+
+    :param medias: Médias das 9 variáveis aleatórias, (9,) comuns a todos os projetos ou (K, 9)
+    :param paramss: Parâmetros fixos (ver estados_limite_confia), com d, esp, bw e h escalares ou arrays (K,)
+    :param modo: Estado limite (um de ESTADOS_LIMITE_CONFIA)
+    :param metodo: "HL-RF" ou "iHL-RF"
+    :param tolerance_u: Tolerância na variação do ponto u entre iterações
+    :param tolerance_beta: Tolerância na variação de beta entre iterações
+    :param max_iter: Número máximo de iterações
+
+    :return: Dicionário com arrays por projeto "beta" (K,), "pf" (K,), "u" e "x" (K, 9, ponto de projeto), "alpha" (K, 9, gradiente unitário de G no ponto de projeto), "n_iteracoes" (K,), "n_chamadas" (K, avaliações de cada projeto) e "convergiu" (K,), além de "n_chamadas_lote" (chamadas vetorizadas do modelo)
+    """
+
+    if metodo not in ("HL-RF", "iHL-RF"):
+        raise ValueError("metodo deve ser 'HL-RF' ou 'iHL-RF'")
+    if modo not in ESTADOS_LIMITE_CONFIA:
+        raise ValueError(f"modo deve ser um de {ESTADOS_LIMITE_CONFIA}")
+    medias = np.asarray(medias, dtype=float)
+    n_proj = max([np.size(p) for p in paramss[5:9]] + [medias.shape[0] if medias.ndim == 2 else 1])
+    medias = np.broadcast_to(medias, (n_proj, medias.shape[-1]))
+    paramss = list(paramss[:5]) + [np.broadcast_to(np.asarray(p, dtype=float), (n_proj,)) for p in paramss[5:9]]
+    n_chamadas = np.zeros(n_proj, dtype=int)
+    n_chamadas_lote = 0
+
+    def avaliar(u, idx):
+        nonlocal n_chamadas_lote
+        x, dxdu = transformacao_confia(u, medias[idx])
+        g, dg = gradientes_estados_limite_confia(x, parametros_linhas(paramss, idx))
+        n_chamadas[idx] += 1
+        n_chamadas_lote += 1
+        return g[modo], dg[modo] * dxdu, x
+
+    todos = np.arange(n_proj)
+    u = np.zeros(medias.shape)
+    g_u, grad, x = avaliar(u, todos)
+    beta = np.full(n_proj, np.inf)
+    n_iteracoes = np.zeros(n_proj, dtype=int)
+    convergiu = np.zeros(n_proj, dtype=bool)
+    ativos = todos
+    for it in range(1, max_iter + 1):
+        if ativos.size == 0:
+            break
+        u_a, g_a, grad_a = u[ativos], g_u[ativos], grad[ativos]
+
+        # Ponto HL-RF: projeção da origem no hiperplano tangente a G(u) = 0
+        norma = np.linalg.norm(grad_a, axis=1)
+        beta_novo = (g_a - np.sum(grad_a * u_a, axis=1)) / norma
+        direcao = -beta_novo[:, None] * grad_a / norma[:, None] - u_a
+
+        # iHL-RF: reduz o passo das linhas em que a função de mérito não diminuiu
+        passo = np.ones(ativos.size)
+        u_novo = u_a + direcao
+        g_novo, grad_novo, x_novo = avaliar(u_novo, ativos)
+        if metodo == "iHL-RF":
+            c = 2.0 * np.maximum(np.linalg.norm(u_a, axis=1), np.linalg.norm(u_novo, axis=1)) / norma
+            merito = 0.5 * np.sum(u_a**2, axis=1) + c * np.abs(g_a)
+            busca = 0.5 * np.sum(u_novo**2, axis=1) + c * np.abs(g_novo) > merito
+            for _ in range(20):
+                if not busca.any():
+                    break
+                b = np.flatnonzero(busca)
+                passo[b] *= 0.5
+                u_novo[b] = u_a[b] + passo[b, None] * direcao[b]
+                g_novo[b], grad_novo[b], x_novo[b] = avaliar(u_novo[b], ativos[b])
+                busca[b] = 0.5 * np.sum(u_novo[b]**2, axis=1) + c[b] * np.abs(g_novo[b]) > merito[b]
+
+        variacao_u = np.linalg.norm(u_novo - u_a, axis=1)
+        variacao_beta = np.abs(beta_novo - beta[ativos])
+        u[ativos], g_u[ativos], grad[ativos], x[ativos], beta[ativos] = u_novo, g_novo, grad_novo, x_novo, beta_novo
+        n_iteracoes[ativos] = it
+        fim = (variacao_u <= tolerance_u) & (variacao_beta <= tolerance_beta)
+        convergiu[ativos[fim]] = True
+        ativos = ativos[~fim]
+
+    # beta linearizado no último ponto (com sinal: negativo quando a média já está na região de falha)
+    norma = np.linalg.norm(grad, axis=1)
+    beta = (g_u - np.sum(grad * u, axis=1)) / norma
+
+    return {
+                "beta": beta,
+                "pf": st.norm.cdf(-beta),
+                "u": u,
+                "x": x,
+                "alpha": grad / norma[:, None],
+                "n_iteracoes": n_iteracoes,
+                "n_chamadas": n_chamadas,
+                "convergiu": convergiu,
+                "n_chamadas_lote": n_chamadas_lote,
+            }
+
+
+def form_hlrf(
+                medias: list,
+                paramss: list,
+                modo: str,
+                metodo: str = "iHL-RF",
+                tolerance_u: float = 1e-3,
+                tolerance_beta: float = 1e-3,
+                max_iter: int = 100,
+            ) -> dict:
+    """FORM nativo pelo algoritmo HL-RF (Hasofer-Lind-Rackwitz-Fiessler) ou pela versão melhorada iHL-RF (busca linear de Armijo na função de mérito 0.5 |u|² + c |G(u)|), com a transformação em forma fechada de transformacao_confia e os gradientes analíticos de gradientes_estados_limite_confia: cada chamada do modelo fornece G e o gradiente juntos, sem diferenças finitas. Caso de um projeto de form_hlrf_lote.
+
+    :param medias: Médias das 9 variáveis aleatórias (ver distribuicoes_confia)
+    :param paramss: Parâmetros fixos do projeto (ver estados_limite_confia)
+    :param modo: Estado limite (um de ESTADOS_LIMITE_CONFIA)
+    :param metodo: "HL-RF" ou "iHL-RF"
+    :param tolerance_u: Tolerância na variação do ponto u entre iterações
+    :param tolerance_beta: Tolerância na variação de beta entre iterações
+    :param max_iter: Número máximo de iterações
+
+    :return: Dicionário com "beta", "pf", "u" e "x" (ponto de projeto), "alpha" (gradiente unitário de G no ponto de projeto, convenção do FORM do UQpy), "n_iteracoes", "n_chamadas" (chamadas do modelo) e "convergiu"
+    """
+
+    res = form_hlrf_lote(medias, paramss, modo, metodo=metodo, tolerance_u=tolerance_u, tolerance_beta=tolerance_beta, max_iter=max_iter)
+
+    return {
+                "beta": float(res["beta"][0]),
+                "pf": float(res["pf"][0]),
+                "u": res["u"][0],
+                "x": res["x"][0],
+                "alpha": res["alpha"][0],
+                "n_iteracoes": int(res["n_iteracoes"][0]),
+                "n_chamadas": int(res["n_chamadas"][0]),
+                "convergiu": bool(res["convergiu"][0]),
+            }
+
+
+def chamando_form_hlrf(p_gk, p_rodak, p_qk, a, l, classe_carregamento, classe_madeira, classe_umidade, f_mk, f_vk, e_modflex, f_mktab, densidade_long, densidade_tab, d_cm, esp_cm, bw_cm, h_cm, tipo_g, metodo="iHL-RF") -> dict:
+    medias = [float(v) for v in (p_gk, p_rodak, p_qk, f_mk, f_vk, e_modflex, f_mktab, densidade_long, densidade_tab)]
+    paramss = [float(a), float(l), classe_carregamento, classe_madeira, classe_umidade, float(d_cm), float(esp_cm), float(bw_cm), float(h_cm)]
+
+    return form_hlrf(medias, paramss, tipo_g, metodo=metodo)
+
+
+def chamando_form_lote(p_gk, p_rodak, p_qk, a, l, classe_carregamento, classe_madeira, classe_umidade, f_mk, f_vk, e_modflex, f_mktab, densidade_long, densidade_tab, d_cm, esp_cm, bw_cm, h_cm, tipo_g, metodo="iHL-RF") -> dict:
+    # d_cm, esp_cm, bw_cm e h_cm: escalares ou arrays (K,), por exemplo os projetos de uma frente de Pareto ou uma grade de diâmetros
+    medias = [float(v) for v in (p_gk, p_rodak, p_qk, f_mk, f_vk, e_modflex, f_mktab, densidade_long, densidade_tab)]
+    paramss = [float(a), float(l), classe_carregamento, classe_madeira, classe_umidade] + [np.asarray(v, dtype=float) for v in (d_cm, esp_cm, bw_cm, h_cm)]
+
+    return form_hlrf_lote(medias, paramss, tipo_g, metodo=metodo)
+
+
+def chamando_form(p_gk, p_rodak, p_qk, a, l, classe_carregamento, classe_madeira, classe_umidade, f_mk, f_vk, e_modflex, f_mktab, densidade_long, densidade_tab, d_cm, esp_cm, bw_cm, h_cm, tipo_g, modelo=obj_confia):
+    medias = [float(v) for v in (p_gk, p_rodak, p_qk, f_mk, f_vk, e_modflex, f_mktab, densidade_long, densidade_tab)]
 
-    g = np.asarray(rmodel.qoi_list, dtype=float).reshape(-1)
+    # Variáveis fixas da viga
+    paramss = [float(a), float(l), classe_carregamento, classe_madeira, classe_umidade, float(d_cm), float(esp_cm), float(bw_cm), float(h_cm), tipo_g]
+
+    # Confiabilidade
+    varss = distribuicoes_confia(medias)
+    runmodel_nlc = criar_modelo_confia(paramss, modelo=modelo)
+    form = FORM(distributions=varss, runmodel_object=runmodel_nlc, tolerance_u=1e-3, tolerance_beta=1e-3)
+    form.run()
+    beta = form.beta[0]
+    pf = form.failure_probability[0]
+
+    return beta, pf
+
+
+def chamando_sampling(
+                        p_gk, p_rodak, p_qk, a, l, classe_carregamento, classe_madeira, classe_umidade,
+                        f_mk, f_vk, e_modflex, f_mktab, densidade_long, densidade_tab,
+                        d_cm, esp_cm, bw_cm, h_cm, tipo_g,
+                        method: str = "LHS",          # "MC", "LHS" ou "IS"
+                        nsamples: int = 100000,
+                        random_state: int = 123,
+                        modelo=obj_confia,
+                        tamanho_lote: int = None,
+                    ):
+    medias = [float(v) for v in (p_gk, p_rodak, p_qk, f_mk, f_vk, e_modflex, f_mktab, densidade_long, densidade_tab)]
+
+    # params fixos
+    paramss = [float(a), float(l), classe_carregamento, classe_madeira, classe_umidade, float(d_cm), float(esp_cm), float(bw_cm), float(h_cm), tipo_g]
+
+    # amostras e modelo
+    sampler, samples, weights = amostras_confia(medias, method=method, nsamples=nsamples, random_state=random_state)
+    rmodel = criar_modelo_confia(paramss, modelo=modelo, tamanho_lote=tamanho_lote)
+    if isinstance(rmodel, ModeloDireto):
+        g = rmodel.avaliar(samples)
+    else:
+        rmodel.run(samples=samples)
+        g = np.asarray(rmodel.qoi_list, dtype=float).reshape(-1)
 
     # Convenção: falha quando g <= 0
     if weights is None:
@@ -257,4 +423,107 @@ def chamando_sampling(
 
     beta = beta_from_pf(pf)
 
-    return sampler, beta, pf
\ No newline at end of file
+    return sampler, beta, pf
+
+
+def pf_sistema_serie_form(betas: np.ndarray, alphas: np.ndarray) -> float:
+    """Probabilidade de falha de um sistema em série pela aproximação de primeira ordem: 1 - Phi_m(beta; R), com correlações R = alpha alpha^T entre as margens linearizadas nos pontos de projeto.
+
+    :param betas: Índices de confiabilidade dos m modos (m,)
+    :param alphas: Vetores unitários dos gradientes nos pontos de projeto (m, n_vars), todos com a mesma convenção de sinal
+
+    :return: Probabilidade de falha do sistema
+    """
+
+    betas = np.asarray(betas, dtype=float)
+    alphas = np.atleast_2d(np.asarray(alphas, dtype=float))
+    if betas.size == 1:
+        return float(st.norm.cdf(-betas[0]))
+    alphas = alphas / np.linalg.norm(alphas, axis=1, keepdims=True)
+    corr = np.clip(alphas @ alphas.T, -1.0, 1.0)
+    np.fill_diagonal(corr, 1.0)
+    p_seguro = st.multivariate_normal(mean=np.zeros(betas.size), cov=corr, allow_singular=True).cdf(betas)
+
+    # Limites unimodais como salvaguarda contra o erro de integração numérica
+    pf_i = st.norm.cdf(-betas)
+    return float(np.clip(1.0 - p_seguro, pf_i.max(), min(1.0, pf_i.sum())))
+
+
+def chamando_confiabilidade(
+                                p_gk, p_rodak, p_qk, a, l, classe_carregamento, classe_madeira, classe_umidade,
+                                f_mk, f_vk, e_modflex, f_mktab, densidade_long, densidade_tab,
+                                d_cm, esp_cm, bw_cm, h_cm,
+                                method: str = "FORM",         # "FORM", "HL-RF", "iHL-RF", "MC", "LHS" ou "IS"
+                                modos: tuple = ESTADOS_LIMITE_CONFIA,
+                                nsamples: int = 100000,
+                                random_state: int = 123,
+                                tamanho_lote: int = None,
+                            ) -> dict:
+    """Confiabilidade de todos os estados limites de um projeto (flexão, cisalhamento e flecha da longarina e flexão do tabuleiro) e do sistema em série, em uma única passada: as distribuições são montadas uma vez e, na simulação, todos os modos são avaliados sobre as mesmas amostras (estados_limite_confia).
+
+    :param method: "FORM" (FORM do UQpy), "HL-RF" ou "iHL-RF" (FORM nativo, ver form_hlrf), com um ponto de projeto por modo e o sistema pela aproximação multinormal de primeira ordem, ou "MC", "LHS", "IS" (simulação). Maiúsculas e minúsculas são indiferentes
+    :param modos: Estados limites considerados (subconjunto de ESTADOS_LIMITE_CONFIA)
+    :param nsamples: Número de amostras (simulação)
+    :param random_state: Semente (simulação)
+    :param tamanho_lote: Número máximo de amostras por chamada do modelo (simulação)
+
+    :return: Dicionário com uma entrada {"beta", "pf", "convergiu"} por modo (com "n_iteracoes" e "n_chamadas" no FORM nativo), "sistema" ({"beta", "pf", "convergiu"} do sistema em série, que só convergiu se todos os modos convergiram) e "n_avaliacoes" (avaliações do modelo). Na simulação, "convergiu" é sempre True
+    """
+
+    medias = [float(v) for v in (p_gk, p_rodak, p_qk, f_mk, f_vk, e_modflex, f_mktab, densidade_long, densidade_tab)]
+    paramss = [float(a), float(l), classe_carregamento, classe_madeira, classe_umidade, float(d_cm), float(esp_cm), float(bw_cm), float(h_cm)]
+    modos = tuple(modos)
+    if not modos or any(m not in ESTADOS_LIMITE_CONFIA for m in modos):
+        raise ValueError(f"modos deve ser um subconjunto não vazio de {ESTADOS_LIMITE_CONFIA}")
+    metodos = {"FORM": "FORM", "HL-RF": "HL-RF", "IHL-RF": "iHL-RF", "MC": "MC", "LHS": "LHS", "IS": "IS"}
+    if str(method).upper() not in metodos:
+        raise ValueError("method deve ser 'FORM', 'HL-RF', 'iHL-RF', 'MC', 'LHS' ou 'IS'")
+    method = metodos[str(method).upper()]
+    res = {}
+
+    if method == "FORM":
+        varss = distribuicoes_confia(medias)
+        betas, alphas, n_avaliacoes = [], [], 0
+        for modo in modos:
+            runmodel_nlc = ModeloDireto(obj_confia, paramss + [modo])
+            form = FORM(distributions=varss, runmodel_object=runmodel_nlc, tolerance_u=1e-3, tolerance_beta=1e-3)
+            form.run()
+            res[modo] = {"beta": float(form.beta[0]), "pf": float(form.failure_probability[0]), "convergiu": bool(form.iterations[0] < form.n_iterations)}
+            betas.append(float(form.beta[0]))
+            alphas.append(np.ravel(form.alpha))
+            n_avaliacoes += runmodel_nlc.n_avaliacoes
+        pf_sis = pf_sistema_serie_form(np.array(betas), np.array(alphas))
+
+    elif method in ("HL-RF", "iHL-RF"):
+        betas, alphas, n_avaliacoes = [], [], 0
+        for modo in modos:
+            form = form_hlrf(medias, paramss, modo, metodo=method)
+            res[modo] = {"beta": form["beta"], "pf": form["pf"], "convergiu": form["convergiu"], "n_iteracoes": form["n_iteracoes"], "n_chamadas": form["n_chamadas"]}
+            betas.append(form["beta"])
+            alphas.append(form["alpha"])
+            n_avaliacoes += form["n_chamadas"]
+        pf_sis = pf_sistema_serie_form(np.array(betas), np.array(alphas))
+
+    else:
+        _, samples, weights = amostras_confia(medias, method=method, nsamples=nsamples, random_state=random_state)
+        n = samples.shape[0]
+        passo = max(n if tamanho_lote is None else int(tamanho_lote), 1)
+        g = np.empty((n, len(modos)))
+        for ini in range(0, n, passo):
+            g_lote = estados_limite_confia(samples[ini:ini + passo], paramss)
+            for j, modo in enumerate(modos):
+                g[ini:ini + passo, j] = g_lote[modo]
+        n_avaliacoes = n
+
+        # Convenção: falha quando g <= 0; pesos do IS já vêm normalizados para somar 1 no UQpy
+        w = np.full(n, 1.0 / n) if weights is None else weights
+        falha = g <= 0.0
+        for j, modo in enumerate(modos):
+            pf = float(np.sum(falha[:, j] * w))
+            res[modo] = {"beta": beta_from_pf(pf), "pf": pf, "convergiu": True}
+        pf_sis = float(np.sum(falha.any(axis=1) * w))
+
+    res["sistema"] = {"beta": beta_from_pf(pf_sis), "pf": pf_sis, "convergiu": all(res[modo]["convergiu"] for modo in modos)}
+    res["n_avaliacoes"] = int(n_avaliacoes)
+
+    return res
@@ -8,8 +8,16 @@ import numpy as np
 import pandas as pd
 import os
 import io
+import pickle
+import time
+import warnings
 from io import BytesIO
+from contextlib import nullcontext
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from scipy import stats as st
+from scipy.stats import qmc
+from scipy.optimize import minimize, Bounds, NonlinearConstraint
 
 from UQpy.distributions import TruncatedNormal
 from UQpy.distributions.collection.GeneralizedExtreme import GeneralizedExtreme
@@ -26,13 +34,15 @@ mpl.rcParams.update({
                     })
 from matplotlib.figure import Figure
 from matplotlib.patches import Circle
-from pymoo.core.problem import ElementwiseProblem
+from pymoo.core.problem import Problem
+from pymoo.core.repair import Repair, NoRepair
 from pymoo.algorithms.moo.nsga2 import NSGA2
 from pymoo.operators.sampling.rnd import FloatRandomSampling
 from pymoo.operators.crossover.sbx import SBX
 from pymoo.operators.mutation.pm import PM
 from pymoo.termination import get_termination
-from pymoo.optimize import minimize
+from pymoo.termination.default import DefaultMultiObjectiveTermination
+from pymoo.indicators.hv import HV
 
 
 def restringir_espaco(esp: float, esp_min: float, esp_max: float, comp: float, largura_peca: float):
@@ -79,15 +89,183 @@ def restringir_espaco(esp: float, esp_min: float, esp_max: float, comp: float, l
             esp_corr = None
         else:
             esp_corr = sobra / (n - 1)
-        # restrições normalizadas
-        g_min = (esp_min - esp_corr) / esp_min
-        g_max = (esp_corr - esp_max) / esp_max
-        g = max(g_min, g_max)
+            # restrições normalizadas
+            g_min = (esp_min - esp_corr) / esp_min
+            g_max = (esp_corr - esp_max) / esp_max
+            g = max(g_min, g_max)
 
         if g > pior_g:
             pior_g = g
 
-    return pior_g, (candidatos[0]+candidatos[1])/2
+    return pior_g, (candidatos[0]+candidatos[-1])/2
+
+
+def restringir_espaco_vetorizado(
+                                    esp: np.ndarray,
+                                    esp_min: float,
+                                    esp_max: float,
+                                    comp: float,
+                                    largura_peca: np.ndarray
+                                ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Versão em lote de restringir_espaco. Avalia os candidatos floor/ceil de número de peças para populações inteiras, sem laços nem desvios em Python, e reproduz exatamente o resultado escalar.
+
+    :param esp: Espaçamentos propostos pela heurística [m]
+    :param esp_min: Espaçamento mínimo permitido [m]
+    :param esp_max: Espaçamento máximo permitido [m]
+    :param comp: Comprimento/largura total disponível [m]
+    :param largura_peca: Larguras (ou diâmetros) de cada peça [m]
+
+    :return: [0] Violação da restrição (pior candidato). Se g <= 0, a solução é viável; np.inf quando não há espaço para as peças (sobra < 0)
+             [1] Número médio de peças entre os candidatos floor/ceil
+             [2] Espaçamento uniforme corrigido do pior candidato [m] (np.nan quando não existe)
+    """
+
+    esp = np.asarray(esp, dtype=float)
+    largura_peca = np.asarray(largura_peca, dtype=float)
+    n_cont = (comp + esp) / (largura_peca + esp)
+    n_inf = np.floor(n_cont)
+    n_sup = np.ceil(n_cont)
+
+    gs = []
+    esps_corr = []
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for n in (n_inf, n_sup):
+            sobra = comp - n * largura_peca
+            esp_corr = np.where(sobra >= 0, sobra / (n - 1), np.nan)
+            g_min = (esp_min - esp_corr) / esp_min
+            g_max = (esp_corr - esp_max) / esp_max
+            g = np.where(sobra < 0, np.inf, np.maximum(g_min, g_max))
+            gs.append(np.where(n < 2, -np.inf, g))
+            esps_corr.append(np.where(n < 2, np.nan, esp_corr))
+
+    # O candidato superior só substitui o inferior se for estritamente pior (mesma regra do laço escalar)
+    usa_sup = gs[1] > gs[0]
+    pior_g = np.where(usa_sup, gs[1], gs[0])
+    esp_corr = np.where(usa_sup, esps_corr[1], esps_corr[0])
+
+    return pior_g, (n_inf + n_sup) / 2, esp_corr
+
+
+def derivada_restringir_espaco(
+                                    esp: np.ndarray,
+                                    esp_min: float,
+                                    esp_max: float,
+                                    comp: float,
+                                    largura_peca: np.ndarray
+                                ) -> tuple[np.ndarray, np.ndarray]:
+    """Derivada analítica da restrição de restringir_espaco_vetorizado em relação à largura da peça. Os números de peças (floor/ceil) são constantes por partes, logo a derivada em relação ao espaçamento proposto é nula onde existe.
+
+    :param esp: Espaçamentos propostos pela heurística [m]
+    :param esp_min: Espaçamento mínimo permitido [m]
+    :param esp_max: Espaçamento máximo permitido [m]
+    :param comp: Comprimento/largura total disponível [m]
+    :param largura_peca: Larguras (ou diâmetros) de cada peça [m]
+
+    :return: [0] Violação da restrição (igual a restringir_espaco_vetorizado), [1] Derivada da violação em relação à largura da peça [1/m] (nula onde a violação é infinita)
+    """
+
+    esp = np.asarray(esp, dtype=float)
+    largura_peca = np.asarray(largura_peca, dtype=float)
+    n_cont = (comp + esp) / (largura_peca + esp)
+
+    gs, dgs = [], []
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for n in (np.floor(n_cont), np.ceil(n_cont)):
+            sobra = comp - n * largura_peca
+            esp_corr = np.where(sobra >= 0, sobra / (n - 1), np.nan)
+            desp_corr = -n / (n - 1)
+            g_min = (esp_min - esp_corr) / esp_min
+            g_max = (esp_corr - esp_max) / esp_max
+            g = np.where(sobra < 0, np.inf, np.maximum(g_min, g_max))
+            dg = np.where(g_min >= g_max, -desp_corr / esp_min, desp_corr / esp_max)
+            gs.append(np.where(n < 2, -np.inf, g))
+            dgs.append(np.where(np.isfinite(gs[-1]), dg, 0.0))
+
+    usa_sup = gs[1] > gs[0]
+
+    return np.where(usa_sup, gs[1], gs[0]), np.where(usa_sup, dgs[1], dgs[0])
+
+
+def nao_dominados_2d(f: np.ndarray) -> np.ndarray:
+    """Índices do conjunto não dominado exato de um problema de minimização com dois objetivos (ordenação + mínimo acumulado, O(n log n)). Pontos repetidos aparecem uma única vez.
+
+    :param f: Matriz (n_pontos, 2) com os objetivos
+
+    :return: Índices dos pontos não dominados, em ordem crescente do primeiro objetivo
+    """
+
+    f = np.asarray(f, dtype=float)
+    if len(f) == 0:
+        return np.zeros(0, dtype=int)
+    ordem = np.lexsort((f[:, 1], f[:, 0]))
+    f2 = f[ordem, 1]
+    melhor_anterior = np.concatenate([[np.inf], np.minimum.accumulate(f2)[:-1]])
+
+    return ordem[f2 < melhor_anterior]
+
+
+def bissecao_limite_inferior(funcao, lo: np.ndarray, hi: np.ndarray, n_iter: int = 60) -> np.ndarray:
+    """Bissecção vetorizada do menor valor que atende uma equação estado limite decrescente na variável (g <= 0 atende).
+
+    :param funcao: Função vetorizada x -> g(x), decrescente em x
+    :param lo: Limites inferiores do intervalo de busca
+    :param hi: Limites superiores do intervalo de busca
+    :param n_iter: Número de bissecções
+
+    :return: Menor x em [lo, hi] com g(x) <= 0 (lo se o próprio limite inferior atende, np.nan se nenhum valor do intervalo atende)
+    """
+
+    lo = np.asarray(lo, dtype=float)
+    hi = np.asarray(hi, dtype=float)
+    atende_lo = funcao(lo) <= 0.0
+    atende_hi = funcao(hi) <= 0.0
+    a, b = lo.copy(), hi.copy()
+    for _ in range(n_iter):
+        m = (a + b) / 2.0
+        atende = funcao(m) <= 0.0
+        b = np.where(atende, m, b)
+        a = np.where(atende, a, m)
+
+    return np.where(atende_lo, lo, np.where(atende_hi, b, np.nan))
+
+
+def espacamento_exato(comp: float, n: np.ndarray, largura: np.ndarray, ajustar_largura: bool = True, n_tentativas: int = 64) -> tuple[np.ndarray, np.ndarray]:
+    """Espaçamento que faz restringir_espaco encontrar exatamente n peças (candidatos floor e ceil iguais a n). Em ponto flutuante a conta nem sempre fecha exatamente; quando permitido, a largura da peça é aumentada em passos relativos de 1e-12 até fechar.
+
+    :param comp: Comprimento/largura total disponível [cm]
+    :param n: Números de peças desejados
+    :param largura: Larguras (ou diâmetros) das peças [cm]
+    :param ajustar_largura: Se True, a largura pode ser aumentada minimamente para fechar a conta
+    :param n_tentativas: Número máximo de ajustes da largura
+
+    :return: [0] Larguras (eventualmente ajustadas) [cm], [1] Espaçamentos [cm]
+    """
+
+    n = np.asarray(n, dtype=float)
+    largura = np.asarray(largura, dtype=float)
+    esp = (comp - n * largura) / (n - 1)
+    exato = (comp + esp) / (largura + esp) == n
+    if ajustar_largura:
+        base = largura
+        for k in range(1, n_tentativas + 1):
+            if exato.all():
+                break
+            largura_k = base * (1 + k * 1e-12)
+            esp_k = (comp - n * largura_k) / (n - 1)
+            fecha = ~exato & ((comp + esp_k) / (largura_k + esp_k) == n)
+            largura = np.where(fecha, largura_k, largura)
+            esp = np.where(fecha, esp_k, esp)
+            exato |= fecha
+
+    return largura, esp
+
+
+def _analise(g):
+    """Descrição 'OK'/'N OK' de uma equação estado limite escalar ou vetorial (g <= 0 atende)."""
+
+    if np.ndim(g) == 0:
+        return 'OK' if g <= 0 else 'N OK'
+    return np.where(g <= 0, 'OK', 'N OK')
 
 
 def beta_from_pf(pf: float) -> float:
@@ -237,6 +415,84 @@ def prop_madeiras(geo: dict) -> tuple[float, float, float, float, float, float,
     return area, w_x, w_y, i_x, i_y, s_x, s_y, r_x, r_y, k_m
 
 
+def prop_madeiras_vetorizado(geo: dict) -> dict:
+    """Calcula propriedades geométricas de lotes de seções retangulares ou circulares de madeira (struct-of-arrays).
+    
+    :param geo: Parâmetros geométricos das seções transversais (escalares ou arrays que se difundem entre si). 
+                Se retangular: Chaves: 'b_w': Larguras das seções transversais [m] 
+                e 'h': Alturas das seções transversais [m]. 
+                Se circular: Chaves: 'd': Diâmetros das seções transversais [m]
+
+    :return: Propriedades com as seguintes chaves (arrays com a forma das entradas):
+                "area [m2]": Área da seção transversal,
+                "w_x [m3]" e "w_y [m3]": Módulos de resistência em relação aos eixos x e y,
+                "i_x [m4]" e "i_y [m4]": Momentos de inércia em relação aos eixos x e y,
+                "s_x [m3]" e "s_y [m3]": Momentos estáticos da seção em relação a x e y,
+                "r_x [m]" e "r_y [m]": Raios de giração em relação aos eixos x e y,
+                "k_m": Coeficiente de correção do tipo da seção transversal
+    """
+
+    if 'd' in geo:
+        d = np.asarray(geo['d'], dtype=float)
+        area = (np.pi / 4) * d**2
+        i_x = (np.pi / 64) * d**4
+        s_x = area * (d / 2)
+        w_x = i_x / (d / 2)
+        r_x = d / 4
+        return {
+                    "area [m2]": area,
+                    "w_x [m3]": w_x,
+                    "w_y [m3]": w_x,
+                    "i_x [m4]": i_x,
+                    "i_y [m4]": i_x,
+                    "s_x [m3]": s_x,
+                    "s_y [m3]": s_x,
+                    "r_x [m]": r_x,
+                    "r_y [m]": r_x,
+                    "k_m": np.full(area.shape, 1.0),
+                }
+
+    b_w, h = np.broadcast_arrays(np.asarray(geo['b_w'], dtype=float), np.asarray(geo['h'], dtype=float))
+    area = b_w * h
+    i_x = (b_w * h**3) / 12
+    i_y = (h * b_w**3) / 12
+    return {
+                "area [m2]": area,
+                "w_x [m3]": i_x / (h / 2),
+                "w_y [m3]": i_y / (b_w / 2),
+                "i_x [m4]": i_x,
+                "i_y [m4]": i_y,
+                "s_x [m3]": area * (h / 2),
+                "s_y [m3]": area * (b_w / 2),
+                "r_x [m]": h / np.sqrt(12),
+                "r_y [m]": b_w / np.sqrt(12),
+                "k_m": np.full(area.shape, 0.70),
+            }
+
+
+def tabela_secoes_catalogo(d: list, bw: list, h: list) -> dict:
+    """Pré-calcula as propriedades geométricas de um catálogo comercial de peças: toras de diâmetro d para as longarinas e todos os pares b_w × h para o tabuleiro.
+
+    :param d: Diâmetros comerciais das longarinas [cm]
+    :param bw: Larguras comerciais das peças do tabuleiro [cm]
+    :param h: Alturas comerciais das peças do tabuleiro [cm]
+
+    :return: Dicionário com "d [cm]", "bw [cm]" e "h [cm]" (valores ordenados e sem repetição), "longarina" (saída de prop_madeiras_vetorizado por diâmetro) e "tabuleiro" (saída de prop_madeiras_vetorizado em arrays (n_bw, n_h))
+    """
+
+    d = np.unique(np.asarray(d, dtype=float))
+    bw = np.unique(np.asarray(bw, dtype=float))
+    h = np.unique(np.asarray(h, dtype=float))
+
+    return {
+                "d [cm]": d,
+                "bw [cm]": bw,
+                "h [cm]": h,
+                "longarina": prop_madeiras_vetorizado({"d": d / 100.0}),
+                "tabuleiro": prop_madeiras_vetorizado({"b_w": bw[:, None] / 100.0, "h": h[None, :] / 100.0}),
+            }
+
+
 def peso_proprio_longarina(densidade: float, area_secao: float) -> float:
     """Calcula o peso próprio (PP) da longarina.
 
@@ -253,17 +509,21 @@ def coef_impacto_vertical(liv: float) -> float:
     """Cálculo do Coeficiente de Impacto Vertical (CIV) conforme NBR 7188:2024 item 5.1.3.1. 
         CIV = Coeficiente que majora os esforços para considerar efeitos dinâmicos e vibrações do tráfego.
 
-    :param liv: Vão teórico da estrutura [m] - distância entre apoios para cálculo do impacto
+    :param liv: Vão teórico da estrutura [m] - distância entre apoios para cálculo do impacto. Aceita escalar ou array
     
     :return: Valor do coeficiente de impacto vertical (CIV)
     """
 
-    if liv < 10.0:
-        return 1.35  
-    elif 10.0 <= liv <= 200.0:
-        return 1 + 1.06 * (20 / (liv + 50))  
-    else:
-        return 1.0   
+    if np.ndim(liv) == 0:
+        if liv < 10.0:
+            return 1.35  
+        elif 10.0 <= liv <= 200.0:
+            return 1 + 1.06 * (20 / (liv + 50))  
+        else:
+            return 1.0   
+
+    liv = np.asarray(liv, dtype=float)
+    return np.where(liv < 10.0, 1.35, np.where(liv <= 200.0, 1 + 1.06 * (20 / (liv + 50)), 1.0))
 
 
 def momento_max_carga_permanente(p_gk: float, l: float) -> float:
@@ -281,7 +541,7 @@ def momento_max_carga_permanente(p_gk: float, l: float) -> float:
 def momento_max_carga_variavel(l: float, p_rodak: float, p_qk: float, a: float) -> float:
     """Calcula o momento fletor máximo M_q,k conforme expressão normativa para longarinas das Classes 30 e 45.
 
-    :param l: vão teórico da longarina [m]
+    :param l: vão teórico da longarina [m]. Aceita escalar ou array
     :param p_rodak: carga variável característica por roda [kN]
     :param p_qk: carga variável característica de multidão [kN/m]
     :param a: distância entre eixos [m]
@@ -290,11 +550,13 @@ def momento_max_carga_variavel(l: float, p_rodak: float, p_qk: float, a: float)
     """
     
     m_qk = (3 * p_rodak * l) / 4 - p_rodak * a
-    if l > 6:
-        c = (l - 4 * a) / 2
-        m_qk += p_qk * c**2 / 2
-        
-    return m_qk
+    c = (l - 4 * a) / 2
+    if np.ndim(l) == 0:
+        if l > 6:
+            m_qk += p_qk * c**2 / 2
+        return m_qk
+
+    return m_qk + np.where(np.asarray(l) > 6, p_qk * c**2 / 2, 0.0)
 
 
 def cortante_max_carga_permanente(p_gk: float, l: float) -> float:
@@ -390,6 +652,32 @@ def reacao_apoio_carga_variavel(l: float, p_rodak: float, p_qk: float, a: float)
     return r_qk
 
 
+TRADUCAO_CLASSE_CARREGAMENTO = {
+                                    "dead": "permanente",
+                                    "long-therm": "longa duração",
+                                    "medium-therm": "média duração",
+                                    "short-therm": "curta duração",
+                                    "instantaneous": "instantânea",
+                                }
+TRADUCAO_CLASSE_MADEIRA = {
+                                "natural wood": "madeira natural",
+                                "engineered wood": "madeira recomposta",
+                            }
+KMOD1_TABELA = {
+                    'permanente': {'madeira natural': 0.60, 'madeira recomposta': 0.30},
+                    'longa duração': {'madeira natural': 0.70, 'madeira recomposta': 0.45},
+                    'média duração': {'madeira natural': 0.80, 'madeira recomposta': 0.55},
+                    'curta duração': {'madeira natural': 0.90, 'madeira recomposta': 0.65},
+                    'instantânea': {'madeira natural': 1.10, 'madeira recomposta': 1.10}
+                }
+KMOD2_TABELA = {
+                    1: {'madeira natural': 1.00, 'madeira recomposta': 1.00},
+                    2: {'madeira natural': 0.90, 'madeira recomposta': 0.95},
+                    3: {'madeira natural': 0.80, 'madeira recomposta': 0.93},
+                    4: {'madeira natural': 0.70, 'madeira recomposta': 0.90}
+                }
+
+
 def k_mod_madeira(classe_carregamento: str, classe_madeira: str, classe_umidade: int) -> tuple[float, float, float]:
     """Retorna o coeficiente de modificação kmod para madeira conforme NBR 7190:1997.
 
@@ -403,35 +691,10 @@ def k_mod_madeira(classe_carregamento: str, classe_madeira: str, classe_umidade:
     """
 
     # Conversão para língua pt
-    if classe_carregamento == "dead":
-        classe_carregamento = "permanente"
-    elif classe_carregamento == "long-therm":
-        classe_carregamento = "longa duração"
-    elif classe_carregamento == "medium-therm":
-        classe_carregamento = "média duração"
-    elif classe_carregamento == "short-therm":
-        classe_carregamento = "curta duração"
-    elif classe_carregamento == "instantaneous":
-        classe_carregamento = "instantânea"
-    if classe_madeira == "natural wood":
-        classe_madeira = "madeira natural"
-    elif classe_madeira == "engineered wood":
-        classe_madeira = "madeira recomposta"
-    kmod1_tabela = {
-                        'permanente': {'madeira natural': 0.60, 'madeira recomposta': 0.30},
-                        'longa duração': {'madeira natural': 0.70, 'madeira recomposta': 0.45},
-                        'média duração': {'madeira natural': 0.80, 'madeira recomposta': 0.55},
-                        'curta duração': {'madeira natural': 0.90, 'madeira recomposta': 0.65},
-                        'instantânea': {'madeira natural': 1.10, 'madeira recomposta': 1.10}
-                    }
-    kmod2_tabela = {
-                        1: {'madeira natural': 1.00, 'madeira recomposta': 1.00},
-                        2: {'madeira natural': 0.90, 'madeira recomposta': 0.95},
-                        3: {'madeira natural': 0.80, 'madeira recomposta': 0.93},
-                        4: {'madeira natural': 0.70, 'madeira recomposta': 0.90}
-                    }
-    k_mod1 = kmod1_tabela[classe_carregamento][classe_madeira]
-    k_mod2 = kmod2_tabela[classe_umidade][classe_madeira]
+    classe_carregamento = TRADUCAO_CLASSE_CARREGAMENTO.get(classe_carregamento, classe_carregamento)
+    classe_madeira = TRADUCAO_CLASSE_MADEIRA.get(classe_madeira, classe_madeira)
+    k_mod1 = KMOD1_TABELA[classe_carregamento][classe_madeira]
+    k_mod2 = KMOD2_TABELA[classe_umidade][classe_madeira]
     k_mod = k_mod1 * k_mod2
 
     return k_mod1, k_mod2, k_mod
@@ -499,8 +762,8 @@ def checagem_tensoes_normais(
 
     verif_1 = (sigma_x + k_m * sigma_y) - f_md
     verif_2 = (sigma_y + k_m * sigma_x) - f_md
-    g = max(verif_1/f_md, verif_2/f_md)
-    analise = 'OK' if g <= 0 else 'N OK'
+    g = np.maximum(verif_1/f_md, verif_2/f_md)
+    analise = _analise(g)
 
     return g, analise
 
@@ -640,7 +903,7 @@ def checagem_cisalhamento_viga(
                 "tau_sd [kPa]": tau_sd,
                 "g_otimiz [-]": g,
                 "g_confia [kPa]": f_vd - tau_sd,
-                "analise": 'OK' if g <= 0 else 'N OK',
+                "analise": _analise(g),
             }
 
 
@@ -681,7 +944,7 @@ def checagem_flecha_viga(
     delta_sd_2 = delta_qk
     lim_2 = l / 360
     g_sd2 = (delta_sd_2 - lim_2) / lim_2
-    g_sd = max(g_sd1, g_sd2)
+    g_sd = np.maximum(g_sd1, g_sd2)
 
     return {
                 "delta_lim_total [m]": lim_1,
@@ -689,9 +952,9 @@ def checagem_flecha_viga(
                 "delta_fluencia [m]": delta_sd_1,
                 "delta_qk [m]": delta_sd_2,
                 "g_otimiz [-]": g_sd,
-                "g_confia [m]": max(lim_1 - delta_sd_1, lim_2 - delta_sd_2),
+                "g_confia [m]": np.maximum(lim_1 - delta_sd_1, lim_2 - delta_sd_2),
                 "of [-]": delta_sd_1/lim_1,
-                "analise": 'OK' if g_sd <= 0 else 'N OK',
+                "analise": _analise(g_sd),
             }
 
 
@@ -801,6 +1064,143 @@ def checagem_completa_longarina_madeira_flexao(geo: dict, p_gk: float, p_qk: flo
     return res_flex, res_cis, res_flecha, relat
 
 
+def invariantes_longarina(l: float, a: float) -> dict:
+    """Pré-calcula as parcelas da longarina que só dependem do vão e do trem-tipo (CIV, braços de momento, coeficientes de flecha e limites), para serem reaproveitadas por checagem_longarina_madeira_vetorizada.
+
+    :param l: Comprimento do vão [m]. Aceita escalar ou array
+    :param a: distância entre eixos [m]
+
+    :return: Invariantes com as seguintes chaves:
+                "l [m]": vão,
+                "coeficiente_impacto_vertical" e "aux_ci": CIV e fator 1 + 0.75 (CIV - 1),
+                "m_gk/p_gk [m2]": momento permanente por unidade de p_gk,
+                "m_qk/p_rodak [m]" e "m_qk/p_qk [m2]": momento variável por unidade de carga de roda e de multidão (sem CIV),
+                "v_gk/p_gk [m]": cortante permanente por unidade de p_gk,
+                "delta_gk.EI/p_gk [m4]" e "delta_qk.EI/p_rodak [m3]": flechas multiplicadas por E.I e divididas pela carga,
+                "delta_lim_total [m]" e "delta_lim_variavel [m]": limites de flecha
+    """
+
+    ci = coef_impacto_vertical(l)
+    c = (l - 4 * a) / 2
+    b = (l - 2 * a) / 2
+    if np.ndim(l) == 0:
+        m_multidao = c**2 / 2 if l > 6 else 0.0
+    else:
+        m_multidao = np.where(np.asarray(l) > 6, c**2 / 2, 0.0)
+
+    return {
+                "l [m]": l,
+                "coeficiente_impacto_vertical": ci,
+                "aux_ci": 1 + 0.75 * (ci - 1),
+                "m_gk/p_gk [m2]": l**2 / 8,
+                "m_qk/p_rodak [m]": 3 * l / 4 - a,
+                "m_qk/p_qk [m2]": m_multidao,
+                "v_gk/p_gk [m]": l / 2,
+                "delta_gk.EI/p_gk [m4]": 5 * l**4 / 384,
+                "delta_qk.EI/p_rodak [m3]": (l**3 + 2 * b * (3 * l**2 - 4 * b**2)) / 48,
+                "delta_lim_total [m]": l / 250,
+                "delta_lim_variavel [m]": l / 360,
+            }
+
+
+def checagem_longarina_madeira_vetorizada(
+                                            geo: dict,
+                                            p_gk: np.ndarray,
+                                            p_qk: np.ndarray,
+                                            p_rodak: np.ndarray,
+                                            a: float,
+                                            l: np.ndarray,
+                                            k_mod: float,
+                                            gamma_g: float,
+                                            gamma_q: float,
+                                            gamma_wf: float,
+                                            gamma_wc: float,
+                                            psi2: float,
+                                            phi: float,
+                                            f_mk: np.ndarray,
+                                            f_vk: np.ndarray,
+                                            e_modflex: np.ndarray,
+                                            invariantes: dict = None,
+                                            props: dict = None,
+                                        ) -> dict:
+    """Versão em lote de checagem_completa_longarina_madeira_flexao. Todas as entradas podem ser escalares ou arrays que se difundem entre si (geometria, cargas e propriedades da madeira).
+
+    :param geo: Parâmetros geométricos das seções transversais. Se retangular: Chaves: 'b_w' e 'h' [m]. Se circular: Chave: 'd' [m]
+    :param p_gk: Carga permanente característica, uniformemente distribuída [kN/m] na longarina
+    :param p_qk: Carga variável característica de multidão [kPa]
+    :param p_rodak: carga variável característica por roda [kN]
+    :param a: distância entre eixos [m]
+    :param l: Comprimento do vão [m]
+    :param k_mod: Coeficiente de modificação da resistência da madeira (ver k_mod_madeira)
+    :param gamma_g: Coeficiente parcial de segurança para carga permanente
+    :param gamma_q: Coeficiente parcial de segurança para carga variável
+    :param gamma_wf: Coeficiente parcial de segurança para madeira na flexão
+    :param gamma_wc: Coeficiente parcial de segurança para madeira no cisalhamento
+    :param psi2: Coeficiente de combinação para carga variável
+    :param phi: Coeficiente de fluencia para carga variável
+    :param f_mk: Resistência caracteristica à flexão [kPa]
+    :param f_vk: Resistência caracteristica ao cisalhamento [kPa]
+    :param e_modflex: Módulo de elasticidade à flexão [kPa]
+    :param invariantes: Saída de invariantes_longarina(l, a). Se None, é calculada a cada chamada
+    :param props: Propriedades da seção já calculadas (saída de prop_madeiras_vetorizado, por exemplo de uma tabela de catálogo). Se None, são calculadas a partir de geo
+
+    :return: Arrays com as seguintes chaves:
+                "g_flexao_otimiz [-]", "g_flexao_confia [kPa]", "u_flexao [-]": flexão no formato (S - R) / R, R - S e S / R,
+                "g_cisalhamento_otimiz [-]", "g_cisalhamento_confia [kPa]", "u_cisalhamento [-]": cisalhamento nos mesmos formatos,
+                "g_flecha_otimiz [-]", "g_flecha_confia [m]", "u_flecha [-]": flecha (pior entre total e variável) nos mesmos formatos,
+                "of [-]": Desempenho da viga em relação ao limite de flecha considerando fluência
+    """
+
+    # Propriedades da seção transversal e parcelas que só dependem do vão (CIV por partes e l > 6 via máscara)
+    props = prop_madeiras_vetorizado(geo) if props is None else props
+    area, w_x, i_x, k_m = props["area [m2]"], props["w_x [m3]"], props["i_x [m4]"], props["k_m"]
+    inv = invariantes_longarina(l, a) if invariantes is None else invariantes
+    l = inv["l [m]"]
+    aux_ci = inv["aux_ci"]
+
+    # Flexão
+    m_gk = p_gk * inv["m_gk/p_gk [m2]"]
+    m_qk = (p_rodak * inv["m_qk/p_rodak [m]"] + p_qk * inv["m_qk/p_qk [m2]"]) * aux_ci
+    m_sd = m_gk * gamma_g + m_qk * gamma_q
+    s_xd = m_sd / w_x
+    f_md = resistencia_calculo(f_mk, gamma_w=gamma_wf, k_mod=k_mod)
+    s_ef = np.maximum(s_xd, k_m * s_xd)
+
+    # Cisalhamento
+    if 'd' in geo:
+        h_ref, coef_tau = geo['d'], 4/3
+    else:
+        h_ref, coef_tau = geo['h'], 3/2
+    v_gk = p_gk * inv["v_gk/p_gk [m]"]
+    v_qk = cortante_max_carga_variavel(l, p_rodak, p_qk, a, h_ref) * aux_ci
+    v_sd = v_gk * gamma_g + v_qk * gamma_q
+    tau_sd = coef_tau * (v_sd / area)
+    f_vd = resistencia_calculo(f_vk, gamma_w=gamma_wc, k_mod=k_mod)
+
+    # Flecha total com fluência e flecha da carga variável
+    ei = e_modflex * i_x
+    delta_gk = p_gk * inv["delta_gk.EI/p_gk [m4]"] / ei
+    delta_qk = p_rodak * inv["delta_qk.EI/p_rodak [m3]"] / ei
+    delta_sd_1 = delta_gk + psi2 * (1 + phi) * delta_qk
+    lim_1 = inv["delta_lim_total [m]"]
+    lim_2 = inv["delta_lim_variavel [m]"]
+    g_sd1 = (delta_sd_1 - lim_1) / lim_1
+    g_sd2 = (delta_qk - lim_2) / lim_2
+
+    return {
+                "g_flexao_otimiz [-]": (s_ef - f_md) / f_md,
+                "g_flexao_confia [kPa]": f_md - s_xd,
+                "u_flexao [-]": s_ef / f_md,
+                "g_cisalhamento_otimiz [-]": (tau_sd - f_vd) / f_vd,
+                "g_cisalhamento_confia [kPa]": f_vd - tau_sd,
+                "u_cisalhamento [-]": tau_sd / f_vd,
+                "g_flecha_otimiz [-]": np.maximum(g_sd1, g_sd2),
+                "g_flecha_confia [m]": np.maximum(lim_1 - delta_sd_1, lim_2 - delta_qk),
+                "u_flecha [-]": np.maximum(delta_sd_1 / lim_1, delta_qk / lim_2),
+                "of [-]": delta_sd_1 / lim_1,
+            }
+
+
 def checagem_completa_tabuleiro_madeira_flexao(
                                                 geo: dict,
                                                 p_gtabk: float, 
@@ -871,6 +1271,196 @@ def checagem_completa_tabuleiro_madeira_flexao(
     return res_flex, relat
 
 
+def checagem_tabuleiro_madeira_flexao_vetorizada(
+                                                    geo: dict,
+                                                    p_gtabk: np.ndarray,
+                                                    p_rodak: np.ndarray,
+                                                    esp: np.ndarray,
+                                                    k_mod: float,
+                                                    gamma_g: float,
+                                                    gamma_q: float,
+                                                    gamma_w: float,
+                                                    f_mk: np.ndarray,
+                                                    props: dict = None,
+                                                ) -> dict:
+    """Versão em lote de checagem_completa_tabuleiro_madeira_flexao. Avalia a flexão de vários tabuleiros (b_w, h, esp, p_gtabk) de uma vez, sem montar relatórios.
+
+    :param geo: Parâmetros geométricos das seções transversais. Se retangular: Chaves: 'b_w' e 'h' [m]. Se circular: Chave: 'd' [m]
+    :param p_gtabk: Carga permanente característica, uniformemente distribuída [kN/m] no tabuleiro
+    :param p_rodak: carga variável característica por roda [kN]
+    :param esp: Espaçamento entre longarinas [m]
+    :param k_mod: Coeficiente de modificação da resistência da madeira (ver k_mod_madeira)
+    :param gamma_g: Coeficiente parcial de segurança para carga permanente
+    :param gamma_q: Coeficiente parcial de segurança para carga variável
+    :param gamma_w: Coeficiente parcial de segurança para madeira
+    :param f_mk: Resistência caracteristica à flexão [kPa]
+    :param props: Propriedades da seção já calculadas (saída de prop_madeiras_vetorizado). Se None, são calculadas a partir de geo
+
+    :return: Arrays com as chaves "g_flexao_otimiz [-]", "g_flexao_confia [kPa]" e "u_flexao [-]" (formatos (S - R) / R, R - S e S / R)
+    """
+
+    props = prop_madeiras_vetorizado(geo) if props is None else props
+    ci = coef_impacto_vertical(esp)
+    aux_ci = (1 + 0.75 * (ci - 1))
+
+    m_gk = momento_max_carga_permanente(p_gtabk, esp)
+    m_qk = momento_max_carga_variavel_tabuleiro(p_rodak, esp) * aux_ci
+    m_sd = m_gk * gamma_g + m_qk * gamma_q
+    s_xd = m_sd / props["w_x [m3]"]
+    s_ef = np.maximum(s_xd, props["k_m"] * s_xd)
+    f_md = resistencia_calculo(f_mk, gamma_w=gamma_w, k_mod=k_mod)
+
+    return {
+                "g_flexao_otimiz [-]": (s_ef - f_md) / f_md,
+                "g_flexao_confia [kPa]": f_md - s_xd,
+                "u_flexao [-]": s_ef / f_md,
+            }
+
+
+ESTADOS_LIMITE_CONFIA = ("flexao", "cisalhamento", "flecha", "flexao_tabuleiro")
+
+
+def estados_limite_confia(samples: np.ndarray, params: list) -> dict:
+    """Equações estado limite de confiabilidade (formato R - S, falha quando g <= 0) de um projeto para um lote de amostras das variáveis aleatórias, calculadas de uma vez pelos núcleos vetorizados (checagem_longarina_madeira_vetorizada e checagem_tabuleiro_madeira_flexao_vetorizada) com coeficientes parciais, psi2 e phi unitários. O tabuleiro é tomado como um piso contínuo de pranchas (peso próprio densidade_tab × h).
+
+    :param samples: Amostras (N, 9) nas unidades da planilha de entrada. Colunas: p_gk [kN/m²], p_rodak [kN], p_qk [kN/m²], f_mk da longarina [MPa], f_vk da longarina [MPa], e_modflex da longarina [GPa], f_mk do tabuleiro [MPa], densidade da longarina [kg/m³] e densidade do tabuleiro [kg/m³]
+    :param params: Parâmetros fixos [a [m], l [cm], classe_carregamento, classe_madeira, classe_umidade, d [cm], esp [cm], bw [cm], h [cm], ...]. d, esp, bw e h podem ser arrays (N,), um projeto por amostra. Entradas além da nona são ignoradas (ver obj_confia)
+
+    :return: Arrays (N,) com as chaves 'flexao' [kPa], 'cisalhamento' [kPa], 'flecha' [m] e 'flexao_tabuleiro' [kPa]
+    """
+
+    a, l, classe_carregamento, classe_madeira, classe_umidade, d_cm, esp_cm, bw_cm, h_cm = params[:9]
+    x = np.atleast_2d(np.asarray(samples, dtype=float))
+    p_gk            = x[:, 0]                                # [kPa]
+    p_rodak         = x[:, 1]                                # [kN]
+    p_qk            = x[:, 2]                                # [kPa]
+    f_mk_long       = x[:, 3] * 1E3                          # [kPa]
+    f_vk_long       = x[:, 4] * 1E3                          # [kPa]
+    e_modflex_long  = x[:, 5] * 1E6                          # [kPa]
+    f_mk_tab        = x[:, 6] * 1E3                          # [kPa]
+    densidade_long  = x[:, 7] * 9.81 / 1000.0                # [kN/m3]
+    densidade_tab   = x[:, 8] * 9.81 / 1000.0                # [kN/m3]
+    l               = float(l) / 100.0                       # [m]
+    d               = np.asarray(d_cm, dtype=float) / 100.0  # [m]
+    esp             = np.asarray(esp_cm, dtype=float) / 100.0  # [m]
+    bw              = np.asarray(bw_cm, dtype=float) / 100.0   # [m]
+    h               = np.asarray(h_cm, dtype=float) / 100.0    # [m]
+    k_mod           = k_mod_madeira(str(classe_carregamento).lower(), str(classe_madeira).lower(), classe_umidade)[2]
+
+    # Cargas permanentes na longarina (área de influência esp) e no tabuleiro
+    props_long = prop_madeiras_vetorizado({"d": d})
+    carga_area_tab = densidade_tab * h                                                            # [kPa]
+    p_gk_long = (p_gk + carga_area_tab) * esp + peso_proprio_longarina(densidade_long, props_long["area [m2]"])  # [kN/m]
+    p_gtabk = (p_gk + carga_area_tab) * bw                                                        # [kN/m]
+
+    res_l = checagem_longarina_madeira_vetorizada(
+                                                    {"d": d}, p_gk_long, p_qk, p_rodak, float(a), l, k_mod,
+                                                    1.0, 1.0, 1.0, 1.0, 1.0, 1.0,
+                                                    f_mk_long, f_vk_long, e_modflex_long, props=props_long,
+                                                )
+    res_t = checagem_tabuleiro_madeira_flexao_vetorizada(
+                                                            {"b_w": bw, "h": h}, p_gtabk, p_rodak, esp, k_mod,
+                                                            1.0, 1.0, 1.0, f_mk_tab,
+                                                        )
+
+    return {
+                "flexao": res_l["g_flexao_confia [kPa]"],
+                "cisalhamento": res_l["g_cisalhamento_confia [kPa]"],
+                "flecha": res_l["g_flecha_confia [m]"],
+                "flexao_tabuleiro": res_t["g_flexao_confia [kPa]"],
+            }
+
+
+def gradientes_estados_limite_confia(samples: np.ndarray, params: list) -> tuple[dict, dict]:
+    """Equações estado limite de estados_limite_confia e suas derivadas analíticas em relação às 9 variáveis aleatórias (nas unidades da planilha). Todas as solicitações são lineares nas cargas e nas densidades, e as flechas são inversamente proporcionais a e_modflex; na flecha vale o ramo ativo do máximo entre flecha total e variável.
+
+    :param samples: Amostras (N, 9) das variáveis aleatórias (ver estados_limite_confia)
+    :param params: Parâmetros fixos (ver estados_limite_confia; d, esp, bw e h podem ser arrays (N,))
+
+    :return: [0] Arrays g (N,) por estado limite (mesmas chaves de estados_limite_confia), [1] Gradientes dg/dx (N, 9) por estado limite
+    """
+
+    a, l, classe_carregamento, classe_madeira, classe_umidade, d_cm, esp_cm, bw_cm, h_cm = params[:9]
+    x = np.atleast_2d(np.asarray(samples, dtype=float))
+    g = estados_limite_confia(x, params)
+    n = x.shape[0]
+    l = float(l) / 100.0
+    d = np.broadcast_to(np.asarray(d_cm, dtype=float) / 100.0, (n,))
+    esp = np.broadcast_to(np.asarray(esp_cm, dtype=float) / 100.0, (n,))
+    bw = np.broadcast_to(np.asarray(bw_cm, dtype=float) / 100.0, (n,))
+    h = np.broadcast_to(np.asarray(h_cm, dtype=float) / 100.0, (n,))
+    a = float(a)
+    k_mod = k_mod_madeira(str(classe_carregamento).lower(), str(classe_madeira).lower(), classe_umidade)[2]
+    c_dens = 9.81 / 1000.0
+
+    # Derivadas das cargas permanentes em relação a p_gk, densidade_long e densidade_tab
+    props_long = prop_madeiras_vetorizado({"d": d})
+    area, w_x, i_x = props_long["area [m2]"], props_long["w_x [m3]"], props_long["i_x [m4]"]
+    dp_long = np.zeros((n, 9))
+    dp_long[:, 0], dp_long[:, 7], dp_long[:, 8] = esp, c_dens * area, c_dens * h * esp
+    dp_tab = np.zeros((n, 9))
+    dp_tab[:, 0], dp_tab[:, 8] = bw, c_dens * h * bw
+
+    # Flexão e cisalhamento da longarina: S linear nas cargas, R linear na resistência
+    inv = invariantes_longarina(l, a)
+    aux_ci = inv["aux_ci"]
+    dm = dp_long * inv["m_gk/p_gk [m2]"]
+    dm[:, 1] += inv["m_qk/p_rodak [m]"] * aux_ci
+    dm[:, 2] += inv["m_qk/p_qk [m2]"] * aux_ci
+    dg_flexao = -dm / w_x[:, None]
+    dg_flexao[:, 3] = 1E3 * k_mod
+
+    dv = dp_long * inv["v_gk/p_gk [m]"]
+    dv[:, 1] += cortante_max_carga_variavel(l, 1.0, 0.0, a, d) * aux_ci
+    dv[:, 2] += cortante_max_carga_variavel(l, 0.0, 1.0, a, d) * aux_ci
+    dg_cisalhamento = -(4/3) * dv / area[:, None]
+    dg_cisalhamento[:, 4] = 1E3 * k_mod
+
+    # Flecha: ramo total (delta_gk + psi2 (1 + phi) delta_qk, com psi2 = phi = 1) ou variável (delta_qk)
+    ei = x[:, 5] * 1E6 * i_x
+    p_gk_long = (x[:, 0] + c_dens * x[:, 8] * h) * esp + c_dens * x[:, 7] * area
+    delta_gk = p_gk_long * inv["delta_gk.EI/p_gk [m4]"] / ei
+    delta_qk = x[:, 1] * inv["delta_qk.EI/p_rodak [m3]"] / ei
+    d_total = -dp_long * inv["delta_gk.EI/p_gk [m4]"] / ei[:, None]
+    d_total[:, 1] = -2.0 * inv["delta_qk.EI/p_rodak [m3]"] / ei
+    d_total[:, 5] = (delta_gk + 2.0 * delta_qk) / x[:, 5]
+    d_variavel = np.zeros((n, 9))
+    d_variavel[:, 1] = -inv["delta_qk.EI/p_rodak [m3]"] / ei
+    d_variavel[:, 5] = delta_qk / x[:, 5]
+    ramo_total = (inv["delta_lim_total [m]"] - delta_gk - 2.0 * delta_qk) >= (inv["delta_lim_variavel [m]"] - delta_qk)
+    dg_flecha = np.where(ramo_total[:, None], d_total, d_variavel)
+
+    # Flexão do tabuleiro (vão esp)
+    ci_tab = coef_impacto_vertical(esp)
+    dm_tab = dp_tab * momento_max_carga_permanente(1.0, esp)[:, None]
+    dm_tab[:, 1] += momento_max_carga_variavel_tabuleiro(1.0, esp) * (1 + 0.75 * (ci_tab - 1))
+    dg_tabuleiro = -dm_tab / prop_madeiras_vetorizado({"b_w": bw, "h": h})["w_x [m3]"][:, None]
+    dg_tabuleiro[:, 6] = 1E3 * k_mod
+
+    return g, {
+                    "flexao": dg_flexao,
+                    "cisalhamento": dg_cisalhamento,
+                    "flecha": dg_flecha,
+                    "flexao_tabuleiro": dg_tabuleiro,
+                }
+
+
+def obj_confia(samples: np.ndarray, params: list) -> np.ndarray:
+    """Modelo de confiabilidade (PythonModel do UQpy ou chamada direta): mapeia um lote de amostras (N, 9) nos valores da equação estado limite escolhida, sem laço por amostra.
+
+    :param samples: Amostras (N, 9) das variáveis aleatórias (ver estados_limite_confia)
+    :param params: Parâmetros fixos [a, l, classe_carregamento, classe_madeira, classe_umidade, d_cm, esp_cm, bw_cm, h_cm, tipo_g], com tipo_g em 'flexao', 'cisalhamento', 'flecha' ou 'flexao_tabuleiro'
+
+    :return: Equação estado limite g (N,) (falha quando g <= 0)
+    """
+
+    tipo_g = params[9]
+    if tipo_g not in ESTADOS_LIMITE_CONFIA:
+        raise ValueError(f"tipo_g deve ser um de {ESTADOS_LIMITE_CONFIA}")
+
+    return estados_limite_confia(samples, params)[tipo_g]
+
+
 def textos_design() -> dict:
     textos = {
                 "pt": {
@@ -1047,6 +1637,9 @@ def textos_pre_sizing_l() -> dict:
                         "tabuleiro_t": "Tabuleiro",
                         "restricoes_packing": "Restrições de espaçamento das peças",
                         "botao_dados_down": "Baixar dados do pré-dimensionamento",
+                        "aquecer_frente": "Partir da última fronteira eficiente calculada (quando houver)",
+                        "tempo_max_nsga": "Tempo máximo da otimização (s). Ao atingir o limite, a fronteira atual é devolvida (0 = sem limite)",
+                        "progresso_nsga": "Geração {geracao} · {avaliacoes} avaliações · hipervolume {hipervolume:.4g} · tempo restante estimado até {eta:.0f} s",
                         "tag_y_fig": r'$\frac{\delta_{\text{total}}}{L/250}$',
                         "tag_x_fig": "Volume de madeira ($m^3$)",
                     },
@@ -1129,6 +1722,9 @@ def textos_pre_sizing_l() -> dict:
                     "tabuleiro_t": "Deck",
                     "restricoes_packing": "Element spacing constraints",
                     "botao_dados_down": "Download preliminary design data",
+                    "aquecer_frente": "Start from the last computed efficient frontier (when available)",
+                    "tempo_max_nsga": "Maximum optimization time (s). When it is reached, the current frontier is returned (0 = no limit)",
+                    "progresso_nsga": "Generation {geracao} · {avaliacoes} evaluations · hypervolume {hipervolume:.4g} · estimated time left up to {eta:.0f} s",
                     "tag_y_fig": r'$\frac{\delta_{\text{total}}}{L/250}$',
                     "tag_x_fig": "Timber volume ($m^3$)",
                 },
@@ -1323,7 +1919,7 @@ def markdown_para_pdf(conteudo_md, output_filename=None):
 
 
 # Otimização estrutural
-class ProjetoOtimo(ElementwiseProblem):
+class ProjetoOtimo(Problem):
     def __init__(
                     self,
                     bw_pista: float,
@@ -1358,7 +1954,13 @@ class ProjetoOtimo(ElementwiseProblem):
                     n_min_tab: float,
                     n_max_tab: float,
                     n_checagens: int = 10,
-                    perc_robustez: float = 5.0
+                    perc_robustez: float = 5.0,
+                    estatistica_robustez: str = "media",
+                    quantil_robustez: float = 0.95,
+                    semente_robustez: int = 1,
+                    tamanho_cache: int = 0,
+                    limite_rejeicao: float = None,
+                    catalogo: dict = None
                 ):
         """Inicialização das variáveis do problema de otimização/confiabilidade estrutural.
 
@@ -1389,12 +1991,18 @@ class ProjetoOtimo(ElementwiseProblem):
         :param bw_max: Largura máxima da viga do tabuleiro [cm]
         :param h_min: Altura mínima da viga do tabuleiro [cm]
         :param h_max: Altura máxima da viga do tabuleiro [cm]
-        :param n_min_long: Espaço mínimo de longarinas
-        :param n_max_long: Espaço máximo de longarinas
-        :param n_min_tab: Espaço mínimo de peças do tabuleiro
-        :param n_max_tab: Espaço máximo de peças do tabuleiro
-        :param n_checagens: Número de checagens para avaliação robusta na otimização
-        :param perc_robustez: Percentual de robustez para considerar na otimização [5 igual a 5%]
+        :param n_min_long: Espaço mínimo de longarinas [cm]
+        :param n_max_long: Espaço máximo de longarinas [cm]
+        :param n_min_tab: Espaço mínimo de peças do tabuleiro [cm]
+        :param n_max_tab: Espaço máximo de peças do tabuleiro [cm]
+        :param n_checagens: Número de checagens para avaliação robusta na otimização. Com 1 a avaliação é determinística
+        :param perc_robustez: Percentual de robustez para considerar na otimização [5 igual a 5%]. Cargas e propriedades da madeira variam uniformemente em ±perc_robustez
+        :param estatistica_robustez: 'media' ou 'quantil'. Estatística das restrições sobre as checagens robustas
+        :param quantil_robustez: Quantil das restrições quando estatistica_robustez = 'quantil'
+        :param semente_robustez: Semente dos números aleatórios comuns da avaliação robusta
+        :param tamanho_cache: Número máximo de projetos guardados no cache LRU de avaliações (só projetos idênticos reaproveitam a avaliação). Com 0 o cache fica desligado
+        :param limite_rejeicao: Violação das restrições de espaçamento (g5, g6) acima da qual o projeto é rejeitado sem as verificações estruturais (g1..g4 = np.inf, ver avaliar_lote). Com np.inf só são rejeitados os arranjos impossíveis (sobra < 0). Se None, todos os projetos são verificados
+        :param catalogo: Catálogo comercial de peças com chaves 'd [cm]', 'bw [cm]' e 'h [cm]'. Quando informado, as três primeiras variáveis de projeto passam a ser índices inteiros do catálogo (só entram os itens dentro dos limites) e as propriedades das seções vêm de uma tabela pré-calculada
         """
 
         self.bw_pista               = float(bw_pista)
@@ -1424,32 +2032,97 @@ class ProjetoOtimo(ElementwiseProblem):
         self.bw_max                 = float(bw_max)
         self.h_min                  = float(h_min)
         self.h_max                  = float(h_max)
-        self.n_min_long             = int(n_min_long)
-        self.n_max_long             = int(n_max_long)
-        self.n_min_tab              = int(n_min_tab)
-        self.n_max_tab              = int(n_max_tab)
+        self.n_min_long             = float(n_min_long)
+        self.n_max_long             = float(n_max_long)
+        self.n_min_tab              = float(n_min_tab)
+        self.n_max_tab              = float(n_max_tab)
         self.n_checagens            = int(n_checagens)
         self.perc_robustez          = float(perc_robustez)
+        self.estatistica_robustez   = estatistica_robustez
+        self.quantil_robustez       = float(quantil_robustez)
+        if estatistica_robustez not in ("media", "quantil"):
+            raise ValueError("estatistica_robustez deve ser 'media' ou 'quantil'")
+
+        # Cache LRU de avaliações chaveado pelo vetor (d, bw, h, esp_long, esp_tab) exato
+        self.tamanho_cache          = int(tamanho_cache)
+        self.cache                  = OrderedDict()
+        self.cache_acertos          = 0
+        self.cache_falhas           = 0
+
+        # Rejeição antecipada pelas restrições geométricas (ver avaliar_lote)
+        self.limite_rejeicao        = None if limite_rejeicao is None else float(limite_rejeicao)
+
+        # Executor para avaliação paralela da população (ver chamando_nsga2)
+        self.executor               = None
+        self.n_workers              = 1
+
+        # Invariantes do problema: não dependem do indivíduo avaliado e são calculados uma única vez
+        l_m = self.l / 100.0
+        self.invariantes = {
+                                "l [m]": l_m,
+                                "bw_pista [m]": self.bw_pista / 100.0,
+                                "esp_min_long [cm]": self.n_min_long,
+                                "esp_max_long [cm]": self.n_max_long,
+                                "esp_min_tab [cm]": self.n_min_tab,
+                                "esp_max_tab [cm]": self.n_max_tab,
+                                "k_mod": k_mod_madeira(str(classe_carregamento).lower(), str(classe_madeira).lower(), classe_umidade)[2],
+                                "f_mk_long [kPa]": self.f_mk_long * 1E3,
+                                "f_vk_long [kPa]": self.f_vk_long * 1E3,
+                                "e_modflex_long [kPa]": self.e_modflex_long * 1E6,
+                                "f_mk_tab [kPa]": self.f_mk_tab * 1E3,
+                                "densidade_long [kN/m3]": self.densidade_long * 9.81 / 1000.0,
+                                "densidade_tab [kN/m3]": self.densidade_tab * 9.81 / 1000.0,
+                                "longarina": invariantes_longarina(l_m, self.a),
+                            }
+
+        # Números aleatórios comuns: os mesmos fatores de perturbação valem para toda a população e todas as gerações.
+        # Colunas: p_gk, p_rodak, p_qk, f_mk_long, f_vk_long, e_modflex_long, f_mk_tab, densidade_long, densidade_tab
+        self.fatores_robustez = None
+        if self.n_checagens > 1:
+            rng = np.random.default_rng(semente_robustez)
+            self.fatores_robustez = 1.0 + (self.perc_robustez / 100.0) * rng.uniform(-1.0, 1.0, size=(self.n_checagens, 9))
         xl = np.array([d_min, bw_min, h_min, n_min_long, n_min_tab], dtype=float)
         xu = np.array([d_max, bw_max, h_max, n_max_long, n_max_tab], dtype=float)
 
+        # Modo catálogo: d, bw e h viram índices da tabela de seções comerciais dentro dos limites
+        self.tabela_catalogo = None
+        if catalogo is not None:
+            self.tabela_catalogo = tabela_secoes_catalogo(
+                                                            [v for v in catalogo["d [cm]"] if d_min <= v <= d_max],
+                                                            [v for v in catalogo["bw [cm]"] if bw_min <= v <= bw_max],
+                                                            [v for v in catalogo["h [cm]"] if h_min <= v <= h_max],
+                                                        )
+            n_itens = [len(self.tabela_catalogo[k]) for k in ("d [cm]", "bw [cm]", "h [cm]")]
+            if min(n_itens) == 0:
+                raise ValueError("O catálogo não possui d, bw e h dentro dos limites informados")
+            xl[:3] = 0.0
+            xu[:3] = np.array(n_itens, dtype=float) - 1.0
+
         super().__init__(
                             n_var        = 5,
                             n_obj        = 2,
                             n_ieq_constr = 6,
                             xl           = xl,
                             xu           = xu,
-                            elementwise_evaluation=True
+                            elementwise  = False,
+                            exclude_from_serialization = ["executor", "cache"]
                         )
 
-    def calcular_objetivos_restricoes_otimizacao(self, d: float, bw: float, h: float, n_long: float, n_tab: float) -> tuple[list, list, dict, dict, dict, dict, dict, dict, dict]:
-        """Determina os objetivos e restrições do problema de otimização.
+    def __setstate__(self, state):
+        # Executor e cache não são serializados (checkpoints e trabalhadores em processos recebem um cache vazio)
+        self.__dict__.update(state)
+        if self.cache is None:
+            self.cache = OrderedDict()
+
+    def calcular_objetivos_restricoes_otimizacao(self, d: float, bw: float, h: float, n_long: float, n_tab: float, fatores: np.ndarray = None) -> tuple[list, list, dict, dict, dict, dict, dict, dict, dict]:
+        """Determina os objetivos e restrições do problema de otimização. As variáveis de projeto podem ser escalares (um projeto) ou arrays de mesmo tamanho (população inteira).
 
         :param d: Diâmetro da longarina [cm]
         :param bw: Largura da viga do tabuleiro [cm]
         :param h: Altura da viga do tabuleiro [cm]
-        :param n_long: Espaçamento entre longarinas
-        :param n_tab: Espaçamento entre peças do tabuleiro
+        :param n_long: Espaçamento entre longarinas [cm]
+        :param n_tab: Espaçamento entre peças do tabuleiro [cm]
+        :param fatores: Fatores multiplicativos (n_cenarios, 9) para p_gk, p_rodak, p_qk, f_mk_long, f_vk_long, e_modflex_long, f_mk_tab, densidade_long e densidade_tab. Os resultados ganham um eixo inicial com os cenários
 
         :return:    [0] Lista com os objetivos. f0 área total de madeira [m³], f1 desempenho da longarina na verificação de flecha (aqui o valor já vem corrigido para maximização)
                     [1] Lista com as restrições
@@ -1462,38 +2135,46 @@ class ProjetoOtimo(ElementwiseProblem):
                     [8] Dicionário com o relatório das cargas atuantes
         """
 
+        # Fatores de perturbação (avaliação robusta), um cenário por linha
+        if fatores is None:
+            fat = [1.0] * 9
+        else:
+            fatores = np.asarray(fatores, dtype=float)
+            fat = [fatores[:, [i]] for i in range(9)]
+
+        # Restrição de preenchimento do espaço disponível para longarina e tabuleiro. restringir_espaco só depende de razões
+        # entre comprimentos, então a verificação é feita em cm, na mesma escala das variáveis de projeto e de seus limites
+        if np.ndim(d) == 0:
+            g5, num_longs = restringir_espaco(n_long, self.n_min_long, self.n_max_long, self.bw_pista, d)
+            g6, num_tabss = restringir_espaco(n_tab, self.n_min_tab, self.n_max_tab, self.l, bw)
+        else:
+            g5, g6, num_longs, num_tabss = self.restricoes_geometricas(d, bw, n_long, n_tab)
+
         # Conversão unidades e cálculo de cargas
+        p_gk            = self.p_gk * fat[0]                     # [kPa]
+        p_rodak         = self.p_rodak * fat[1]                  # [kN]
+        p_qk            = self.p_qk * fat[2]                     # [kPa]
         l               = self.l / 100.0                         # [m]
         bw_pista        = self.bw_pista / 100.0                  # [m]
-        d               /= 100.0                                 # [m]
-        bw              /= 100.0                                 # [m]
-        h               /= 100.0                                 # [m]
-        esp_min_long    = self.n_min_long / 100.0                # [m]
-        esp_max_long    = self.n_max_long / 100.0                # [m]
-        esp_min_tab     = self.n_min_tab / 100.0                 # [m]
-        esp_max_tab     = self.n_max_tab / 100.0                 # [m]
-        n_long          = float(n_long)
-        n_tab           = float(n_tab)
-        f_mk_long       = self.f_mk_long *1E3                    # [kPa]
-        f_vk_long       = self.f_vk_long * 1E3                   # [kPa]
-        e_modflex_long  = self.e_modflex_long * 1E6              # [kPa]
-        f_mk_tab        = self.f_mk_tab * 1E3                    # [kPa]
-        densidade_long  = self.densidade_long * 9.81 / 1000.0    # [kN/m3]
-        densidade_tab   = self.densidade_tab * 9.81 / 1000.0     # [kN/m3]
+        d               = d / 100.0                              # [m]
+        bw              = bw / 100.0                             # [m]
+        h               = h / 100.0                              # [m]
+        n_long          = n_long / 100.0                         # [m]
+        f_mk_long       = self.f_mk_long * 1E3 * fat[3]          # [kPa]
+        f_vk_long       = self.f_vk_long * 1E3 * fat[4]          # [kPa]
+        e_modflex_long  = self.e_modflex_long * 1E6 * fat[5]     # [kPa]
+        f_mk_tab        = self.f_mk_tab * 1E3 * fat[6]           # [kPa]
+        densidade_long  = self.densidade_long * 9.81 / 1000.0 * fat[7] # [kN/m3]
+        densidade_tab   = self.densidade_tab * 9.81 / 1000.0 * fat[8] # [kN/m3]
 
         # Armazena o geometria
         geo_tab = {"b_w": bw, "h": h}
         geo_long = {"d": d}
 
-        # Restrição de preenchimento do espaço disponível para longarina e tabuleiro
-        g5, num_longs = restringir_espaco(n_long, esp_min_long, esp_max_long, bw_pista, d)
-        g6, num_tabss = restringir_espaco(n_tab, esp_min_tab, esp_max_tab, l, bw)
-
         # Carga permanente do tabuleiro que atua na longarina
         carga_area_tab = (densidade_tab * num_tabss * (h * bw * bw_pista)) / (bw_pista * l)  # [kPa]            
-        p_gk_long      = (self.p_gk + carga_area_tab) * n_long                               # [kN/m]
-        props_long     = prop_madeiras(geo_long)
-        area_long      = props_long[0]
+        p_gk_long      = (p_gk + carga_area_tab) * n_long                                    # [kN/m]
+        area_long      = prop_madeiras_vetorizado(geo_long)["area [m2]"]
         pp_gk_long     = peso_proprio_longarina(densidade_long, area_long)                   # [kN/m]
         p_gk_long      += pp_gk_long                                                         # [kN/m]
 
@@ -1501,8 +2182,8 @@ class ProjetoOtimo(ElementwiseProblem):
         res_m, res_v, res_f_total, relat_l = checagem_completa_longarina_madeira_flexao(
                                                                                             geo_long,
                                                                                             p_gk_long,
-                                                                                            self.p_qk,
-                                                                                            self.p_rodak,
+                                                                                            p_qk,
+                                                                                            p_rodak,
                                                                                             self.a,
                                                                                             l,
                                                                                             self.classe_carregamento.lower(),
@@ -1520,14 +2201,14 @@ class ProjetoOtimo(ElementwiseProblem):
                                                                                         )
 
         # Carga permanente do tabuleiro que atua no tabuleiro
-        p_gtabk = (carga_area_tab + self.p_gk) * bw
+        p_gtabk = (carga_area_tab + p_gk) * bw
         relat_carga = {"pp_tab [kPa]": carga_area_tab, "p_gtabk [kN/m]": p_gtabk, "pp_gk_long [kN/m]": pp_gk_long, "p_glongk [kN/m]": p_gk_long}
 
         # Avaliação do flexão tabuleiro
         res_m_tab, relat_t = checagem_completa_tabuleiro_madeira_flexao(
                                                                             geo_tab,
                                                                             p_gtabk,
-                                                                            self.p_rodak,
+                                                                            p_rodak,
                                                                             n_long,
                                                                             self.classe_carregamento.lower(),
                                                                             self.classe_madeira.lower(),
@@ -1539,8 +2220,7 @@ class ProjetoOtimo(ElementwiseProblem):
                                                                         )
         
         # Área de materiais empregados
-        props_tab = prop_madeiras(geo_tab)
-        area_tab = props_tab[0]
+        area_tab = prop_madeiras_vetorizado(geo_tab)["area [m2]"]
         f1 = num_longs * area_long * l + num_tabss * area_tab * bw_pista
         f2 = -res_f_total["of [-]"]
         g1 = res_m["g_otimiz [-]"]
@@ -1549,28 +2229,720 @@ class ProjetoOtimo(ElementwiseProblem):
         g4 = res_m_tab["g_otimiz [-]"]
 
         return [f1, f2], [g1, g2, g3, g4, g5, g6], res_m, res_v, res_f_total, relat_l, res_m_tab, relat_t, relat_carga
+
+    def calcular_objetivos_restricoes_enxuto(self, d: np.ndarray, bw: np.ndarray, h: np.ndarray, n_long: np.ndarray, n_tab: np.ndarray, fatores: np.ndarray = None, props_long: dict = None, props_tab: dict = None) -> tuple[list, list]:
+        """Versão enxuta de calcular_objetivos_restricoes_otimizacao para o laço de otimização: mesmos objetivos e restrições, calculados pelos núcleos vetorizados e sem montar os dicionários de relatório.
+
+        :param d: Diâmetro da longarina [cm]
+        :param bw: Largura da viga do tabuleiro [cm]
+        :param h: Altura da viga do tabuleiro [cm]
+        :param n_long: Espaçamento entre longarinas [cm]
+        :param n_tab: Espaçamento entre peças do tabuleiro [cm]
+        :param fatores: Fatores multiplicativos (n_cenarios, 9) da avaliação robusta, mesma convenção de calcular_objetivos_restricoes_otimizacao
+        :param props_long: Propriedades pré-calculadas das seções das longarinas (modo catálogo). Se None, são calculadas a partir de d
+        :param props_tab: Propriedades pré-calculadas das seções do tabuleiro (modo catálogo). Se None, são calculadas a partir de bw e h
+
+        :return:    [0] Lista com os objetivos [f1, f2]
+                    [1] Lista com as restrições [g1, g2, g3, g4, g5, g6]
+        """
+
+        # Fatores de perturbação (avaliação robusta), um cenário por linha
+        if fatores is None:
+            fat = [1.0] * 9
+        else:
+            fatores = np.asarray(fatores, dtype=float)
+            fat = [fatores[:, [i]] for i in range(9)]
+
+        # Restrição de preenchimento do espaço disponível para longarina e tabuleiro (em cm, ver restricoes_geometricas)
+        g5, g6, num_longs, num_tabss = self.restricoes_geometricas(d, bw, n_long, n_tab)
+
+        # Invariantes do problema e variáveis de projeto em m
+        inv             = self.invariantes
+        p_gk            = self.p_gk * fat[0]                                  # [kPa]
+        p_rodak         = self.p_rodak * fat[1]                               # [kN]
+        p_qk            = self.p_qk * fat[2]                                  # [kPa]
+        l               = inv["l [m]"]                                        # [m]
+        bw_pista        = inv["bw_pista [m]"]                                 # [m]
+        d               = np.asarray(d, dtype=float) / 100.0                  # [m]
+        bw              = np.asarray(bw, dtype=float) / 100.0                 # [m]
+        h               = np.asarray(h, dtype=float) / 100.0                  # [m]
+        n_long          = np.asarray(n_long, dtype=float) / 100.0             # [m]
+        f_mk_long       = inv["f_mk_long [kPa]"] * fat[3]                     # [kPa]
+        f_vk_long       = inv["f_vk_long [kPa]"] * fat[4]                     # [kPa]
+        e_modflex_long  = inv["e_modflex_long [kPa]"] * fat[5]                # [kPa]
+        f_mk_tab        = inv["f_mk_tab [kPa]"] * fat[6]                      # [kPa]
+        densidade_long  = inv["densidade_long [kN/m3]"] * fat[7]              # [kN/m3]
+        densidade_tab   = inv["densidade_tab [kN/m3]"] * fat[8]               # [kN/m3]
+        k_mod           = inv["k_mod"]
+
+        # Cargas permanentes na longarina e no tabuleiro
+        carga_area_tab = (densidade_tab * num_tabss * (h * bw * bw_pista)) / (bw_pista * l)  # [kPa]
+        props_long     = prop_madeiras_vetorizado({"d": d}) if props_long is None else props_long
+        area_long      = props_long["area [m2]"]
+        p_gk_long      = (p_gk + carga_area_tab) * n_long                                    # [kN/m]
+        p_gk_long      = p_gk_long + peso_proprio_longarina(densidade_long, area_long)       # [kN/m]
+        p_gtabk        = (carga_area_tab + p_gk) * bw                                        # [kN/m]
+
+        # Verificações da longarina e do tabuleiro
+        res_l = checagem_longarina_madeira_vetorizada(
+                                                        {"d": d}, p_gk_long, p_qk, p_rodak, self.a, l, k_mod,
+                                                        self.gamma_g, self.gamma_q, self.gamma_wf, self.gamma_wc,
+                                                        self.psi2, self.phi, f_mk_long, f_vk_long, e_modflex_long,
+                                                        invariantes=inv["longarina"], props=props_long,
+                                                    )
+        res_t = checagem_tabuleiro_madeira_flexao_vetorizada(
+                                                                {"b_w": bw, "h": h}, p_gtabk, p_rodak, n_long, k_mod,
+                                                                self.gamma_g, self.gamma_q, self.gamma_wf, f_mk_tab,
+                                                                props=props_tab,
+                                                            )
+
+        # Área de materiais empregados
+        f1 = num_longs * area_long * l + num_tabss * (bw * h) * bw_pista
+        f2 = -res_l["of [-]"]
+
+        return [f1, f2], [res_l["g_flexao_otimiz [-]"], res_l["g_cisalhamento_otimiz [-]"], res_l["g_flecha_otimiz [-]"], res_t["g_flexao_otimiz [-]"], g5, g6]
     
+    def restricoes_geometricas(self, d: np.ndarray, bw: np.ndarray, n_long: np.ndarray, n_tab: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Restrições de preenchimento do espaço (g5 e g6) e número de peças. Não dependem das cargas nem das propriedades da madeira, por isso valem para todos os cenários robustos. restringir_espaco só depende de razões entre comprimentos, então tudo é verificado em cm, a escala das variáveis de projeto e de seus limites xl/xu.
+
+        :param d: Diâmetro da longarina [cm]
+        :param bw: Largura da viga do tabuleiro [cm]
+        :param n_long: Espaçamento entre longarinas [cm]
+        :param n_tab: Espaçamento entre peças do tabuleiro [cm]
+
+        :return: [0] g5, [1] g6, [2] número de longarinas, [3] número de peças do tabuleiro
+        """
+
+        inv = self.invariantes
+        g5, num_longs, _ = restringir_espaco_vetorizado(n_long, inv["esp_min_long [cm]"], inv["esp_max_long [cm]"], self.bw_pista, d)
+        g6, num_tabss, _ = restringir_espaco_vetorizado(n_tab, inv["esp_min_tab [cm]"], inv["esp_max_tab [cm]"], self.l, bw)
+
+        return g5, g6, num_longs, num_tabss
+
+    def avaliar_lote(self, x: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Avalia objetivos e restrições de um lote de indivíduos (determinístico ou robusto). Com limite_rejeicao definido, as restrições geométricas são calculadas primeiro e as verificações estruturais só rodam nos projetos que não foram rejeitados. Nos rejeitados, g1..g4 recebem np.inf, que nunca é menor que a violação estrutural verdadeira: no NSGA-II eles ficam atrás de qualquer projeto verificado, mesmo de um com violação estrutural grande, e empatam entre si.
+
+        :param x: Matriz (n_individuos, 5) com d, bw, h, espaçamento das longarinas e espaçamento do tabuleiro [cm]
+
+        :return: [0] Matriz F (n_individuos, 2), [1] Matriz G (n_individuos, 6)
+        """
+
+        x, idx = self.decodificar_catalogo(x)
+        if self.limite_rejeicao is None:
+            return self._avaliar_lote_completo(x, idx)
+
+        # Restrições geométricas primeiro (baratas e independentes dos cenários robustos)
+        g5, g6, num_longs, num_tabss = self.restricoes_geometricas(x[:, 0], x[:, 1], x[:, 3], x[:, 4])
+        pior = np.maximum(g5, g6)
+        rejeitados = (pior > self.limite_rejeicao) | np.isposinf(pior)
+        if not rejeitados.any():
+            return self._avaliar_lote_completo(x, idx)
+
+        # Caminho rápido dos rejeitados: área de madeira exata, f2 nulo e as restrições estruturais não verificadas com violação infinita
+        inv = self.invariantes
+        d, bw, h = x[rejeitados, 0] / 100.0, x[rejeitados, 1] / 100.0, x[rejeitados, 2] / 100.0
+        f = np.empty((len(x), self.n_obj))
+        g = np.empty((len(x), self.n_ieq_constr))
+        f[rejeitados, 0] = num_longs[rejeitados] * prop_madeiras_vetorizado({"d": d})["area [m2]"] * inv["l [m]"] + num_tabss[rejeitados] * (bw * h) * inv["bw_pista [m]"]
+        f[rejeitados, 1] = 0.0
+        g[rejeitados, :4] = np.inf
+        g[rejeitados, 4] = g5[rejeitados]
+        g[rejeitados, 5] = g6[rejeitados]
+
+        # Verificações estruturais apenas nos projetos que ainda podem ser viáveis
+        aceitos = ~rejeitados
+        if aceitos.any():
+            f[aceitos], g[aceitos] = self._avaliar_lote_completo(x[aceitos], None if idx is None else [i[aceitos] for i in idx])
+
+        return f, g
+
+    def decodificar_catalogo(self, x: np.ndarray) -> tuple[np.ndarray, list]:
+        """Converte as variáveis do modo catálogo (índices de d, bw e h) nas dimensões das peças. Fora do modo catálogo, devolve as variáveis sem alteração.
+
+        :param x: Matriz (n_individuos, 5) com as variáveis de projeto
+
+        :return: [0] Matriz (n_individuos, 5) com d, bw, h, espaçamento das longarinas e espaçamento do tabuleiro [cm], [1] Índices inteiros [i_d, i_bw, i_h] no catálogo (None fora do modo catálogo)
+        """
+
+        x = np.array(x, dtype=float, ndmin=2)
+        if self.tabela_catalogo is None:
+            return x, None
+        idx = []
+        for j, chave in enumerate(("d [cm]", "bw [cm]", "h [cm]")):
+            valores = self.tabela_catalogo[chave]
+            i = np.clip(np.rint(x[:, j]), 0, len(valores) - 1).astype(int)
+            x[:, j] = valores[i]
+            idx.append(i)
+
+        return x, idx
+
+    def _avaliar_lote_completo(self, x: np.ndarray, idx: list = None) -> tuple[np.ndarray, np.ndarray]:
+        """Avaliação de avaliar_lote sem rejeição antecipada: todas as verificações para todos os indivíduos.
+
+        :param x: Matriz (n_individuos, 5) com as variáveis de projeto [cm]
+        :param idx: Índices [i_d, i_bw, i_h] no catálogo para buscar as propriedades das seções na tabela (ver decodificar_catalogo). Se None, as propriedades são calculadas
+
+        :return: [0] Matriz F (n_individuos, 2), [1] Matriz G (n_individuos, 6)
+        """
+
+        # Geometria da longarina, tabuleiro e espaçamentos (uma coluna por variável, uma linha por indivíduo)
+        x        = np.asarray(x, dtype=float)
+        d        = x[:, 0]
+        bw       = x[:, 1]
+        h        = x[:, 2]
+        esp_long = x[:, 3]
+        esp_tab  = x[:, 4]
+
+        # Modo catálogo: propriedades das seções por consulta à tabela
+        props = {}
+        if idx is not None:
+            tabela = self.tabela_catalogo
+            props["props_long"] = {k: v[idx[0]] for k, v in tabela["longarina"].items()}
+            props["props_tab"] = {k: v[idx[1], idx[2]] for k, v in tabela["tabuleiro"].items()}
+
+        # Avaliação determinística
+        if self.fatores_robustez is None:
+            f, g = self.calcular_objetivos_restricoes_enxuto(d, bw, h, esp_long, esp_tab, **props)
+            return np.stack(np.broadcast_arrays(*f), axis=-1), np.stack(np.broadcast_arrays(*g), axis=-1)
+
+        # Avaliação robusta: todos os cenários de uma vez, eixo 0 = cenário, eixo 1 = indivíduo
+        f, g = self.calcular_objetivos_restricoes_enxuto(d, bw, h, esp_long, esp_tab, fatores=self.fatores_robustez, **props)
+        n_cenarios = self.fatores_robustez.shape[0]
+        f = np.stack([np.broadcast_to(fi, (n_cenarios, d.size)) for fi in f], axis=-1)
+        g = np.stack([np.broadcast_to(gi, (n_cenarios, d.size)) for gi in g], axis=-1)
+        if self.estatistica_robustez == "quantil":
+            return f.mean(axis=0), np.quantile(g, self.quantil_robustez, axis=0)
+        return f.mean(axis=0), g.mean(axis=0)
+
+    def avaliar_lote_paralelo(self, x: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Avalia um lote de indivíduos no executor associado ao problema (ou em série, se não houver executor).
+
+        :param x: Matriz (n_individuos, 5) com as variáveis de projeto
+
+        :return: [0] Matriz F (n_individuos, 2), [1] Matriz G (n_individuos, 6)
+        """
+
+        # Execução serial
+        if self.executor is None or len(x) < 2 * self.n_workers:
+            return self.avaliar_lote(x)
+
+        # Execução paralela: a população é dividida em blocos entre os trabalhadores do executor (reaproveitado entre gerações)
+        blocos = np.array_split(np.asarray(x, dtype=float), self.n_workers)
+        if isinstance(self.executor, ProcessPoolExecutor):
+            resultados = list(self.executor.map(_avaliar_lote_trabalhador, blocos))
+        else:
+            resultados = list(self.executor.map(self.avaliar_lote, blocos))
+
+        return np.concatenate([r[0] for r in resultados], axis=0), np.concatenate([r[1] for r in resultados], axis=0)
+
+    def triagem_espaco_projeto(self, n_amostras: int = 1_000_000, metodo: str = "sobol", tamanho_bloco: int = 65_536, semente: int = 1, guardar_viaveis: bool = False) -> dict:
+        """Varredura vetorizada do espaço de projeto: amostra os limites xl/xu em blocos, filtra os projetos viáveis e mantém o conjunto não dominado exato. Serve como nuvem de soluções dominadas e como referência para validar a fronteira do NSGA-II.
+
+        :param n_amostras: Número de projetos avaliados. Em 'grade' é arredondado para o cubo perfeito mais próximo (mesmo número de pontos por variável)
+        :param metodo: 'sobol', 'lhs', 'grade' ou 'aleatorio'
+        :param tamanho_bloco: Número de projetos avaliados por vez (controla a memória)
+        :param semente: Semente das amostras
+        :param guardar_viaveis: Se True, devolve também todos os projetos viáveis (nuvem dominada)
+
+        :return: Dicionário com "X_pareto" e "F_pareto" (conjunto não dominado viável, f1 crescente), "n_avaliados", "n_viaveis" e, se pedido, "X_viaveis" e "F_viaveis"
+        """
+
+        xl, xu = np.asarray(self.xl, dtype=float), np.asarray(self.xu, dtype=float)
+        n_var = len(xl)
+        if metodo == "sobol":
+            gerador = qmc.Sobol(d=n_var, scramble=True, seed=semente)
+        elif metodo == "lhs":
+            gerador = qmc.LatinHypercube(d=n_var, seed=semente)
+        elif metodo == "aleatorio":
+            gerador = np.random.default_rng(semente)
+        elif metodo == "grade":
+            n_por_var = max(int(round(n_amostras ** (1.0 / n_var))), 2)
+            n_amostras = n_por_var ** n_var
+            niveis = np.linspace(0.0, 1.0, n_por_var)
+        else:
+            raise ValueError("metodo deve ser 'sobol', 'lhs', 'grade' ou 'aleatorio'")
+
+        x_pareto, f_pareto = np.zeros((0, n_var)), np.zeros((0, self.n_obj))
+        x_viaveis, f_viaveis = [], []
+        n_viaveis = 0
+        for inicio in range(0, n_amostras, tamanho_bloco):
+            n_bloco = min(tamanho_bloco, n_amostras - inicio)
+
+            # Amostras no hipercubo unitário, depois escaladas para os limites do problema
+            if metodo == "grade":
+                u = niveis[np.stack(np.unravel_index(np.arange(inicio, inicio + n_bloco), (n_por_var,) * n_var), axis=-1)]
+            elif metodo == "aleatorio":
+                u = gerador.random((n_bloco, n_var))
+            else:
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore", UserWarning)     # blocos que não são potência de 2 (Sobol)
+                    u = gerador.random(n_bloco)
+            x = qmc.scale(u, xl, xu)
+
+            # Avaliação do bloco e filtro de viabilidade
+            f, g = self.avaliar_lote_paralelo(x)
+            viavel = np.all(g <= 0.0, axis=1)
+            x, f = x[viavel], f[viavel]
+            n_viaveis += len(x)
+            if guardar_viaveis:
+                x_viaveis.append(x)
+                f_viaveis.append(f)
+
+            # Arquivo não dominado acumulado
+            x_pareto, f_pareto = np.vstack([x_pareto, x]), np.vstack([f_pareto, f])
+            idx = nao_dominados_2d(f_pareto)
+            x_pareto, f_pareto = x_pareto[idx], f_pareto[idx]
+
+        resultado = {
+                        "X_pareto": x_pareto,
+                        "F_pareto": f_pareto,
+                        "n_avaliados": n_amostras,
+                        "n_viaveis": n_viaveis,
+                    }
+        if guardar_viaveis:
+            resultado["X_viaveis"] = np.vstack(x_viaveis) if x_viaveis else np.zeros((0, n_var))
+            resultado["F_viaveis"] = np.vstack(f_viaveis) if f_viaveis else np.zeros((0, self.n_obj))
+
+        return resultado
+
+    def limites_pecas_cm(self) -> tuple[np.ndarray, np.ndarray]:
+        """Limites atuais de d, bw e h em cm (no modo catálogo, os itens da tabela correspondentes aos limites dos índices).
+
+        :return: [0] Limites inferiores [d, bw, h] [cm], [1] Limites superiores [d, bw, h] [cm]
+        """
+
+        if self.tabela_catalogo is None:
+            return self.xl[:3].astype(float), self.xu[:3].astype(float)
+        tabela = self.tabela_catalogo
+        chaves = ("d [cm]", "bw [cm]", "h [cm]")
+        lo = np.array([tabela[k][int(i)] for k, i in zip(chaves, self.xl[:3])])
+        hi = np.array([tabela[k][int(i)] for k, i in zip(chaves, self.xu[:3])])
+
+        return lo, hi
+
+    def projeto_minimo_viavel(self, n_larguras: int = 2, n_iter: int = 30) -> dict:
+        """Busca determinística do projeto viável de menor área de madeira, sem otimização evolutiva. Os números inteiros de longarinas e de peças do tabuleiro são enumerados (espaçamentos que fecham a conta de restringir_espaco) e, para cada combinação, as equações estado limite são resolvidas por bissecção: altura do tabuleiro pela flexão do tabuleiro (no maior vão possível) e diâmetro da longarina pela flexão, cisalhamento e flecha (com o peso do tabuleiro escolhido). Os candidatos finais são verificados pela avaliação completa do problema (inclusive robusta) e o de menor área é devolvido. Só são gerados arranjos com número inteiro de peças (sem a média entre os candidatos floor/ceil de restringir_espaco).
+
+        :param n_larguras: Número de larguras de peça do tabuleiro testadas por número de peças (entre a menor e a maior largura compatíveis com os espaçamentos)
+        :param n_iter: Número de bissecções por equação estado limite
+
+        :return: Dicionário com "viavel", "x" (variáveis de projeto do melhor projeto), "f" e "g" (objetivos e restrições), "candidatos_x" (todos os projetos viáveis encontrados, úteis para semear o NSGA-II) e "n_avaliacoes". Os espaçamentos x[3] e x[4] [cm] são os de espacamento_exato e, nos projetos viáveis, ficam dentro de [xl, xu]
+        """
+
+        # Geometria em cm, a escala das variáveis de projeto e de restricoes_geometricas
+        inv = self.invariantes
+        l, bw_pista = self.l, self.bw_pista
+        lo, hi = self.limites_pecas_cm()
+        n_avaliacoes = [0]
+
+        def avaliar(x):
+            n_avaliacoes[0] += len(x)
+            return self._avaliar_lote_completo(x)
+
+        e_lo, e_hi = inv["esp_min_long [cm]"], inv["esp_max_long [cm]"]
+        t_lo, t_hi = inv["esp_min_tab [cm]"], inv["esp_max_tab [cm]"]
+        resultado = {"viavel": False, "x": None, "f": None, "g": None, "candidatos_x": np.zeros((0, self.n_var)), "n_avaliacoes": 0}
+        if e_lo > e_hi or t_lo > t_hi:
+            return resultado
+
+        # Números de longarinas com algum diâmetro nos limites e espaçamento na faixa. Os limites superiores das peças
+        # ganham uma folga relativa para o ajuste de largura de espacamento_exato não sair de [xl, xu]
+        folga = 1.0 - 1e-10
+        d_min, d_max = lo[0], hi[0]
+        n_l = np.arange(2, int(np.floor((bw_pista + e_lo) / (d_min + e_lo))) + 1, dtype=float)
+        d_lo = np.maximum(d_min, (bw_pista - (n_l - 1) * e_hi) / n_l)
+        d_hi = np.minimum(d_max, (bw_pista - (n_l - 1) * e_lo) / n_l) * folga
+        n_l, d_lo, d_hi = n_l[d_lo <= d_hi], d_lo[d_lo <= d_hi], d_hi[d_lo <= d_hi]
+
+        # Números de peças do tabuleiro e larguras compatíveis
+        bw_min, bw_max = lo[1], hi[1]
+        n_t = np.arange(2, int(np.floor((l + t_lo) / (bw_min + t_lo))) + 1, dtype=float)
+        bw_lo = np.maximum(bw_min, (l - (n_t - 1) * t_hi) / n_t)
+        bw_hi = np.minimum(bw_max, (l - (n_t - 1) * t_lo) / n_t) * folga
+        n_t, bw_lo, bw_hi = n_t[bw_lo <= bw_hi], bw_lo[bw_lo <= bw_hi], bw_hi[bw_lo <= bw_hi]
+        if len(n_l) == 0 or len(n_t) == 0:
+            return resultado
+        fracoes = np.linspace(0.0, 1.0, n_larguras)
+        n_t = np.repeat(n_t, n_larguras)
+        bw_c = np.repeat(bw_lo, n_larguras) + np.tile(fracoes, len(bw_lo)) * np.repeat(bw_hi - bw_lo, n_larguras)
+        bw_c, esp_tab = espacamento_exato(l, n_t, bw_c)
+
+        # Tabuleiro: menor altura para cada (número de longarinas, peça do tabuleiro), no maior vão possível
+        i_l, i_t = (i.ravel() for i in np.meshgrid(np.arange(len(n_l)), np.arange(len(n_t)), indexing="ij"))
+        vao = (bw_pista - n_l * d_lo) / (n_l - 1)
+
+        def g_tabuleiro(h_cm):
+            x = np.column_stack([d_lo[i_l], bw_c[i_t], h_cm, vao[i_l], esp_tab[i_t]])
+            return avaliar(x)[1][:, 3]
+
+        h_c = bissecao_limite_inferior(g_tabuleiro, np.full(len(i_l), lo[2]), np.full(len(i_l), hi[2]), n_iter)
+        area_tab = np.where(np.isnan(h_c), np.inf, n_t[i_t] * bw_c[i_t] * h_c).reshape(len(n_l), len(n_t))
+        melhor_t = np.argmin(area_tab, axis=1)
+        tem_tab = np.isfinite(area_tab[np.arange(len(n_l)), melhor_t])
+        n_l, d_lo, d_hi, melhor_t = n_l[tem_tab], d_lo[tem_tab], d_hi[tem_tab], melhor_t[tem_tab]
+        h_sel = h_c.reshape(len(tem_tab), len(n_t))[tem_tab, melhor_t]
+        if len(n_l) == 0:
+            return resultado
+
+        # Longarina: menor diâmetro para cada número de longarinas com o tabuleiro escolhido
+        def projetos(d_cm):
+            d, esp_long = espacamento_exato(bw_pista, n_l, d_cm)
+            return np.column_stack([d, bw_c[melhor_t], h_sel, esp_long, esp_tab[melhor_t]])
+
+        d_c = bissecao_limite_inferior(lambda d_cm: avaliar(projetos(d_cm))[1][:, :3].max(axis=1), d_lo, d_hi, n_iter)
+        x = projetos(np.where(np.isnan(d_c), d_hi, d_c))[~np.isnan(d_c)]
+
+        # Modo catálogo: peças arredondadas para o item comercial seguinte e convertidas em índices
+        if self.tabela_catalogo is not None and len(x) > 0:
+            tabela = self.tabela_catalogo
+            idx = [np.searchsorted(tabela[k], x[:, j] - 1e-9) for j, k in enumerate(("d [cm]", "bw [cm]", "h [cm]"))]
+            cabe = np.all([i < len(tabela[k]) for i, k in zip(idx, ("d [cm]", "bw [cm]", "h [cm]"))], axis=0)
+            x, idx = x[cabe], [i[cabe] for i in idx]
+            n_lc = np.rint((bw_pista + x[:, 3]) / (x[:, 0] + x[:, 3]))
+            n_tc = np.rint((l + x[:, 4]) / (x[:, 1] + x[:, 4]))
+            x[:, 3] = espacamento_exato(bw_pista, n_lc, tabela["d [cm]"][idx[0]], ajustar_largura=False)[1]
+            x[:, 4] = espacamento_exato(l, n_tc, tabela["bw [cm]"][idx[1]], ajustar_largura=False)[1]
+            x[:, :3] = np.column_stack(idx)
+
+        # Verificação final pela avaliação completa do problema
+        if len(x) == 0:
+            return resultado
+        n_avaliacoes[0] += len(x)
+        f, g = self.avaliar_lote(x)
+        viavel = np.all(g <= 0.0, axis=1)
+        resultado["candidatos_x"] = x[viavel]
+        resultado["n_avaliacoes"] = n_avaliacoes[0]
+        if viavel.any():
+            i = np.flatnonzero(viavel)[np.argmin(f[viavel, 0])]
+            resultado.update({"viavel": True, "x": x[i], "f": f[i], "g": g[i]})
+
+        return resultado
+
+    def apertar_limites(self, n_esp: int = 64, aplicar: bool = False) -> dict:
+        """Aperta os limites inferiores de d, bw e h antes da otimização. As equações estado limite da longarina (flexão, cisalhamento e flecha) e do tabuleiro (flexão) são resolvidas para g = 0 por bissecção, com as demais variáveis nos valores mais favoráveis: menor espaçamento entre longarinas (largura de influência da longarina e vão do tabuleiro varrido em n_esp pontos entre xl[3] e xu[3]), peso do tabuleiro desprezado, maior peça na outra dimensão do tabuleiro e o cenário robusto mais favorável. Assim nenhum projeto viável é cortado. Os limites superiores não são alterados.
+
+        :param n_esp: Número de espaçamentos entre longarinas avaliados na busca do vão mais favorável do tabuleiro
+        :param aplicar: Se True, os limites apertados substituem self.xl. Se False, o problema não é alterado e os novos limites ficam só no relatório
+
+        :return: Dicionário por variável ('d [cm]', 'bw [cm]', 'h [cm]') com "original [cm]", "apertado [cm]" e "inviavel" (True quando nem o limite superior atende, caso em que o limite não é alterado), e "xl" com o vetor de limites inferiores apertados (índices no modo catálogo)
+        """
+
+        # Fatores dos cenários robustos (o mais favorável é escolhido pelo mínimo de g)
+        inv = self.invariantes
+        fat = [1.0] * 9 if self.fatores_robustez is None else [self.fatores_robustez[:, [i]] for i in range(9)]
+        k_mod = inv["k_mod"]
+        esp_long_min = self.xl[3] / 100.0                                   # [m]
+        esps_tab = np.linspace(self.xl[3], self.xu[3], n_esp) / 100.0       # [m]
+
+        def g_longarina(d_cm):
+            d = d_cm / 100.0
+            props = prop_madeiras_vetorizado({"d": d})
+            p_gk_long = self.p_gk * fat[0] * esp_long_min + peso_proprio_longarina(inv["densidade_long [kN/m3]"] * fat[7], props["area [m2]"])
+            res = checagem_longarina_madeira_vetorizada(
+                                                            {"d": d}, p_gk_long, self.p_qk * fat[2], self.p_rodak * fat[1], self.a, inv["l [m]"], k_mod,
+                                                            self.gamma_g, self.gamma_q, self.gamma_wf, self.gamma_wc, self.psi2, self.phi,
+                                                            inv["f_mk_long [kPa]"] * fat[3], inv["f_vk_long [kPa]"] * fat[4], inv["e_modflex_long [kPa]"] * fat[5],
+                                                            invariantes=inv["longarina"], props=props,
+                                                        )
+            g = np.maximum.reduce([res["g_flexao_otimiz [-]"], res["g_cisalhamento_otimiz [-]"], res["g_flecha_otimiz [-]"]])
+            return np.min(np.atleast_2d(g), axis=0)
+
+        def g_tabuleiro(bw_cm, h_cm):
+            bw, h = np.broadcast_arrays(np.asarray(bw_cm, dtype=float) / 100.0, np.asarray(h_cm, dtype=float) / 100.0)
+            g = np.full(bw.shape, np.inf)
+            for esp in esps_tab:
+                res = checagem_tabuleiro_madeira_flexao_vetorizada(
+                                                                        {"b_w": bw, "h": h}, self.p_gk * fat[0] * bw, self.p_rodak * fat[1], esp, k_mod,
+                                                                        self.gamma_g, self.gamma_q, self.gamma_wf, inv["f_mk_tab [kPa]"] * fat[6],
+                                                                    )
+                g = np.minimum(g, np.min(np.atleast_2d(res["g_flexao_otimiz [-]"]), axis=0))
+            return g
+
+        lo, hi = self.limites_pecas_cm()
+        novos = np.concatenate([
+                                    bissecao_limite_inferior(g_longarina, lo[[0]], hi[[0]]),
+                                    bissecao_limite_inferior(lambda bw: g_tabuleiro(bw, hi[2]), lo[[1]], hi[[1]]),
+                                    bissecao_limite_inferior(lambda h: g_tabuleiro(hi[1], h), lo[[2]], hi[[2]]),
+                                ])
+
+        relatorio = {}
+        xl = np.array(self.xl, dtype=float)
+        for j, chave in enumerate(("d [cm]", "bw [cm]", "h [cm]")):
+            inviavel = bool(np.isnan(novos[j]))
+            apertado = lo[j] if inviavel else float(novos[j])
+            if self.tabela_catalogo is None:
+                xl[j] = apertado
+            else:
+                xl[j] = float(min(np.searchsorted(self.tabela_catalogo[chave], apertado - 1e-9), self.xu[j]))
+                apertado = float(self.tabela_catalogo[chave][int(xl[j])])
+            relatorio[chave] = {"original [cm]": float(lo[j]), "apertado [cm]": apertado, "inviavel": inviavel}
+        relatorio["xl"] = xl
+        if aplicar:
+            self.xl = xl
+
+        return relatorio
+
+    def gradientes(self, x: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Gradientes analíticos da área de madeira (f1) e das restrições g1..g6 em relação às variáveis de projeto (d, bw, h, espaçamento das longarinas, espaçamento do tabuleiro). Todas as parcelas são fechadas (momentos, cortantes e flechas sobre W, A e I), então as derivadas seguem a regra da cadeia pelas cargas, inclusive o peso do tabuleiro sobre a longarina. Os números de peças de restringir_espaco são constantes por partes (derivada nula onde existe). Na avaliação robusta, o gradiente é a média (ou a interpolação do quantil) dos gradientes por cenário.
+
+        :param x: Matriz (n_individuos, 5) com d, bw, h, espaçamento das longarinas e espaçamento do tabuleiro [cm]
+
+        :return: [0] f1 (n_individuos,), [1] g (n_individuos, 6), [2] df1/dx (n_individuos, 5), [3] dg/dx (n_individuos, 6, 5)
+        """
+
+        if self.tabela_catalogo is not None:
+            raise ValueError("Gradientes não estão definidos no modo catálogo (variáveis discretas)")
+
+        x = np.array(x, dtype=float, ndmin=2)
+        inv = self.invariantes
+        lon = inv["longarina"]
+        fat = [1.0] * 9 if self.fatores_robustez is None else [self.fatores_robustez[:, [i]] for i in range(9)]
+        l, bw_pista, k_mod = inv["l [m]"], inv["bw_pista [m]"], inv["k_mod"]
+        d, bw, h = x[:, 0] / 100.0, x[:, 1] / 100.0, x[:, 2] / 100.0
+        e_long = x[:, 3] / 100.0
+        zeros = np.zeros_like(d)
+
+        # Restrições de espaçamento e números de peças (constantes por partes), em cm como em restricoes_geometricas; derivadas levadas para 1/m
+        g5, dg5_dd = derivada_restringir_espaco(x[:, 3], inv["esp_min_long [cm]"], inv["esp_max_long [cm]"], self.bw_pista, x[:, 0])
+        g6, dg6_dbw = derivada_restringir_espaco(x[:, 4], inv["esp_min_tab [cm]"], inv["esp_max_tab [cm]"], self.l, x[:, 1])
+        dg5_dd, dg6_dbw = dg5_dd * 100.0, dg6_dbw * 100.0
+        _, _, num_longs, num_tabss = self.restricoes_geometricas(x[:, 0], x[:, 1], x[:, 3], x[:, 4])
+
+        # Área de madeira
+        area = np.pi * d**2 / 4
+        darea_dd = np.pi * d / 2
+        f1 = num_longs * area * l + num_tabss * (bw * h) * bw_pista
+        df1 = np.stack([num_longs * darea_dd * l, num_tabss * h * bw_pista, num_tabss * bw * bw_pista, zeros, zeros], axis=-1)
+
+        # Cargas e suas derivadas em (d, bw, h, esp_long) [m]
+        p_gk, p_rodak, p_qk = self.p_gk * fat[0], self.p_rodak * fat[1], self.p_qk * fat[2]
+        dens_long = inv["densidade_long [kN/m3]"] * fat[7]
+        dens_tab = inv["densidade_tab [kN/m3]"] * fat[8]
+        carga_tab = dens_tab * num_tabss * h * bw / l
+        dcarga_dbw, dcarga_dh = dens_tab * num_tabss * h / l, dens_tab * num_tabss * bw / l
+        p_long = (p_gk + carga_tab) * e_long + dens_long * area
+        dp_long = [dens_long * darea_dd, e_long * dcarga_dbw, e_long * dcarga_dh, p_gk + carga_tab]
+        p_tab = (carga_tab + p_gk) * bw
+        dp_tab = [zeros, carga_tab + p_gk + bw * dcarga_dbw, bw * dcarga_dh, zeros]
+
+        # Longarina circular: W = pi d³/32, A = pi d²/4, I = pi d⁴/64
+        w_x, i_x = np.pi * d**3 / 32, np.pi * d**4 / 64
+        aux_ci = lon["aux_ci"]
+
+        # g1: flexão
+        f_md = resistencia_calculo(inv["f_mk_long [kPa]"] * fat[3], gamma_w=self.gamma_wf, k_mod=k_mod)
+        m_sd = self.gamma_g * p_long * lon["m_gk/p_gk [m2]"] + self.gamma_q * (p_rodak * lon["m_qk/p_rodak [m]"] + p_qk * lon["m_qk/p_qk [m2]"]) * aux_ci
+        s_xd = m_sd / w_x
+        g1 = (s_xd - f_md) / f_md
+        dg1 = [self.gamma_g * lon["m_gk/p_gk [m2]"] * dp / w_x / f_md for dp in dp_long]
+        dg1[0] = dg1[0] - 3 * s_xd / d / f_md
+
+        # g2: cisalhamento
+        f_vd = resistencia_calculo(inv["f_vk_long [kPa]"] * fat[4], gamma_w=self.gamma_wc, k_mod=k_mod)
+        e = l - 3 * self.a - 2 * d
+        v_qk = ((p_rodak / l) * (6 * self.a + 3 * e) + (p_qk * e**2) / (2 * l)) * aux_ci
+        dv_qk_dd = (-6 * p_rodak / l - 2 * p_qk * e / l) * aux_ci
+        v_sd = self.gamma_g * p_long * lon["v_gk/p_gk [m]"] + self.gamma_q * v_qk
+        tau_sd = (4 / 3) * v_sd / area
+        g2 = (tau_sd - f_vd) / f_vd
+        dg2 = [(4 / 3) * self.gamma_g * lon["v_gk/p_gk [m]"] * dp / area / f_vd for dp in dp_long]
+        dg2[0] = dg2[0] + ((4 / 3) * self.gamma_q * dv_qk_dd / area - 2 * tau_sd / d) / f_vd
+
+        # g3: flecha (pior entre total com fluência e variável)
+        ei = inv["e_modflex_long [kPa]"] * fat[5] * i_x
+        delta_gk = p_long * lon["delta_gk.EI/p_gk [m4]"] / ei
+        delta_qk = p_rodak * lon["delta_qk.EI/p_rodak [m3]"] / ei
+        delta_1 = delta_gk + self.psi2 * (1 + self.phi) * delta_qk
+        lim_1, lim_2 = lon["delta_lim_total [m]"], lon["delta_lim_variavel [m]"]
+        g_sd1, g_sd2 = (delta_1 - lim_1) / lim_1, (delta_qk - lim_2) / lim_2
+        g3 = np.maximum(g_sd1, g_sd2)
+        dg_sd1 = [lon["delta_gk.EI/p_gk [m4]"] * dp / ei / lim_1 for dp in dp_long]
+        dg_sd1[0] = dg_sd1[0] - 4 * delta_1 / d / lim_1
+        dg_sd2 = [zeros, zeros, zeros, zeros]
+        dg_sd2[0] = -4 * delta_qk / d / lim_2
+        dg3 = [np.where(g_sd1 >= g_sd2, a1, a2) for a1, a2 in zip(dg_sd1, dg_sd2)]
+
+        # g4: flexão do tabuleiro retangular (W = bw h²/6, vão = espaçamento das longarinas)
+        ci = coef_impacto_vertical(e_long)
+        dci = np.where((e_long >= 10.0) & (e_long <= 200.0), -1.06 * 20 / (e_long + 50) ** 2, 0.0)
+        aux_ci_tab = 1 + 0.75 * (ci - 1)
+        w_tab = bw * h**2 / 6
+        f_md_tab = resistencia_calculo(inv["f_mk_tab [kPa]"] * fat[6], gamma_w=self.gamma_wf, k_mod=k_mod)
+        m_sd_tab = self.gamma_g * p_tab * e_long**2 / 8 + self.gamma_q * (p_rodak / 4) * (e_long - 0.45) * aux_ci_tab
+        s_tab = m_sd_tab / w_tab
+        dg4 = [self.gamma_g * e_long**2 / 8 * dp / w_tab / f_md_tab for dp in dp_tab]
+        dg4[1] = dg4[1] - s_tab / bw / f_md_tab
+        dg4[2] = dg4[2] - 2 * s_tab / h / f_md_tab
+        dg4[3] = (self.gamma_g * p_tab * e_long / 4 + self.gamma_q * (p_rodak / 4) * (aux_ci_tab + (e_long - 0.45) * 0.75 * dci)) / w_tab / f_md_tab
+
+        # Tensão efetiva max(S, k_m S) da verificação do tabuleiro (k_m = 0,70 na seção retangular): vale k_m S com momento negativo
+        k_ef = np.where(s_tab >= 0.0, 1.0, 0.70)
+        g4 = (k_ef * s_tab - f_md_tab) / f_md_tab
+        dg4 = [k_ef * dgi for dgi in dg4]
+
+        # Montagem por cenário: (cenários, indivíduos, restrição, variável); todas as variáveis em cm
+        escala = 0.01
+        n_cen = 1 if self.fatores_robustez is None else self.fatores_robustez.shape[0]
+        forma = (n_cen, len(d))
+        def derivadas(dg_m, d_esp_tab=0.0):
+            colunas = [np.broadcast_to(c, forma) for c in dg_m] + [np.broadcast_to(d_esp_tab, forma)]
+            return np.stack(colunas, axis=-1) * escala
+        g_c = np.stack([np.broadcast_to(gi, forma) for gi in (g1, g2, g3, g4, g5, g6)], axis=-1)
+        dg_c = np.stack([
+                            derivadas(dg1),
+                            derivadas(dg2),
+                            derivadas(dg3),
+                            derivadas(dg4),
+                            derivadas([dg5_dd, zeros, zeros, zeros]),
+                            derivadas([zeros, dg6_dbw, zeros, zeros]),
+                        ], axis=2)
+
+        # Estatística sobre os cenários (mesma de avaliar_lote)
+        if self.fatores_robustez is None or self.estatistica_robustez == "media":
+            g, dg = g_c.mean(axis=0), dg_c.mean(axis=0)
+        else:
+            posicao = self.quantil_robustez * (n_cen - 1)
+            i_inf, peso = int(np.floor(posicao)), posicao - np.floor(posicao)
+            i_sup = min(i_inf + 1, n_cen - 1)
+            ordem = np.argsort(g_c, axis=0, kind="stable")
+            g_ord = np.take_along_axis(g_c, ordem, axis=0)
+            dg_ord = np.take_along_axis(dg_c, ordem[..., None], axis=0)
+            g = (1 - peso) * g_ord[i_inf] + peso * g_ord[i_sup]
+            dg = (1 - peso) * dg_ord[i_inf] + peso * dg_ord[i_sup]
+
+        return f1, g, df1 * escala, dg
+
+    def minimizar_area(self, x0: np.ndarray = None, metodo: str = "trust-constr", max_iter: int = 200, tolerancia: float = 1e-9) -> dict:
+        """Dimensionamento mono-objetivo: minimiza a área de madeira (f1) sujeita a g1..g6 <= 0 por programação quadrática sequencial ('SLSQP') ou região de confiança ('trust-constr'), com os gradientes analíticos de ProjetoOtimo.gradientes. Os números de peças do projeto inicial ficam fixos e os espaçamentos acompanham d e bw (espacamento_exato), assim f1 e g5/g6 deixam de ter os saltos de restringir_espaco e as variáveis do otimizador são apenas d, bw e h.
+
+        :param x0: Projeto inicial (5,). Se None, parte de projeto_minimo_viavel (ou do centro dos limites, se ele não encontrar projeto viável)
+        :param metodo: 'SLSQP' ou 'trust-constr'
+        :param max_iter: Número máximo de iterações do otimizador
+        :param tolerancia: Violação das restrições admitida na verificação final (o 'SLSQP' termina com as restrições ativas em g ≈ 0, com erro de arredondamento)
+
+        :return: Dicionário com "viavel", "x", "f" e "g" (verificados por avaliar_lote), "n_avaliacoes" (avaliações de objetivos/restrições com gradientes), "n_iteracoes" e "mensagem". Se o otimizador não melhorar o projeto inicial viável, o projeto inicial é devolvido
+        """
+
+        if metodo not in ("SLSQP", "trust-constr"):
+            raise ValueError("metodo deve ser 'SLSQP' ou 'trust-constr'")
+        if x0 is None:
+            inicial = self.projeto_minimo_viavel()
+            x0 = inicial["x"] if inicial["viavel"] else (self.xl + self.xu) / 2.0
+        x0 = np.asarray(x0, dtype=float).copy()
+        x0[:3] = np.clip(x0[:3], self.xl[:3], self.xu[:3])
+
+        # Números de peças fixos (os do projeto inicial) e espaçamentos como função de d e bw (tudo em cm)
+        l, bw_pista = self.l, self.bw_pista
+        n_l = max(np.rint((bw_pista + x0[3]) / (x0[0] + x0[3])), 2.0)
+        n_t = max(np.rint((l + x0[4]) / (x0[1] + x0[4])), 2.0)
+        def projeto(z):
+            d, esp_long = espacamento_exato(bw_pista, n_l, z[0])
+            bw, esp_tab = espacamento_exato(l, n_t, z[1])
+            return np.array([d, bw, z[2], esp_long, esp_tab])
+        jacobiano = np.zeros((5, 3))
+        jacobiano[0, 0], jacobiano[1, 1], jacobiano[2, 2] = 1.0, 1.0, 1.0
+        jacobiano[3, 0] = -n_l / (n_l - 1)
+        jacobiano[4, 1] = -n_t / (n_t - 1)
+
+        # Limites de d e bw que mantêm os espaçamentos dentro dos limites xl/xu (faixa de g5/g6)
+        z_lo = np.array([
+                            max(self.xl[0], (bw_pista - (n_l - 1) * self.xu[3]) / n_l),
+                            max(self.xl[1], (l - (n_t - 1) * self.xu[4]) / n_t),
+                            self.xl[2],
+                        ])
+        z_hi = np.array([
+                            min(self.xu[0], (bw_pista - (n_l - 1) * self.xl[3]) / n_l),
+                            min(self.xu[1], (l - (n_t - 1) * self.xl[4]) / n_t),
+                            self.xu[2],
+                        ])
+        z0 = np.clip(x0[:3], z_lo, np.maximum(z_lo, z_hi))
+
+        # Objetivo, restrições e gradientes calculados juntos e reaproveitados para o mesmo z
+        memoria = {"z": None, "n": 0}
+        def calcular(z):
+            if memoria["z"] is None or not np.array_equal(memoria["z"], z):
+                f1, g, df1, dg = self.gradientes(projeto(z))
+                memoria.update({"z": np.array(z), "f1": f1[0], "g": np.nan_to_num(g[0], posinf=1e6, neginf=-1e6), "df1": df1[0] @ jacobiano, "dg": dg[0] @ jacobiano})
+                memoria["n"] += 1
+            return memoria
+
+        limites = Bounds(z_lo, np.maximum(z_lo, z_hi))
+        if metodo == "SLSQP":
+            restricoes = [{"type": "ineq", "fun": lambda z: -calcular(z)["g"], "jac": lambda z: -calcular(z)["dg"]}]
+        else:
+            restricoes = [NonlinearConstraint(lambda z: calcular(z)["g"], -np.inf, 0.0, jac=lambda z: calcular(z)["dg"])]
+        res = minimize(
+                            lambda z: calcular(z)["f1"], z0, jac=lambda z: calcular(z)["df1"], method=metodo,
+                            bounds=limites, constraints=restricoes, options={"maxiter": max_iter},
+                        )
+
+        # Verificação pela avaliação completa; fica o melhor entre o projeto inicial e o otimizado
+        x = np.vstack([x0, projeto(np.clip(res.x, z_lo, np.maximum(z_lo, z_hi)))])
+        f, g = self.avaliar_lote(x)
+        viavel = np.all(g <= tolerancia, axis=1)
+        i = 1 if viavel[1] and (not viavel[0] or f[1, 0] <= f[0, 0]) else 0
+
+        return {
+                    "viavel": bool(viavel[i]),
+                    "x": x[i],
+                    "f": f[i],
+                    "g": g[i],
+                    "n_avaliacoes": memoria["n"],
+                    "n_iteracoes": int(getattr(res, "nit", 0)),
+                    "mensagem": str(res.message),
+                }
+
+    def estatisticas_cache(self) -> dict:
+        """Resumo de uso do cache de avaliações.
+
+        :return: Dicionário com acertos, falhas, taxa de acerto e número de projetos guardados
+        """
+
+        total = self.cache_acertos + self.cache_falhas
+        return {
+                    "acertos": self.cache_acertos,
+                    "falhas": self.cache_falhas,
+                    "taxa_acerto [-]": self.cache_acertos / total if total > 0 else 0.0,
+                    "projetos_cache": len(self.cache),
+                }
+
     def _evaluate(self, x, out, *args, **kwargs):
-        
-        # Geometria da longarina, tabuleiro e espaçamentos
-        d        = float(x[0])
-        bw       = float(x[1])
-        h        = float(x[2])
-        esp_long = float(x[3])
-        esp_tab  = float(x[4])
-
-        # Cálculo dos objetivos e restrições para avaliação robusta (média de várias checagens para cada indivíduo)
-        dados = []
-        for _ in range(self.n_checagens):
-            f, g, *_ = self.calcular_objetivos_restricoes_otimizacao(d, bw, h, esp_long, esp_tab)
-            resultado = {'f1': f[0], 'f2': f[1], 'g1': g[0], 'g2': g[1], 'g3': g[2], 'g4': g[3], 'g5': g[4], 'g6': g[5]}
-            dados.append(resultado)
-        df = pd.DataFrame(dados)
-        f = df[['f1', 'f2']].mean().tolist()
-        g = df[['g1', 'g2', 'g3', 'g4', 'g5', 'g6']].mean().tolist()
-
-        out["F"] = np.array(f, dtype=float)
-        out["G"] = np.array(g, dtype=float)
+
+        # Sem cache
+        x = np.asarray(x, dtype=float)
+        if self.tamanho_cache <= 0:
+            out["F"], out["G"] = self.avaliar_lote_paralelo(x)
+            return
+
+        # Chaves exatas: só projetos idênticos reaproveitam a avaliação, assim F e G pertencem sempre ao próprio X.
+        # Repetições dentro do mesmo lote contam como acerto (só o primeiro representante é avaliado)
+        chaves = [xi.tobytes() for xi in np.ascontiguousarray(x)]
+        f = np.empty((len(x), self.n_obj))
+        g = np.empty((len(x), self.n_ieq_constr))
+        faltantes = {}
+        for i, chave in enumerate(chaves):
+            if chave in self.cache:
+                self.cache.move_to_end(chave)
+                f[i], g[i] = self.cache[chave]
+                self.cache_acertos += 1
+            elif chave in faltantes:
+                faltantes[chave].append(i)
+                self.cache_acertos += 1
+            else:
+                faltantes[chave] = [i]
+                self.cache_falhas += 1
+
+        # Avalia em lote apenas os projetos ausentes do cache (um representante por chave)
+        if faltantes:
+            idx = [linhas[0] for linhas in faltantes.values()]
+            f_novos, g_novos = self.avaliar_lote_paralelo(x[idx])
+            for (chave, linhas), fi, gi in zip(faltantes.items(), f_novos, g_novos):
+                f[linhas], g[linhas] = fi, gi
+                self.cache[chave] = (fi, gi)
+            while len(self.cache) > self.tamanho_cache:
+                self.cache.popitem(last=False)
+
+        out["F"], out["G"] = f, g
 
     # def _evaluate(self, x, out, *args, **kwargs):
         
@@ -1591,20 +2963,126 @@ class ProjetoOtimo(ElementwiseProblem):
     #     out["G"] = np.array(g, dtype=float)
 
 
-def chamando_nsga2(dados: dict, ds: list, bws: list, hs: list, n_long: list, n_tab: list, t: dict) -> pd.DataFrame:
-    """Função para chamar o algoritmo NSGA-II para otimização do projeto estrutural.
+# Problema de otimização de cada processo trabalhador (definido uma vez pelo inicializador do executor)
+_PROBLEMA_TRABALHADOR = None
+
+
+def _iniciar_trabalhador(problema: ProjetoOtimo) -> None:
+    global _PROBLEMA_TRABALHADOR
+    _PROBLEMA_TRABALHADOR = problema
+
+
+def _avaliar_lote_trabalhador(x: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    return _PROBLEMA_TRABALHADOR.avaliar_lote(x)
+
+
+def criar_executor(problema: ProjetoOtimo, executor: str = "serial", n_workers: int = None):
+    """Cria o executor da avaliação paralela da população e o associa ao problema. Deve ser usado como gerenciador de contexto, assim o mesmo conjunto de trabalhadores é reaproveitado em todas as gerações e encerrado ao final.
+
+    :param problema: Problema de otimização
+    :param executor: 'serial', 'threads' ou 'processos'
+    :param n_workers: Número de trabalhadores. Se None, usa o número de núcleos da máquina
+
+    :return: Gerenciador de contexto do executor (nullcontext para 'serial')
+    """
+
+    n_workers = int(n_workers or os.cpu_count() or 1)
+    if executor == "serial" or n_workers < 2:
+        problema.executor, problema.n_workers = None, 1
+        return nullcontext()
+    if executor == "threads":
+        pool = ThreadPoolExecutor(max_workers=n_workers)
+    elif executor == "processos":
+        pool = ProcessPoolExecutor(max_workers=n_workers, initializer=_iniciar_trabalhador, initargs=(problema,))
+    else:
+        raise ValueError("executor deve ser 'serial', 'threads' ou 'processos'")
+    problema.executor, problema.n_workers = pool, n_workers
+
+    return pool
+
+
+def salvar_checkpoint_nsga2(algoritmo, arquivo: str, assinatura: str) -> None:
+    """Grava o estado do NSGA-II (população, estado do gerador aleatório, contador de gerações e histórico da terminação) em disco. A escrita é feita em um arquivo temporário e depois renomeada, assim uma interrupção durante a gravação não corrompe o checkpoint anterior.
+
+    :param algoritmo: Algoritmo pymoo já inicializado com setup
+    :param arquivo: Caminho do arquivo de checkpoint
+    :param assinatura: Identificação dos dados de entrada da execução
+    """
+
+    temporario = f"{arquivo}.tmp"
+    with open(temporario, "wb") as f:
+        pickle.dump({"assinatura": assinatura, "algoritmo": algoritmo}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temporario, arquivo)
+
+
+def carregar_checkpoint_nsga2(arquivo: str, assinatura: str):
+    """Recupera o estado do NSGA-II gravado por salvar_checkpoint_nsga2.
+
+    :param arquivo: Caminho do arquivo de checkpoint
+    :param assinatura: Identificação dos dados de entrada da execução atual
+
+    :return: Algoritmo pymoo pronto para continuar ou None se não houver checkpoint válido para essa assinatura
+    """
+
+    if arquivo is None or not os.path.exists(arquivo):
+        return None
+    try:
+        with open(arquivo, "rb") as f:
+            estado = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError):
+        return None
+    if estado.get("assinatura") != assinatura:
+        return None
+
+    return estado["algoritmo"]
+
+
+class RepararCatalogo(Repair):
+    """Arredonda os índices do catálogo (d, bw, h) para inteiros no modo catálogo de ProjetoOtimo, assim projetos que usam as mesmas peças são reconhecidos como duplicados pelo NSGA-II."""
+
+    def _do(self, problem, X, **kwargs):
+        X = np.array(X, dtype=float)
+        X[:, :3] = np.clip(np.rint(X[:, :3]), problem.xl[:3], problem.xu[:3])
+        return X
+
+
+def populacao_inicial_aquecida(x_anterior: np.ndarray, xl: np.ndarray, xu: np.ndarray, pop_size: int, semente: int = 1) -> np.ndarray:
+    """Monta a população inicial do NSGA-II a partir de uma fronteira de Pareto anterior. Os projetos anteriores são reparados para os novos limites e o restante da população é completado com amostras aleatórias uniformes para manter a diversidade.
+
+    :param x_anterior: Matriz (n_projetos, 5) com as variáveis de projeto da fronteira anterior
+    :param xl: Limites inferiores das variáveis de projeto
+    :param xu: Limites superiores das variáveis de projeto
+    :param pop_size: Tamanho da população
+    :param semente: Semente das amostras aleatórias
+
+    :return: Matriz (pop_size, 5) com a população inicial
+    """
+
+    rng = np.random.default_rng(semente)
+    xl, xu = np.asarray(xl, dtype=float), np.asarray(xu, dtype=float)
+    x_anterior = np.clip(np.atleast_2d(np.asarray(x_anterior, dtype=float)), xl, xu)
+    x_anterior = rng.permutation(np.unique(x_anterior, axis=0))[:pop_size]
+    x_aleatorio = xl + rng.random((pop_size - len(x_anterior), len(xl))) * (xu - xl)
+
+    return np.vstack([x_anterior, x_aleatorio])
+
+
+def criar_projeto_otimo(dados: dict, ds: list, bws: list, hs: list, n_long: list, n_tab: list, t: dict, **opcoes) -> ProjetoOtimo:
+    """Monta o problema de otimização a partir dos dados de entrada da tela de pré-dimensionamento.
 
     :param dados: Dados de entrada do projeto
     :param ds: Diâmetro mínimo e máximo da longarina [cm]
     :param bws: Largura mínima e máxima da viga do tabuleiro [cm]
     :param hs: Altura mínima e máxima da viga do tabuleiro [cm]
-    :param n_long: Espaço mínimo e máximo de longarinas
-    :param n_tab: Espaço mínimo e máximo de vigas do tabuleiro
+    :param n_long: Espaço mínimo e máximo de longarinas [cm]
+    :param n_tab: Espaço mínimo e máximo de vigas do tabuleiro [cm]
     :param t: Dicionário de textos para nomenclatura dos dados de entrada
+    :param opcoes: Demais argumentos de ProjetoOtimo (robustez, cache, rejeição antecipada, catálogo)
+
+    :return: Problema de otimização
     """
 
-    # Instanciando o problema de otimização, construindo a estrutura exemplo
-    problem = ProjetoOtimo(
+    return ProjetoOtimo(
 
                                 bw_pista            = dados[f"{t['pista']}"],
                                 l                   = dados[f"{t['entrada_comprimento']}"],
@@ -1641,31 +3119,233 @@ def chamando_nsga2(dados: dict, ds: list, bws: list, hs: list, n_long: list, n_t
                                 n_max_long          = n_long[1],
                                 n_min_tab           = n_tab[0],
                                 n_max_tab           = n_tab[1],
+                                **opcoes,
                         )
 
-    algorithm   = NSGA2(pop_size=500, sampling=FloatRandomSampling(), crossover=SBX(prob=0.9, eta=15), mutation=PM(eta=20), eliminate_duplicates=True)
-    termination = get_termination("n_gen", 400)
-    res         = minimize(problem, algorithm, termination, seed=1, save_history=False, verbose=False)
-    F_nsga      = res.F
-    G_nsga      = res.G
-    X_nsga      = res.X
-    
+
+def tabela_projetos(problema: ProjetoOtimo, x: np.ndarray, f: np.ndarray, g: np.ndarray) -> pd.DataFrame:
+    """Tabela de resultados (mesmas colunas da fronteira do NSGA-II) para um conjunto de projetos.
+
+    :param problema: Problema de otimização
+    :param x: Variáveis de projeto (n_projetos, 5)
+    :param f: Objetivos (n_projetos, 2)
+    :param g: Restrições (n_projetos, 6)
+
+    :return: DataFrame com dimensões, área, desempenho da flecha e restrições estruturais
+    """
+
+    x_pecas = problema.decodificar_catalogo(x)[0] if problema.tabela_catalogo is not None and x is not None else x
+
     return pd.DataFrame(
                             {
-                                "d [cm]": X_nsga[:, 0],
-                                "esp [cm]": X_nsga[:, 1],
-                                "bw [cm]": X_nsga[:, 2],
-                                "h [cm]": X_nsga[:, 3],
-                                "area [m²]": F_nsga[:, 0],
-                                "delta [-]": -F_nsga[:, 1], 
-                                "flex lim beam [(Ms-Mr)/Mr]": G_nsga[:, 0], 
-                                "cis lim beam [(Vs-Vr)/Vr]": G_nsga[:, 1], 
-                                "delta lim beam [(ps-pr)/pr]": G_nsga[:, 2],
-                                "flex lim deck [(Ms-Mr)/Mr]": G_nsga[:, 3],
+                                "d [cm]": x_pecas[:, 0],
+                                "esp [cm]": x_pecas[:, 1],
+                                "bw [cm]": x_pecas[:, 2],
+                                "h [cm]": x_pecas[:, 3],
+                                "area [m²]": f[:, 0],
+                                "delta [-]": -f[:, 1], 
+                                "flex lim beam [(Ms-Mr)/Mr]": g[:, 0], 
+                                "cis lim beam [(Vs-Vr)/Vr]": g[:, 1], 
+                                "delta lim beam [(ps-pr)/pr]": g[:, 2],
+                                "flex lim deck [(Ms-Mr)/Mr]": g[:, 3],
                             }
                         )
 
 
+def iterar_nsga2(dados: dict, ds: list, bws: list, hs: list, n_long: list, n_tab: list, t: dict, executor: str = "serial", n_workers: int = None, tamanho_cache: int = 0, n_max_geracoes: int = 400, tolerancia_f: float = 0.0025, periodo_convergencia: int = 30, arquivo_checkpoint: str = None, intervalo_checkpoint: int = 10, x_inicial: np.ndarray = None, limite_rejeicao: float = None, catalogo: dict = None, apertar_limites: bool = False, semear_projeto_minimo: bool = False):
+    """Executa o NSGA-II geração a geração, entregando o progresso da otimização. Enviar True ao gerador (gerador.send(True)) interrompe a otimização e produz o resultado com a frente atual.
+
+    :param dados: Dados de entrada do projeto
+    :param ds: Diâmetro mínimo e máximo da longarina [cm]
+    :param bws: Largura mínima e máxima da viga do tabuleiro [cm]
+    :param hs: Altura mínima e máxima da viga do tabuleiro [cm]
+    :param n_long: Espaço mínimo e máximo de longarinas [cm]
+    :param n_tab: Espaço mínimo e máximo de vigas do tabuleiro [cm]
+    :param t: Dicionário de textos para nomenclatura dos dados de entrada
+    :param executor: Avaliação da população 'serial', em 'threads' ou em 'processos'
+    :param n_workers: Número de trabalhadores do executor. Se None, usa o número de núcleos da máquina
+    :param tamanho_cache: Número máximo de projetos no cache de avaliações (0 desliga o cache)
+    :param n_max_geracoes: Limite rígido de gerações do NSGA-II
+    :param tolerancia_f: Tolerância de movimento da frente no espaço dos objetivos (IGD entre gerações normalizado pelo ideal/nadir). Se None, roda sempre n_max_geracoes
+    :param periodo_convergencia: Janela deslizante (gerações) em que o movimento médio da frente deve ficar abaixo de tolerancia_f
+    :param arquivo_checkpoint: Arquivo para gravar periodicamente o estado do algoritmo. Se existir um checkpoint dos mesmos dados, a execução continua dele. O arquivo é removido ao final da otimização
+    :param intervalo_checkpoint: Número de gerações entre gravações do checkpoint
+    :param x_inicial: Variáveis de projeto (n_projetos, 5) de uma fronteira anterior para aquecer a população inicial. Se None, a população inicial é aleatória
+    :param limite_rejeicao: Violação de espaçamento (g5, g6) acima da qual o projeto é rejeitado sem as verificações estruturais (ver ProjetoOtimo). Se None, todos os projetos são verificados
+    :param catalogo: Catálogo comercial com chaves 'd [cm]', 'bw [cm]' e 'h [cm]' para otimização discreta (ver ProjetoOtimo). Se None, d, bw e h são contínuos
+    :param apertar_limites: Se True, aperta os limites inferiores de d, bw e h pelas equações estado limite antes da otimização (ver ProjetoOtimo.apertar_limites). O relatório fica em df.attrs["limites_apertados"]
+    :param semear_projeto_minimo: Se True, os projetos viáveis de ProjetoOtimo.projeto_minimo_viavel entram na população inicial (junto com x_inicial, se houver)
+
+    :return: A cada geração, dicionário com a geração, avaliações acumuladas, tempo da geração, tempo total, estimativa do tempo restante até o limite de gerações (eta), hipervolume (ponto de referência fixado na primeira geração viável) e a frente não dominada viável ("F" e "X"). O último dicionário tem "concluido" igual a True e a frente de Pareto final em "resultado" (mesmo DataFrame de chamando_nsga2)
+    """
+
+    # Instanciando o problema de otimização, construindo a estrutura exemplo
+    problem = criar_projeto_otimo(dados, ds, bws, hs, n_long, n_tab, t, tamanho_cache=tamanho_cache, limite_rejeicao=limite_rejeicao, catalogo=catalogo)
+    limites_apertados = problem.apertar_limites(aplicar=True) if apertar_limites else None
+    if semear_projeto_minimo:
+        sementes = problem.projeto_minimo_viavel()["candidatos_x"]
+        # Só entram as sementes dentro dos limites (apertar_limites pode ter subido os limites inferiores de d, bw e h)
+        sementes = sementes[np.all((sementes >= problem.xl) & (sementes <= problem.xu), axis=1)]
+        x_inicial = sementes if x_inicial is None or len(x_inicial) == 0 else np.vstack([np.asarray(x_inicial, dtype=float), sementes])
+
+    pop_size    = 500
+    if x_inicial is not None and len(x_inicial) > 0:
+        sampling = populacao_inicial_aquecida(x_inicial, problem.xl, problem.xu, pop_size)
+    else:
+        sampling = FloatRandomSampling()
+    repair      = RepararCatalogo() if catalogo is not None else NoRepair()
+    algorithm   = NSGA2(pop_size=pop_size, sampling=sampling, crossover=SBX(prob=0.9, eta=15), mutation=PM(eta=20), repair=repair, eliminate_duplicates=True)
+    if tolerancia_f is None:
+        termination = get_termination("n_gen", n_max_geracoes)
+    else:
+        termination = DefaultMultiObjectiveTermination(ftol=tolerancia_f, period=periodo_convergencia, n_max_gen=n_max_geracoes, n_max_evals=pop_size * n_max_geracoes)
+
+    # Retomando de um checkpoint dos mesmos dados de entrada ou iniciando do zero
+    assinatura  = repr((sorted((str(k), str(v)) for k, v in dados.items()), ds, bws, hs, n_long, n_tab, tamanho_cache, n_max_geracoes, tolerancia_f, periodo_convergencia, limite_rejeicao, catalogo, apertar_limites, semear_projeto_minimo))
+    retomado    = carregar_checkpoint_nsga2(arquivo_checkpoint, assinatura)
+    if retomado is not None:
+        algorithm   = retomado
+        problem     = algorithm.problem
+    else:
+        algorithm.setup(problem, termination=termination, seed=1, save_history=False, verbose=False)
+
+    indicador_hv    = None
+    n_geracoes      = 0
+    t_inicio        = time.perf_counter()
+    parar           = False
+    try:
+        with criar_executor(problem, executor, n_workers):
+            while algorithm.has_next() and not parar:
+                t_geracao = time.perf_counter()
+                algorithm.next()
+                if arquivo_checkpoint is not None and (algorithm.n_gen - 1) % intervalo_checkpoint == 0:
+                    salvar_checkpoint_nsga2(algorithm, arquivo_checkpoint, assinatura)
+                n_geracoes += 1
+
+                # Frente não dominada viável da geração atual
+                viavel, F_atual, X_atual = algorithm.opt.get("feas", "F", "X")
+                F_atual, X_atual = F_atual[viavel], X_atual[viavel]
+
+                # Hipervolume com ponto de referência fixado na primeira geração com projetos viáveis
+                if indicador_hv is None and len(F_atual) > 0:
+                    ideal, nadir = F_atual.min(axis=0), F_atual.max(axis=0)
+                    indicador_hv = HV(ref_point=nadir + 0.1 * np.maximum(nadir - ideal, np.abs(nadir) + 1e-12))
+                hipervolume = float(indicador_hv(F_atual)) if indicador_hv is not None and len(F_atual) > 0 else 0.0
+
+                agora = time.perf_counter()
+                parar = yield {
+                                    "geracao": algorithm.n_gen - 1,
+                                    "avaliacoes": algorithm.evaluator.n_eval,
+                                    "tempo_geracao [s]": agora - t_geracao,
+                                    "tempo_total [s]": agora - t_inicio,
+                                    "eta [s]": (agora - t_inicio) / n_geracoes * max(n_max_geracoes - (algorithm.n_gen - 1), 0),
+                                    "hipervolume": hipervolume,
+                                    "F": F_atual,
+                                    "X": X_atual,
+                                    "concluido": False,
+                                }
+    finally:
+        problem.executor = None
+    res = algorithm.result()
+    if arquivo_checkpoint is not None and os.path.exists(arquivo_checkpoint):
+        os.remove(arquivo_checkpoint)
+    F_nsga      = res.F
+    G_nsga      = res.G
+    X_nsga      = res.X
+    n_gen       = algorithm.n_gen - 1           # o pymoo incrementa o contador após a última geração
+    if X_nsga is None:
+        # Nenhum projeto viável até a parada: frente vazia, como em chamando_projeto_minimo
+        X_nsga, F_nsga, G_nsga = np.zeros((0, problem.n_var)), np.zeros((0, problem.n_obj)), np.zeros((0, problem.n_ieq_constr))
+    n_eval      = algorithm.evaluator.n_eval
+
+    df = tabela_projetos(problem, X_nsga, F_nsga, G_nsga)
+    df.attrs["geracao_parada"] = n_gen
+    df.attrs["avaliacoes"] = n_eval
+    df.attrs["avaliacoes_economizadas"] = max(pop_size * n_max_geracoes - n_eval, 0)
+    df.attrs["X"] = X_nsga
+    df.attrs["limites_apertados"] = limites_apertados
+
+    yield {
+                "geracao": n_gen,
+                "avaliacoes": n_eval,
+                "tempo_geracao [s]": 0.0,
+                "tempo_total [s]": time.perf_counter() - t_inicio,
+                "eta [s]": 0.0,
+                "hipervolume": float(indicador_hv(F_nsga)) if indicador_hv is not None and len(F_nsga) > 0 else 0.0,
+                "F": F_nsga,
+                "X": X_nsga,
+                "concluido": True,
+                "resultado": df,
+            }
+
+
+def chamando_nsga2(dados: dict, ds: list, bws: list, hs: list, n_long: list, n_tab: list, t: dict, executor: str = "serial", n_workers: int = None, tamanho_cache: int = 0, n_max_geracoes: int = 400, tolerancia_f: float = 0.0025, periodo_convergencia: int = 30, arquivo_checkpoint: str = None, intervalo_checkpoint: int = 10, x_inicial: np.ndarray = None, limite_rejeicao: float = None, catalogo: dict = None, apertar_limites: bool = False, semear_projeto_minimo: bool = False, callback=None) -> pd.DataFrame:
+    """Função para chamar o algoritmo NSGA-II para otimização do projeto estrutural.
+
+    :param dados: Dados de entrada do projeto
+    :param ds: Diâmetro mínimo e máximo da longarina [cm]
+    :param bws: Largura mínima e máxima da viga do tabuleiro [cm]
+    :param hs: Altura mínima e máxima da viga do tabuleiro [cm]
+    :param n_long: Espaço mínimo e máximo de longarinas [cm]
+    :param n_tab: Espaço mínimo e máximo de vigas do tabuleiro [cm]
+    :param t: Dicionário de textos para nomenclatura dos dados de entrada
+    :param executor: Avaliação da população 'serial', em 'threads' ou em 'processos'
+    :param n_workers: Número de trabalhadores do executor. Se None, usa o número de núcleos da máquina
+    :param tamanho_cache: Número máximo de projetos no cache de avaliações (0 desliga o cache)
+    :param n_max_geracoes: Limite rígido de gerações do NSGA-II
+    :param tolerancia_f: Tolerância de movimento da frente no espaço dos objetivos (IGD entre gerações normalizado pelo ideal/nadir). Se None, roda sempre n_max_geracoes
+    :param periodo_convergencia: Janela deslizante (gerações) em que o movimento médio da frente deve ficar abaixo de tolerancia_f
+    :param arquivo_checkpoint: Arquivo para gravar periodicamente o estado do algoritmo. Se existir um checkpoint dos mesmos dados, a execução continua dele. O arquivo é removido ao final da otimização
+    :param intervalo_checkpoint: Número de gerações entre gravações do checkpoint
+    :param x_inicial: Variáveis de projeto (n_projetos, 5) de uma fronteira anterior para aquecer a população inicial. Se None, a população inicial é aleatória
+    :param limite_rejeicao: Violação de espaçamento (g5, g6) acima da qual o projeto é rejeitado sem as verificações estruturais (ver ProjetoOtimo). Se None, todos os projetos são verificados
+    :param catalogo: Catálogo comercial com chaves 'd [cm]', 'bw [cm]' e 'h [cm]' para otimização discreta (ver ProjetoOtimo). Se None, d, bw e h são contínuos
+    :param apertar_limites: Se True, aperta os limites inferiores de d, bw e h pelas equações estado limite antes da otimização (ver ProjetoOtimo.apertar_limites). O relatório fica em df.attrs["limites_apertados"]
+    :param semear_projeto_minimo: Se True, os projetos viáveis de ProjetoOtimo.projeto_minimo_viavel entram na população inicial (junto com x_inicial, se houver)
+    :param callback: Função chamada a cada geração com o dicionário de progresso de iterar_nsga2. Se retornar True, a otimização é interrompida e a frente atual é devolvida
+
+    :return: Frente de Pareto. Em df.attrs ficam a geração de parada, as avaliações realizadas, as avaliações economizadas em relação ao limite rígido e a matriz "X" com as variáveis de projeto da frente
+    """
+
+    gerador     = iterar_nsga2(dados, ds, bws, hs, n_long, n_tab, t, executor=executor, n_workers=n_workers, tamanho_cache=tamanho_cache, n_max_geracoes=n_max_geracoes, tolerancia_f=tolerancia_f, periodo_convergencia=periodo_convergencia, arquivo_checkpoint=arquivo_checkpoint, intervalo_checkpoint=intervalo_checkpoint, x_inicial=x_inicial, limite_rejeicao=limite_rejeicao, catalogo=catalogo, apertar_limites=apertar_limites, semear_projeto_minimo=semear_projeto_minimo)
+    progresso   = next(gerador)
+    while not progresso["concluido"]:
+        parar       = callback(progresso) if callback is not None else False
+        progresso   = gerador.send(bool(parar))
+    if callback is not None:
+        callback(progresso)
+
+    return progresso["resultado"]
+
+
+def chamando_projeto_minimo(dados: dict, ds: list, bws: list, hs: list, n_long: list, n_tab: list, t: dict, **opcoes) -> pd.DataFrame:
+    """Função para obter diretamente o projeto viável de menor área de madeira (sem NSGA-II), ver ProjetoOtimo.projeto_minimo_viavel.
+
+    :param dados: Dados de entrada do projeto
+    :param ds: Diâmetro mínimo e máximo da longarina [cm]
+    :param bws: Largura mínima e máxima da viga do tabuleiro [cm]
+    :param hs: Altura mínima e máxima da viga do tabuleiro [cm]
+    :param n_long: Espaço mínimo e máximo de longarinas [cm]
+    :param n_tab: Espaço mínimo e máximo de vigas do tabuleiro [cm]
+    :param t: Dicionário de textos para nomenclatura dos dados de entrada
+    :param opcoes: Demais argumentos de ProjetoOtimo (robustez, catálogo etc.)
+
+    :return: Tabela com uma linha (vazia se nenhum projeto viável for encontrado), mesmas colunas de chamando_nsga2. Em df.attrs ficam "X" (variáveis de projeto), "candidatos_X" e "n_avaliacoes"
+    """
+
+    problem = criar_projeto_otimo(dados, ds, bws, hs, n_long, n_tab, t, **opcoes)
+    res = problem.projeto_minimo_viavel()
+    if res["viavel"]:
+        df = tabela_projetos(problem, res["x"][None, :], res["f"][None, :], res["g"][None, :])
+    else:
+        df = tabela_projetos(problem, np.zeros((0, problem.n_var)), np.zeros((0, problem.n_obj)), np.zeros((0, problem.n_ieq_constr)))
+    df.attrs["X"] = res["x"]
+    df.attrs["candidatos_X"] = res["candidatos_x"]
+    df.attrs["n_avaliacoes"] = res["n_avaliacoes"]
+
+    return df
+
+
 if __name__ == "__main__":
     df = pd.read_excel("beam_data_02.xlsx")
     df = df.to_dict(orient="records")
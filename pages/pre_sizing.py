@@ -149,6 +149,9 @@ with st.form("form_geometria", clear_on_submit=False):
 
     st.divider()
 
+    aquecer_frente = st.checkbox(t["aquecer_frente"], value=True, key="aquecer_frente")
+    tempo_max_nsga = st.number_input(t["tempo_max_nsga"], value=0.0, min_value=0.0, step=10.0, key="tempo_max_nsga")
+
     submitted_design = st.form_submit_button(t["gerador_desempenho"])
 
 
@@ -187,6 +190,17 @@ excel_bytes = montar_excel(dados_projeto)
 # 3) INVALIDAÇÃO AUTOMÁTICA (se inputs mudarem)
 # ============================================================
 sig_now = make_signature(dados_projeto)
+
+# Assinatura de semelhança: projetos com mesmas seções e classes podem reaproveitar a última fronteira (cargas e limites podem mudar)
+sig_familia = make_signature({
+                                k: dados_projeto[k] for k in [
+                                                                f"{t['tipo_secao_longarina']}",
+                                                                f"{t['tipo_secao_tabuleiro']}",
+                                                                f"{t['classe_carregamento']}",
+                                                                f"{t['classe_madeira']}",
+                                                                f"{t['classe_umidade']}",
+                                                            ]
+                            })
 sig_last = st.session_state.get("sig_last")
 
 if st.session_state.get("has_results", False) and (sig_last is not None) and (sig_now != sig_last):
@@ -301,8 +315,36 @@ if submitted_design:
     n_p_long = [float(n_min_long), float(n_max_long)]
     n_p_tab  = [float(n_min_tab),  float(n_max_tab)]
 
-    # NSGA-II
-    res_nsga = chamando_nsga2(dados_projeto, ds, bws, hs, n_p_long, n_p_tab, t)
+    # NSGA-II (aquecido pela última fronteira de um projeto semelhante, se houver)
+    frente_anterior = st.session_state.get("frente_anterior")
+    x_inicial = None
+    if aquecer_frente and frente_anterior is not None and frente_anterior["sig"] == sig_familia:
+        x_inicial = frente_anterior["X"]
+    n_max_geracoes = 400
+    barra_nsga = st.progress(0.0)
+    info_nsga = st.empty()
+    frente_nsga = st.empty()
+
+    def acompanhar_nsga(progresso: dict) -> bool:
+        barra_nsga.progress(1.0 if progresso["concluido"] else min(progresso["geracao"] / n_max_geracoes, 1.0))
+        info_nsga.caption(t["progresso_nsga"].format(
+                                                        geracao=progresso["geracao"],
+                                                        avaliacoes=progresso["avaliacoes"],
+                                                        hipervolume=progresso["hipervolume"],
+                                                        eta=progresso["eta [s]"],
+                                                    ))
+        # Fronteira parcial (redesenhada a cada 5 gerações para não atrasar a otimização)
+        F_atual = progresso["F"]
+        if F_atual is not None and len(F_atual) > 0 and (progresso["geracao"] % 5 == 0 or progresso["concluido"]):
+            frente_nsga.scatter_chart(pd.DataFrame({"area_m2": F_atual[:, 0], "delta": -F_atual[:, 1]}), x="area_m2", y="delta")
+        # Parada antecipada pelo tempo máximo informado (a fronteira atual é devolvida)
+        return tempo_max_nsga > 0 and progresso["tempo_total [s]"] >= tempo_max_nsga
+
+    res_nsga = chamando_nsga2(dados_projeto, ds, bws, hs, n_p_long, n_p_tab, t, n_max_geracoes=n_max_geracoes, x_inicial=x_inicial, callback=acompanhar_nsga)
+    barra_nsga.empty()
+    frente_nsga.empty()
+    if res_nsga.attrs.get("X") is not None and len(res_nsga.attrs["X"]) > 0:
+        st.session_state["frente_anterior"] = {"sig": sig_familia, "X": res_nsga.attrs["X"]}
 
     # padroniza DataFrame final (PT/EN)
     if lang == "pt":
@@ -7,7 +7,17 @@ import streamlit as st
 import pandas as pd
 import math
 
-from madeiras import textos_design, chamando_form
+from madeiras import textos_design
+from confia_mad import chamando_confiabilidade
+
+
+ROTULOS_MODOS = {
+    "flexao": "Flexão (longarina)",
+    "cisalhamento": "Cisalhamento (longarina)",
+    "flecha": "Flecha (longarina)",
+    "flexao_tabuleiro": "Flexão (tabuleiro)",
+    "sistema": "Sistema em série",
+}
 
 
 # -----------------------------
@@ -19,6 +29,30 @@ def pct_change(new: float, ref: float) -> float:
     return (new - ref) / ref * 100.0
 
 
+def confiabilidade_projeto(df0, d_cm, esp_cm, bw_cm, h_cm) -> dict:
+    # Todos os estados limites e o sistema em série em uma única chamada (FORM nativo; FORM do UQpy se algum modo não convergir)
+    argumentos = (
+        df0["p_gk (kN/m²)"], df0["p_rodak (kN)"], df0["p_qk (kN/m²)"], df0["a (m)"], df0["l (cm)"],
+        df0["classe_carregamento"], df0["classe_madeira"], df0["classe_umidade"],
+        df0["resistência característica à flexão longarina (MPa)"],
+        df0["resistência característica ao cisalhamento longarina (MPa)"],
+        df0["módulo de elasticidade à flexão longarina (GPa)"],
+        df0["resistência característica à flexão tabuleiro (MPa)"],
+        df0["densidade longarina (kg/m³)"], df0["densidade tabuleiro (kg/m³)"],
+        float(d_cm), float(esp_cm), float(bw_cm), float(h_cm),
+    )
+    res = chamando_confiabilidade(*argumentos, method="iHL-RF")
+    if not res["sistema"]["convergiu"]:
+        res = chamando_confiabilidade(*argumentos, method="FORM")
+    return res
+
+
+def aviso_convergencia(res: dict) -> None:
+    nao_convergiu = [ROTULOS_MODOS[m] for m in ROTULOS_MODOS if m != "sistema" and not res.get(m, {}).get("convergiu", True)]
+    if nao_convergiu:
+        st.warning("O FORM não convergiu para: " + ", ".join(nao_convergiu) + ". Os valores de β e Pf desses modos (e do sistema) não são confiáveis.")
+
+
 def make_signature(d: dict) -> str:
     payload = json.dumps(d, sort_keys=True, default=str).encode("utf-8")
     return hashlib.md5(payload).hexdigest()
@@ -159,34 +193,7 @@ if submitted_design:
     else:
         df0 = df.iloc[0]
 
-    beta_m, pf_m = chamando_form(
-        df0["p_gk (kN/m²)"], df0["p_rodak (kN)"], df0["p_qk (kN/m²)"], df0["a (m)"], df0["l (cm)"],
-        df0["classe_carregamento"], df0["classe_madeira"], df0["classe_umidade"],
-        df0["resistência característica à flexão longarina (MPa)"],
-        df0["resistência característica ao cisalhamento longarina (MPa)"],
-        df0["módulo de elasticidade à flexão longarina (GPa)"],
-        df0["resistência característica à flexão tabuleiro (MPa)"],
-        df0["densidade longarina (kg/m³)"], df0["densidade tabuleiro (kg/m³)"],
-        d_cm, esp_cm, bw_cm, h_cm, "flexao"
-    )
-
-    beta_f, pf_f = chamando_form(
-        df0["p_gk (kN/m²)"], df0["p_rodak (kN)"], df0["p_qk (kN/m²)"], df0["a (m)"], df0["l (cm)"],
-        df0["classe_carregamento"], df0["classe_madeira"], df0["classe_umidade"],
-        df0["resistência característica à flexão longarina (MPa)"],
-        df0["resistência característica ao cisalhamento longarina (MPa)"],
-        df0["módulo de elasticidade à flexão longarina (GPa)"],
-        df0["resistência característica à flexão tabuleiro (MPa)"],
-        df0["densidade longarina (kg/m³)"], df0["densidade tabuleiro (kg/m³)"],
-        d_cm, esp_cm, bw_cm, h_cm, "flecha"
-    )
-
-    res = {
-        "indice_confiabilidade_flexão": beta_m,
-        "probabilidade_de_fratura_flexão": pf_m,
-        "indice_confiabilidade_flecha": beta_f,
-        "probabilidade_de_fratura_flecha": pf_f,
-    }
+    res = confiabilidade_projeto(df0, d_cm, esp_cm, bw_cm, h_cm)
 
     # >>> MINIMO: baseline p/ slider/comparação (sem conflitar com widgets)
     st.session_state["res_ref"] = res.copy()
@@ -213,17 +220,13 @@ if st.session_state.get("has_results", False):
     st.subheader("Resultados de Confiabilidade")
 
     with st.expander("Resultado (referência)", expanded=True):
-        c1, c2 = st.columns(2)
-
-        with c1:
-            st.markdown("**Flexão**")
-            st.metric("β (flexão)", f"{res_ref.get('indice_confiabilidade_flexão', float('nan')):.4f}")
-            st.metric("Probabilidade de falha (flexão)", f"{res_ref.get('probabilidade_de_fratura_flexão', float('nan')):.4e}")
-
-        with c2:
-            st.markdown("**Flecha**")
-            st.metric("β (flecha)", f"{res_ref.get('indice_confiabilidade_flecha', float('nan')):.4f}")
-            st.metric("Probabilidade de falha (flecha)", f"{res_ref.get('probabilidade_de_fratura_flecha', float('nan')):.4e}")
+        aviso_convergencia(res_ref)
+        cols = st.columns(len(ROTULOS_MODOS))
+        for col, (modo, rotulo) in zip(cols, ROTULOS_MODOS.items()):
+            with col:
+                st.markdown(f"**{rotulo}**")
+                st.metric(f"β ({rotulo.lower()})", f"{res_ref.get(modo, {}).get('beta', float('nan')):.4f}")
+                st.metric(f"Probabilidade de falha ({rotulo.lower()})", f"{res_ref.get(modo, {}).get('pf', float('nan')):.4e}")
 
     st.divider()
     st.subheader("Análise de Sensibilidade — Diâmetro da Longarina")
@@ -255,78 +258,35 @@ if st.session_state.get("has_results", False):
         bw_cm_  = float(st.session_state.get("bw_cm_ref") or 0.0)
         h_cm_   = float(st.session_state.get("h_cm_ref") or 0.0)
 
-        beta_m_new, pf_m_new = chamando_form(
-            df0_dict["p_gk (kN/m²)"], df0_dict["p_rodak (kN)"], df0_dict["p_qk (kN/m²)"],
-            df0_dict["a (m)"], df0_dict["l (cm)"], df0_dict["classe_carregamento"],
-            df0_dict["classe_madeira"], df0_dict["classe_umidade"],
-            df0_dict["resistência característica à flexão longarina (MPa)"],
-            df0_dict["resistência característica ao cisalhamento longarina (MPa)"],
-            df0_dict["módulo de elasticidade à flexão longarina (GPa)"],
-            df0_dict["resistência característica à flexão tabuleiro (MPa)"],
-            df0_dict["densidade longarina (kg/m³)"], df0_dict["densidade tabuleiro (kg/m³)"],
-            float(d_new), esp_cm_, bw_cm_, h_cm_,
-            "flexao"
-        )
-
-        beta_f_new, pf_f_new = chamando_form(
-            df0_dict["p_gk (kN/m²)"], df0_dict["p_rodak (kN)"], df0_dict["p_qk (kN/m²)"],
-            df0_dict["a (m)"], df0_dict["l (cm)"], df0_dict["classe_carregamento"],
-            df0_dict["classe_madeira"], df0_dict["classe_umidade"],
-            df0_dict["resistência característica à flexão longarina (MPa)"],
-            df0_dict["resistência característica ao cisalhamento longarina (MPa)"],
-            df0_dict["módulo de elasticidade à flexão longarina (GPa)"],
-            df0_dict["resistência característica à flexão tabuleiro (MPa)"],
-            df0_dict["densidade longarina (kg/m³)"], df0_dict["densidade tabuleiro (kg/m³)"],
-            float(d_new), esp_cm_, bw_cm_, h_cm_,
-            "flecha"
-        )
-
-        res_new = {
-            "indice_confiabilidade_flexão": beta_m_new,
-            "probabilidade_de_fratura_flexão": pf_m_new,
-            "indice_confiabilidade_flecha": beta_f_new,
-            "probabilidade_de_fratura_flecha": pf_f_new,
-            "d_cm": float(d_new),
-        }
+        res_new = confiabilidade_projeto(df0_dict, float(d_new), esp_cm_, bw_cm_, h_cm_)
+        res_new["d_cm"] = float(d_new)
 
         st.session_state["res_design"] = res_new
         res = res_new
+        aviso_convergencia(res_new)
 
     st.divider()
     with st.expander("Comparação — Referência vs Cenário do Slider", expanded=True):
 
-        b_ref_m = float(res_ref.get("indice_confiabilidade_flexão", float("nan")))
-        p_ref_m = float(res_ref.get("probabilidade_de_fratura_flexão", float("nan")))
-        b_ref_f = float(res_ref.get("indice_confiabilidade_flecha", float("nan")))
-        p_ref_f = float(res_ref.get("probabilidade_de_fratura_flecha", float("nan")))
-
-        b_new_m = float(res.get("indice_confiabilidade_flexão", b_ref_m))
-        p_new_m = float(res.get("probabilidade_de_fratura_flexão", p_ref_m))
-        b_new_f = float(res.get("indice_confiabilidade_flecha", b_ref_f))
-        p_new_f = float(res.get("probabilidade_de_fratura_flecha", p_ref_f))
-
         st.markdown(
             f"**Diâmetro de referência:** {d_ref:.2f} cm  \n"
             f"**Diâmetro do cenário:** {float(d_new):.2f} cm"
         )
 
-        c1, c2 = st.columns(2)
-
-        with c1:
-            st.markdown("### Flexão")
-            st.metric("β (ref)", f"{b_ref_m:.4f}")
-            st.metric("β (cenário)", f"{b_new_m:.4f}", delta=f"{pct_change(b_new_m, b_ref_m):+.2f}%")
-
-            st.metric("Pf (ref)", f"{p_ref_m:.4e}")
-            st.metric("Pf (cenário)", f"{p_new_m:.4e}", delta=f"{pct_change(p_new_m, p_ref_m):+.2f}%")
+        cols = st.columns(len(ROTULOS_MODOS))
+        for col, (modo, rotulo) in zip(cols, ROTULOS_MODOS.items()):
+            b_ref = float(res_ref.get(modo, {}).get("beta", float("nan")))
+            p_ref = float(res_ref.get(modo, {}).get("pf", float("nan")))
+            b_new = float(res.get(modo, {}).get("beta", b_ref))
+            p_new = float(res.get(modo, {}).get("pf", p_ref))
 
-        with c2:
-            st.markdown("### Flecha")
-            st.metric("β (ref)", f"{b_ref_f:.4f}")
-            st.metric("β (cenário)", f"{b_new_f:.4f}", delta=f"{pct_change(b_new_f, b_ref_f):+.2f}%")
+            with col:
+                st.markdown(f"### {rotulo}")
+                st.metric("β (ref)", f"{b_ref:.4f}")
+                st.metric("β (cenário)", f"{b_new:.4f}", delta=f"{pct_change(b_new, b_ref):+.2f}%")
 
-            st.metric("Pf (ref)", f"{p_ref_f:.4e}")
-            st.metric("Pf (cenário)", f"{p_new_f:.4e}", delta=f"{pct_change(p_new_f, p_ref_f):+.2f}%")
+                st.metric("Pf (ref)", f"{p_ref:.4e}")
+                st.metric("Pf (cenário)", f"{p_new:.4e}", delta=f"{pct_change(p_new, p_ref):+.2f}%")
 
 else:
     st.warning("Sem resultados atuais. Clique em “Gerar” para processar.")
\ No newline at end of file
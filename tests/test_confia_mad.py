@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from confia_mad import chamando_confiabilidade, chamando_form, chamando_form_hlrf, chamando_form_lote
+
+
+# p_gk, p_rodak, p_qk, a, l, classe_carregamento, classe_madeira, classe_umidade, f_mk, f_vk, e_modflex, f_mktab, densidade_long, densidade_tab
+DADOS = (1.0, 75.0, 5.0, 1.5, 500.0, "permanente", "madeira natural", 1, 50.0, 4.0, 14.0, 50.0, 620.0, 620.0)
+# d_cm, esp_cm, bw_cm, h_cm
+PROJETO = (54.0, 157.0, 30.0, 22.0)
+
+
+def test_chamando_confiabilidade_method_sem_diferenciar_maiusculas():
+    ref = chamando_confiabilidade(*DADOS, *PROJETO, method="iHL-RF", modos=("flexao",))
+    res = chamando_confiabilidade(*DADOS, *PROJETO, method="ihl-rf", modos=("flexao",))
+
+    assert res["flexao"]["beta"] == ref["flexao"]["beta"]
+    assert "n_iteracoes" in res["flexao"]
+
+
+def test_chamando_confiabilidade_method_invalido():
+    with pytest.raises(ValueError, match="'FORM', 'HL-RF', 'iHL-RF', 'MC', 'LHS' ou 'IS'"):
+        chamando_confiabilidade(*DADOS, *PROJETO, method="SORM")
+
+
+def test_form_nativo_igual_ao_uqpy():
+    for modo in ("flexao", "cisalhamento", "flecha"):
+        beta_uqpy = chamando_form(*DADOS, *PROJETO, modo)[0]
+        res = chamando_form_hlrf(*DADOS, *PROJETO, modo)
+
+        assert res["convergiu"]
+        assert np.isclose(res["beta"], beta_uqpy, rtol=1e-6)
+
+
+def test_form_lote_igual_ao_form_por_projeto():
+    d_cm = np.array([40.0, 48.0, 54.0, 60.0])
+    esp_cm = np.array([157.0, 120.0, 157.0, 200.0])
+    lote = chamando_form_lote(*DADOS, d_cm, esp_cm, 30.0, 22.0, "flexao")
+
+    for k in range(len(d_cm)):
+        res = chamando_form_hlrf(*DADOS, d_cm[k], esp_cm[k], 30.0, 22.0, "flexao")
+        assert np.isclose(lote["beta"][k], res["beta"], rtol=1e-12, atol=1e-12)
+        assert lote["n_iteracoes"][k] == res["n_iteracoes"]
+        assert lote["convergiu"][k] == res["convergiu"]
@@ -0,0 +1,195 @@
+import numpy as np
+
+from madeiras import ProjetoOtimo, chamando_nsga2, restringir_espaco, restringir_espaco_vetorizado, textos_pre_sizing_l
+
+
+DADOS = dict(
+                bw_pista=900, l=500, p_gk=1, p_rodak=75, p_qk=5, a=1.5,
+                classe_carregamento='permanente', classe_madeira='madeira natural', classe_umidade=1,
+                gamma_g=1.35, gamma_q=1.5, gamma_wf=1.4, gamma_wc=1.8, psi2=0.3, phi=0.6,
+                densidade_long=620, densidade_tab=620, f_mk_long=50, f_vk_long=4, e_modflex_long=14, f_mk_tab=50,
+                d_min=20, d_max=60, bw_min=5, bw_max=30, h_min=5, h_max=30,
+                n_min_long=30, n_max_long=200, n_min_tab=30, n_max_tab=200,
+            )
+
+
+def argumentos_nsga2(**alteracoes) -> tuple:
+    """Argumentos posicionais de chamando_nsga2 (dados da tela de pré-dimensionamento) a partir de DADOS."""
+
+    d = {**DADOS, **alteracoes}
+    t = textos_pre_sizing_l()["pt"]
+    dados = {
+                t["entrada_comprimento"]: d["l"], t["pista"]: d["bw_pista"],
+                f"{t['carga_permanente']} (kPa)": d["p_gk"], f"{t['carga_roda']} (kN)": d["p_rodak"],
+                f"{t['carga_multidao']} (kPa)": d["p_qk"], f"{t['distancia_eixos']} (m)": d["a"],
+                t["classe_carregamento"]: d["classe_carregamento"], t["classe_madeira"]: d["classe_madeira"],
+                t["classe_umidade"]: d["classe_umidade"], t["gamma_g"]: d["gamma_g"], t["gamma_q"]: d["gamma_q"],
+                t["gamma_wc"]: d["gamma_wc"], t["gamma_wf"]: d["gamma_wf"], t["psi2"]: d["psi2"], t["considerar_fluencia"]: d["phi"],
+                f"{t['densidade_long']} (kg/m³)": d["densidade_long"], f"{t['f_mk']} (MPa)": d["f_mk_long"],
+                f"{t['f_vk']} (MPa)": d["f_vk_long"], f"{t['e_modflex']} (GPa)": d["e_modflex_long"],
+                f"{t['densidade_tab']} (kg/m³)": d["densidade_tab"], f"{t['f_mk_tab']} (MPa)": d["f_mk_tab"],
+            }
+
+    return (
+                dados, [d["d_min"], d["d_max"]], [d["bw_min"], d["bw_max"]], [d["h_min"], d["h_max"]],
+                [d["n_min_long"], d["n_max_long"]], [d["n_min_tab"], d["n_max_tab"]], t,
+            )
+
+
+def test_projeto_minimo_viavel_espacamento_minimo_nao_nulo():
+    problema = ProjetoOtimo(**DADOS, n_checagens=1)
+    res = problema.projeto_minimo_viavel()
+
+    assert res["viavel"]
+    assert res["n_avaliacoes"] > 0
+    f, g = problema.avaliar_lote(res["x"][None, :])
+    assert np.all(g <= 0.0)
+    assert np.isclose(f[0, 0], res["f"][0])
+
+
+def test_projeto_minimo_viavel_dentro_dos_limites():
+    problema = ProjetoOtimo(**DADOS, n_checagens=1)
+    res = problema.projeto_minimo_viavel()
+    candidatos = res["candidatos_x"]
+
+    # Mesmo filtro das sementes de iterar_nsga2(semear_projeto_minimo=True)
+    assert len(candidatos) > 0
+    assert np.all((candidatos >= problema.xl) & (candidatos <= problema.xu))
+    assert np.all((res["x"] >= problema.xl) & (res["x"] <= problema.xu))
+
+
+def test_avaliar_lote_rejeita_sobra_negativa_com_limite_infinito():
+    problema = ProjetoOtimo(**DADOS, n_checagens=1, limite_rejeicao=np.inf)
+    x = np.array([
+                    [59.0, 20.0, 20.0, 0.01, 100.0],    # 16 longarinas de 59 cm não cabem na pista (sobra < 0)
+                    [40.0, 20.0, 20.0, 100.0, 100.0],
+                ])
+    f, g = problema.avaliar_lote(x)
+
+    assert np.isposinf(g[0, 4])
+    assert f[0, 1] == 0.0 and np.all(np.isposinf(g[0, :4]))
+    assert f[1, 1] != 0.0
+
+
+def test_apertar_limites_nao_corta_projetos_viaveis():
+    problema = ProjetoOtimo(**DADOS, n_checagens=1)
+    xl_original = problema.xl.copy()
+    relatorio = problema.apertar_limites()
+
+    # Sem aplicar=True o problema não muda
+    assert np.array_equal(problema.xl, xl_original)
+    assert not any(relatorio[k]["inviavel"] for k in ("d [cm]", "bw [cm]", "h [cm]"))
+
+    candidatos = problema.projeto_minimo_viavel()["candidatos_x"]
+    assert len(candidatos) > 0
+    assert np.all(candidatos[:, :3] >= relatorio["xl"][:3])
+
+    problema.apertar_limites(aplicar=True)
+    assert np.array_equal(problema.xl, relatorio["xl"])
+
+
+def test_gradientes_diferencas_finitas():
+    problema = ProjetoOtimo(**DADOS, n_checagens=5, estatistica_robustez="quantil")
+    rng = np.random.default_rng(1)
+    x = problema.xl + (problema.xu - problema.xl) * rng.random((50, 5))
+    f1, g, df1, dg = problema.gradientes(x)
+
+    f_lote, g_lote = problema.avaliar_lote(x)
+    finitos = np.isfinite(g)
+    assert np.allclose(f1, f_lote[:, 0])
+    assert np.allclose(g[finitos], g_lote[finitos])
+
+    # Diferenças centrais longe dos saltos dos números de peças (espaçamentos aleatórios)
+    passo = 1e-6
+    for j in range(5):
+        dx = np.zeros(5)
+        dx[j] = passo
+        f_mais, g_mais, _, _ = problema.gradientes(x + dx)
+        f_menos, g_menos, _, _ = problema.gradientes(x - dx)
+        ok = finitos & np.isfinite(g_mais) & np.isfinite(g_menos)
+        dg_num = (g_mais - g_menos) / (2 * passo)
+        assert np.allclose((f_mais - f_menos) / (2 * passo), df1[:, j], rtol=1e-6, atol=1e-8)
+        assert np.allclose(dg_num[ok], dg[:, :, j][ok], rtol=1e-6, atol=1e-6)
+
+
+def test_minimizar_area_slsqp_melhora_projeto_inicial():
+    problema = ProjetoOtimo(**DADOS, n_checagens=1)
+    inicial = problema.projeto_minimo_viavel()
+    res = problema.minimizar_area(inicial["x"], metodo="SLSQP")
+
+    assert res["viavel"]
+    assert res["f"][0] < inicial["f"][0]
+
+
+def test_cache_reaproveita_apenas_projetos_identicos():
+    problema = ProjetoOtimo(**DADOS, n_checagens=1, tamanho_cache=1000)
+    rng = np.random.default_rng(2)
+    x = problema.xl + (problema.xu - problema.xl) * rng.random((20, 5))
+
+    # Repetições no mesmo lote: um representante avaliado, as demais linhas contam como acerto
+    f, g = problema.evaluate(np.vstack([x, x[:5]]), return_values_of=["F", "G"])
+    assert problema.cache_falhas == 20 and problema.cache_acertos == 5
+
+    # Projetos vizinhos não herdam a avaliação de outro projeto
+    x_vizinho = x + 1e-3
+    f_viz, g_viz = problema.evaluate(x_vizinho, return_values_of=["F", "G"])
+    f_ref, g_ref = problema.avaliar_lote(x_vizinho)
+    assert problema.cache_falhas == 40
+    assert np.array_equal(f_viz, f_ref) and np.array_equal(g_viz, g_ref)
+
+
+def test_nsga2_interrompido_sem_projeto_viavel():
+    # Carga de roda que nenhuma longarina dos limites suporta
+    df = chamando_nsga2(*argumentos_nsga2(p_rodak=5000), tolerancia_f=None, callback=lambda progresso: progresso["geracao"] >= 2)
+
+    assert len(df) == 0
+    assert df.attrs["X"].shape == (0, 5)
+    assert df.attrs["geracao_parada"] == 2
+
+
+def test_avaliar_lote_penalidade_nunca_menor_que_violacao():
+    problema = ProjetoOtimo(**DADOS, n_checagens=1, limite_rejeicao=0.0)
+    referencia = ProjetoOtimo(**DADOS, n_checagens=1)
+    rng = np.random.default_rng(3)
+    x = problema.xl + (problema.xu - problema.xl) * rng.random((200, 5))
+
+    f, g = problema.avaliar_lote(x)
+    f_ref, g_ref = referencia.avaliar_lote(x)
+    rejeitados = np.maximum(g_ref[:, 4], g_ref[:, 5]) > 0.0
+
+    assert rejeitados.any() and not rejeitados.all()
+    assert np.all(g[rejeitados, :4] >= g_ref[rejeitados, :4])
+    assert np.array_equal(g[~rejeitados], g_ref[~rejeitados])
+    assert np.array_equal(g[:, 4:], g_ref[:, 4:])
+    assert np.allclose(f[:, 0], f_ref[:, 0])
+
+
+def test_restringir_espaco_vetorizado_igual_ao_escalar():
+    rng = np.random.default_rng(4)
+    n = 2000
+    comp = 900.0
+    esp = rng.uniform(0.0, 300.0, n)
+    largura = rng.uniform(1.0, 500.0, n)       # inclui arranjos com sobra < 0 e com menos de 2 peças
+    esp[:100] = (comp - 5 * largura[:100]) / 4  # número contínuo de peças inteiro (floor = ceil)
+
+    g, n_pecas, _ = restringir_espaco_vetorizado(esp, 30.0, 200.0, comp, largura)
+    escalar = np.array([restringir_espaco(e, 30.0, 200.0, comp, b) for e, b in zip(esp, largura)])
+
+    assert np.array_equal(g, escalar[:, 0])
+    assert np.array_equal(n_pecas, escalar[:, 1])
+
+
+def test_caminho_enxuto_igual_ao_completo():
+    for n_checagens in (1, 5):
+        problema = ProjetoOtimo(**DADOS, n_checagens=n_checagens)
+        rng = np.random.default_rng(5)
+        x = problema.xl + (problema.xu - problema.xl) * rng.random((100, 5))
+        f, g = problema.avaliar_lote(x)
+
+        fatores = problema.fatores_robustez
+        for i, xi in enumerate(x):
+            f_ref, g_ref, *_ = problema.calcular_objetivos_restricoes_otimizacao(*xi, fatores=fatores)
+            f_ref = [np.mean(v) for v in f_ref]
+            g_ref = [np.mean(v) for v in g_ref]
+            assert np.allclose(f[i], f_ref, rtol=1e-12, atol=1e-12)
+            assert np.allclose(g[i], g_ref, rtol=1e-12, atol=1e-12)